@@ -0,0 +1,61 @@
+"""
+Bulk catalog import throughput and peak RSS for CSV and JSONL feeds.
+
+    python -m benchmarks.catalog_import [--rows 200000] [--workers 0,4] [--dir /tmp]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from src.models.product import ProductCategory
+from src.services.catalog_import import import_catalog
+from src.services.inventory import InventoryService
+
+WORDS = ["lamp", "cable", "vintage", "retro", "python", "guide", "desk", "shirt", "rice"]
+
+
+def write_feeds(rows, directory, seed=0):
+    rng = random.Random(seed)
+    categories = [c.value for c in ProductCategory]
+    csv_path = os.path.join(directory, "feed.csv")
+    jsonl_path = os.path.join(directory, "feed.jsonl")
+    with open(csv_path, "w") as csv_file, open(jsonl_path, "w") as jsonl_file:
+        csv_file.write("id,name,price,category,stock,is_active,tags\n")
+        for pid in range(1, rows + 1):
+            name = " ".join(rng.sample(WORDS, 2)).title()
+            price = round(rng.uniform(1, 500), 2)
+            category = rng.choice(categories)
+            stock = rng.randint(0, 200)
+            active = rng.random() > 0.1
+            tags = rng.sample(WORDS, 2)
+            csv_file.write(f"{pid},{name},{price},{category},{stock},{active},{'|'.join(tags)}\n")
+            jsonl_file.write(json.dumps({
+                "id": pid, "name": name, "price": price, "category": category,
+                "stock": stock, "is_active": active, "tags": tags,
+            }) + "\n")
+    return csv_path, jsonl_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--workers", default=f"0,{os.cpu_count() or 1}",
+                        help="comma-separated worker counts (0 parses in-process)")
+    parser.add_argument("--dir", default=None, help="directory for the feeds (default: a temp dir)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        feeds = write_feeds(args.rows, directory)
+        print(f"{'feed':>8}{'workers':>9}{'rows/s':>12}{'peak RSS MB':>13}")
+        for path in feeds:
+            for workers in (int(w) for w in args.workers.split(",")):
+                report = import_catalog(path, InventoryService(), workers=workers)
+                fmt = os.path.splitext(path)[1][1:]
+                print(f"{fmt:>8}{workers:>9}{report.rows_per_second:>12,.0f}"
+                      f"{report.peak_rss_bytes / 2**20:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
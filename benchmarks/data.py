@@ -0,0 +1,83 @@
+"""Seeded synthetic data for the benchmarks."""
+import random
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from src.models.order import Order, OrderItem, OrderStatus
+from src.models.product import Product, ProductCategory
+from src.models.user import AccountStatus, User, UserRole
+
+WORDS = [
+    "cable", "camera", "canvas", "cotton", "classic", "desk", "lamp", "linen",
+    "novel", "organic", "pocket", "python", "retro", "shirt", "smart", "steel",
+    "tea", "travel", "vintage", "wireless", "wool", "coffee", "guide", "mini",
+]
+TAGS = ["tech", "gift", "sale", "eco", "new", "kids", "home", "outdoor", "office", "retro"]
+
+
+def make_catalog(size: int, seed: int = 0) -> List[Product]:
+    rng = random.Random(seed)
+    categories = list(ProductCategory)
+    products = []
+    for pid in range(1, size + 1):
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).title()
+        products.append(Product(
+            id=pid,
+            name=f"{name} {pid}",
+            price=round(rng.uniform(0.5, 800.0), 2),
+            category=rng.choice(categories),
+            stock=rng.choice([0, 1, 3, 8, 15, 40, 120, 500]),
+            is_active=rng.random() > 0.05,
+            tags=rng.sample(TAGS, rng.randint(0, 3)),
+        ))
+    return products
+
+
+def make_users(size: int, seed: int = 0) -> List[User]:
+    """Users spread evenly over every discount tier (including unknown tier 4)."""
+    rng = random.Random(seed)
+    return [
+        User(
+            id=uid,
+            email=f"user{uid}@example.com",
+            name=f"User {uid}",
+            role=rng.choice(list(UserRole)),
+            status=rng.choice(list(AccountStatus)),
+            discount_tier=uid % 5,
+        )
+        for uid in range(1, size + 1)
+    ]
+
+
+def make_carts(
+    count: int, products: List[Product], users: List[User], size: int, seed: int = 0
+) -> List[Tuple[List[Tuple[Product, int]], User]]:
+    rng = random.Random(seed)
+    carts = []
+    for _ in range(count):
+        items = [(rng.choice(products), rng.randint(1, 8)) for _ in range(size)]
+        user = rng.choice(users) if rng.random() < 0.8 else None
+        carts.append((items, user))
+    return carts
+
+
+def make_orders(count: int, products: List[Product], seed: int = 0) -> List[Order]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    statuses = list(OrderStatus)
+    orders = []
+    for oid in range(1, count + 1):
+        items = [
+            OrderItem(product_id=p.id, product_name=p.name,
+                      quantity=rng.randint(1, 4), unit_price=p.price)
+            for p in rng.sample(products, rng.randint(1, min(5, len(products))))
+        ]
+        orders.append(Order(
+            id=oid,
+            user_id=rng.randint(1, 10_000),
+            items=items,
+            status=rng.choice(statuses),
+            created_at=start + timedelta(minutes=rng.randint(0, 525_600)),
+            shipping_address="1 Main Street, Springfield",
+        ))
+    return orders
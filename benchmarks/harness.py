@@ -0,0 +1,66 @@
+"""Timing, allocation and baseline-comparison helpers for the benchmark suite."""
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+
+def measure(fn: Callable[[], object], samples: int = 15, min_sample_time: float = 0.002) -> Dict:
+    """Median and p95 wall time per call plus peak bytes allocated by one call.
+
+    Each sample loops fn enough times to last ``min_sample_time``, with the
+    garbage collector off, so fast calls are not dominated by timer noise.
+    """
+    fn()  # warm caches and lazily built indexes
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_sample_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            times.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    times.sort()
+    return {
+        "median_us": statistics.median(times) * 1e6,
+        "p95_us": times[min(len(times) - 1, round(0.95 * (len(times) - 1)))] * 1e6,
+        "peak_alloc_bytes": peak - baseline,
+        "retained_bytes": current - baseline,
+        "calls": number * samples,
+    }
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = 0.10) -> Dict[str, float]:
+    """Cases whose median got slower than baseline by more than tolerance, with ratios."""
+    regressions = {}
+    for case, result in current["results"].items():
+        base = baseline["results"].get(case)
+        if base is None or base["median_us"] <= 0:
+            continue
+        ratio = result["median_us"] / base["median_us"]
+        if ratio > 1 + tolerance:
+            regressions[case] = ratio
+    return regressions
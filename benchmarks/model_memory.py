@@ -0,0 +1,98 @@
+"""
+Bytes per object for the slotted models versus equivalent __dict__ dataclasses.
+
+    python -m benchmarks.model_memory [--count 1000000]
+"""
+import argparse
+import dataclasses
+import gc
+import tracemalloc
+from datetime import datetime
+
+from src.models.order import Order, OrderItem, OrderStatus
+from src.models.product import Product, ProductCategory
+from src.models.product_table import ProductTable
+from src.models.user import AccountStatus, User
+
+TAG_SETS = [["gadget", "tech"], ["retro"], [], ["programming", "education"]]
+
+
+def unslotted(cls):
+    """A plain (pre-slots) dataclass with the same fields as cls."""
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [
+            (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+            for f in dataclasses.fields(cls)
+        ],
+    )
+
+
+def make_product(cls, i):
+    return cls(
+        id=i, name=f"Product {i % 5000}", price=9.99, category=ProductCategory.BOOKS,
+        stock=i % 100, tags=list(TAG_SETS[i % len(TAG_SETS)]),
+    )
+
+
+def make_user(cls, i):
+    return cls(id=i, email=f"user{i % 5000}@example.com", name="Ada",
+               status=AccountStatus.ACTIVE, discount_tier=i % 4)
+
+
+def make_order_item(cls, i):
+    return cls(product_id=i, product_name=f"Product {i % 5000}", quantity=2, unit_price=9.99)
+
+
+def make_order(cls, i, created=datetime(2024, 1, 1)):
+    return cls(id=i, user_id=i % 5000, status=OrderStatus.CONFIRMED, created_at=created)
+
+
+def bytes_per_object(factory, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_object = (after - before) / count
+    del objects
+    return per_object
+
+
+def table_bytes_per_row(count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = ProductTable()
+    for i in range(count):
+        table.append_row(i, f"Product {i % 5000}", 9.99, ProductCategory.BOOKS,
+                         i % 100, True, TAG_SETS[i % len(TAG_SETS)])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del table
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("Product", Product, make_product),
+        ("User", User, make_user),
+        ("OrderItem", OrderItem, make_order_item),
+        ("Order", Order, make_order),
+    ]
+    print(f"{'model':<12}{'before':>10}{'after':>10}  (bytes/object, {args.count:,} instances)")
+    for name, cls, make in cases:
+        old_cls = unslotted(cls)
+        before = bytes_per_object(lambda i: make(old_cls, i), args.count)
+        after = bytes_per_object(lambda i: make(cls, i), args.count)
+        print(f"{name:<12}{before:>10.1f}{after:>10.1f}")
+    print(f"{'ProductTable':<12}{'':>10}{table_bytes_per_row(args.count):>10.1f}  (per row)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Order report aggregations: per-object Order methods versus OrderAnalytics columns.
+
+    python -m benchmarks.order_analytics [--orders 200000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.data import make_catalog, make_orders
+from src.services.order_analytics import OrderAnalytics
+
+
+def per_object_revenue_by_day(orders):
+    groups = {}
+    for order in orders:
+        day = order.created_at.date() if order.created_at else None
+        groups.setdefault(day, []).append(order.calculate_total())
+    return {day: round(sum(totals), 2) for day, totals in groups.items()}
+
+
+def allocated(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--orders", type=int, default=200000)
+    args = parser.parse_args()
+
+    products = make_catalog(1000)
+    orders, object_bytes = allocated(lambda: make_orders(args.orders, products))
+    analytics, column_bytes = allocated(lambda: OrderAnalytics(orders))
+    print(f"memory: objects {object_bytes / 2**20:.1f} MB, "
+          f"columns {column_bytes / 2**20:.1f} MB ({column_bytes / object_bytes:.0%})")
+
+    expected, object_time = timed(lambda: per_object_revenue_by_day(orders))
+    analytics = OrderAnalytics(orders)
+    first, first_time = timed(analytics.revenue_by_day)
+    again, again_time = timed(analytics.revenue_by_status)
+    assert first == expected
+    print(f"revenue_by_day: objects {object_time * 1e3:.0f} ms, "
+          f"columns {first_time * 1e3:.0f} ms (incl. totals), "
+          f"revenue_by_status on cached totals {again_time * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Throughput of ShardedInventory by shard count, against one in-process InventoryService.
+
+    python -m benchmarks.sharded_inventory [--products 50000] [--shards 1,2,4] [--seconds 2]
+"""
+import argparse
+import itertools
+import os
+import threading
+import time
+
+from benchmarks.data import make_catalog
+from src.services.inventory import InventoryService
+from src.services.sharded_inventory import ShardedInventory
+
+QUERIES = ["ca", "lamp", "vintage", "retro", "python guide", "zz"]
+
+
+def rate(fn, seconds, threads=1):
+    """Calls per second of fn, spread over client threads."""
+    counts = [0] * threads
+    stop = time.perf_counter() + seconds
+
+    def worker(slot):
+        while time.perf_counter() < stop:
+            fn()
+            counts[slot] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def measure(inventory, ids, seconds, threads):
+    queries = itertools.cycle(QUERIES)
+    id_cycle = itertools.cycle(ids)
+    search = rate(lambda: inventory.search_products(next(queries)), seconds)
+    low_stock = rate(lambda: inventory.get_low_stock_products(5), seconds)
+    point = rate(lambda: inventory.check_availability(next(id_cycle), 1), seconds, threads)
+    return search, low_stock, point
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=50000)
+    parser.add_argument("--shards", default=",".join(
+        str(n) for n in (1, 2, 4, 8) if n <= max(1, os.cpu_count() or 1) * 2
+    ))
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=8, help="client threads for point reads")
+    args = parser.parse_args()
+
+    products = make_catalog(args.products, seed=1)
+    ids = [p.id for p in products[::97]]
+    print(f"{'inventory':>12}{'search/s':>11}{'low-stock/s':>13}{'point/s':>10}")
+
+    single = InventoryService()
+    for p in products:
+        single.add_product(p)
+    search, low_stock, point = measure(single, ids, args.seconds, args.threads)
+    print(f"{'in-process':>12}{search:>11,.1f}{low_stock:>13,.1f}{point:>10,.0f}")
+
+    for shards in (int(n) for n in args.shards.split(",")):
+        with ShardedInventory(shards=shards) as sharded:
+            sharded.add_products(products)
+            search, low_stock, point = measure(sharded, ids, args.seconds, args.threads)
+        print(f"{f'{shards} shards':>12}{search:>11,.1f}{low_stock:>13,.1f}{point:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Contention on SharedStock: worker processes reserving and restocking the same products.
+
+    python -m benchmarks.shared_stock [--products 10000] [--hot 16] [--workers 1,2,4] [--seconds 2]
+
+Each worker goes through InventoryService.reserve_stock and restock on a
+small set of hot products (plus one catalog-wide product in ten), the
+pattern that oversells when every process keeps its own stock. After each
+run the benchmark checks that no unit was lost or created.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from benchmarks.data import make_catalog
+from src.services.inventory import InventoryService
+
+
+def _worker(inventory, ids, hot, seconds, seed, counts, slot, start):
+    rng = random.Random(seed)
+    done = reserved = 0
+    start.wait()
+    stop = time.perf_counter() + seconds
+    while time.perf_counter() < stop:
+        for _ in range(100):
+            pid = rng.choice(ids) if rng.random() < 0.1 else rng.choice(hot)
+            if inventory.reserve_stock(pid, 1):
+                inventory.restock(pid, 1)
+                reserved += 1
+            done += 1
+    counts[2 * slot] = done
+    counts[2 * slot + 1] = reserved
+
+
+def run(products, hot_count, workers, stripes, seconds):
+    """(operations per second, reservations per second, counts intact)."""
+    inventory = InventoryService()
+    inventory.add_products(products)
+    stock = inventory.share_stock(stripes=stripes)
+    before = stock.levels()
+    ids = [p.id for p in products]
+    hot = ids[:hot_count]
+    counts = multiprocessing.Array("q", 2 * workers, lock=False)
+    start = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(
+            target=_worker, args=(inventory, ids, hot, seconds, i, counts, i, start)
+        )
+        for i in range(workers)
+    ]
+    for p in processes:
+        p.start()
+    began = time.perf_counter()
+    start.set()
+    for p in processes:
+        p.join()
+    elapsed = time.perf_counter() - began
+    intact = stock.levels() == before
+    stock.close()
+    stock.unlink()
+    return sum(counts[0::2]) / elapsed, sum(counts[1::2]) / elapsed, intact
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--hot", type=int, default=16)
+    parser.add_argument("--workers", default=",".join(
+        str(n) for n in (1, 2, 4, 8) if n <= max(1, os.cpu_count() or 1) * 2
+    ))
+    parser.add_argument("--stripes", default="1,64")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    products = make_catalog(args.products, seed=1)
+    for p in products:
+        p.is_active = True
+        p.stock = max(p.stock, 50)
+    print(f"{'workers':>8}{'stripes':>9}{'ops/s':>12}{'reserved/s':>12}{'intact':>8}")
+    for workers in (int(n) for n in args.workers.split(",")):
+        for stripes in (int(n) for n in args.stripes.split(",")):
+            ops, reserved, intact = run(products, args.hot, workers, stripes, args.seconds)
+            print(f"{workers:>8}{stripes:>9}{ops:>12,.0f}{reserved:>12,.0f}{str(intact):>8}")
+
+
+if __name__ == "__main__":
+    main()
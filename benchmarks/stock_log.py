@@ -0,0 +1,61 @@
+"""
+Durable stock mutations per second at several group-commit windows.
+
+    python -m benchmarks.stock_log [--threads 16] [--mutations 200] [--dir /tmp]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+
+WINDOWS = (0.0, 0.0005, 0.002, 0.01)
+
+
+def run(window, threads, mutations, directory):
+    service = InventoryService()
+    for pid in range(threads):
+        service.add_product(Product(id=pid, name=f"Item {pid}", price=1.0,
+                                    category=ProductCategory.FOOD, stock=0))
+    path = os.path.join(directory, f"stock-{window}.log")
+    service.open_stock_log(path, commit_window=window)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(pid):
+        barrier.wait()
+        for _ in range(mutations):
+            service.restock(pid, 1)
+
+    workers = [threading.Thread(target=worker, args=(pid,)) for pid in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    log = service._stock_log
+    log.close()
+    os.remove(path)
+    return threads * mutations / elapsed, log.commits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--mutations", type=int, default=200)
+    parser.add_argument("--dir", default=None, help="directory for the log (default: a temp dir)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        print(f"{'window (ms)':>12}{'mutations/s':>14}{'fsyncs':>10}")
+        for window in WINDOWS:
+            rate, commits = run(window, args.threads, args.mutations, directory)
+            print(f"{window * 1000:>12.1f}{rate:>14,.0f}{commits:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark suite for the public hot paths.
+
+    python -m benchmarks.suite --sizes 1000,100000 --output bench.json
+    python -m benchmarks.suite --compare bench.json --tolerance 0.15
+
+Results are keyed "case@catalog_size" ("case@-" when the catalog does not
+matter). With --compare, cases whose median slowed down by more than the
+tolerance are listed and the exit status is 1.
+"""
+import argparse
+import io
+import itertools
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Tuple
+
+from benchmarks.data import make_carts, make_catalog, make_orders, make_users
+from benchmarks.harness import compare, measure
+from src.api import routes
+from src.api.response_cache import ResponseCache
+from src.api.serialization import JSONFragments
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+from src.services.pricing import PricingService
+from src.utils import formatters, validators
+
+QUERIES = ["ca", "lamp", "vintage", "retro", "python guide", "zz"]
+CART_SIZES = (1, 10, 50)
+
+Case = Tuple[str, Callable[[], object]]
+
+
+def catalog_cases(size: int) -> Iterator[Case]:
+    products = make_catalog(size, seed=size)
+    users = make_users(100)
+    inventory = InventoryService()
+    indexed = InventoryService(search_index=True)
+    for p in products:
+        inventory.add_product(p)
+    for p in make_catalog(size, seed=size):
+        indexed.add_product(p)
+    cached = InventoryService(search_cache_size=len(QUERIES))
+    for p in products:
+        cached.add_product(p)
+    for query in QUERIES:  # measure the steady state, not the first misses
+        cached.search_products(query)
+    pricing = PricingService()
+    ids = itertools.cycle([p.id for p in products[:: max(1, size // 1000)]])
+    queries = itertools.cycle(QUERIES)
+    sellable = [p for p in products if p.is_active and p.stock >= 8]
+    in_stock = sellable[0]
+
+    yield "inventory.get_product", lambda: inventory.get_product(next(ids))
+    yield "inventory.check_availability", lambda: inventory.check_availability(next(ids), 2)
+    yield "inventory.reserve_restock", lambda: (
+        inventory.reserve_stock(in_stock.id, 1), inventory.restock(in_stock.id, 1)
+    )
+    yield "inventory.get_low_stock_products", lambda: inventory.get_low_stock_products(10)
+    yield "inventory.search_products[scan]", lambda: inventory.search_products(next(queries))
+    yield "inventory.search_products[index]", lambda: indexed.search_products(next(queries))
+    yield "inventory.ranked_search[k=10]", lambda: inventory.ranked_search(next(queries), 10)
+    yield "inventory.search_products[cached]", lambda: cached.search_products(next(queries))
+    yield "routes.get_product_detail", lambda: routes.get_product_detail(next(ids), inventory)
+    grid = [next(ids) for _ in range(100)]
+    yield "routes.get_product_detail[100 loop]", lambda: [
+        routes.get_product_detail(pid, inventory) for pid in grid
+    ]
+    yield "routes.get_product_details[100]", lambda: routes.get_product_details(grid, inventory)
+    detail_cache = ResponseCache(max_entries=2048)
+    yield "routes.get_product_detail[cached]", lambda: routes.get_product_detail(
+        next(ids), inventory, detail_cache
+    )
+    yield "routes.search_products", lambda: routes.search_products(next(queries), inventory)
+    fragments = JSONFragments()
+    yield "routes.get_product_detail[json.dumps]", lambda: json.dumps(
+        routes.get_product_detail(next(ids), inventory)
+    ).encode()
+    yield "routes.get_product_detail_json", lambda: routes.get_product_detail_json(
+        next(ids), inventory, fragments
+    )
+    yield "routes.search_products[json.dumps]", lambda: json.dumps(
+        routes.search_products(next(queries), indexed)
+    ).encode()
+    indexed_fragments = JSONFragments()
+    yield "routes.search_products_json", lambda: routes.search_products_json(
+        next(queries), indexed, indexed_fragments
+    )
+    yield "routes.search_products[page=20]", lambda: routes.search_products(
+        next(queries), inventory, limit=20
+    )
+    for cart_size in CART_SIZES:
+        carts = make_carts(64, sellable, users, cart_size, seed=cart_size)
+        cart_cycle = itertools.cycle(carts)
+        requests = itertools.cycle([
+            ([{"product_id": p.id, "quantity": qty} for p, qty in items], user)
+            for items, user in carts
+        ])
+        yield (f"routes.calculate_cart[{cart_size}]",
+               lambda r=requests: _post_cart(next(r), inventory))
+        yield (f"pricing.calculate_cart_total[{cart_size}]",
+               lambda c=cart_cycle: pricing.calculate_cart_total(*next(c)))
+    batch = make_carts(1000, products, users, 5)
+    yield "pricing.calculate_cart_total[1000x5 loop]", lambda: [
+        pricing.calculate_cart_total(items, user) for items, user in batch
+    ]
+    yield "pricing.calculate_cart_totals[1000x5]", lambda: pricing.calculate_cart_totals(batch)
+
+
+def _post_cart(request, inventory):
+    items, user = request
+    return routes.calculate_cart(items, inventory, user)
+
+
+def standalone_cases() -> Iterator[Case]:
+    pricing = PricingService()
+    users = make_users(10)
+    product = Product(id=1, name="Widget", price=19.99, category=ProductCategory.BOOKS, stock=9)
+    orders = make_orders(256, make_catalog(100))
+    order_cycle = itertools.cycle(orders)
+    when = datetime(2024, 3, 15, 14, 30)
+
+    yield "pricing.calculate_item_price", lambda: pricing.calculate_item_price(product, 6, users[3])
+    yield "models.Product", lambda: Product(
+        id=1, name="Widget", price=19.99, category=ProductCategory.BOOKS, stock=9
+    )
+    yield "models.Order.calculate_total", lambda: next(order_cycle).calculate_total()
+    yield "validators.validate_email", lambda: validators.validate_email("someone@example.com")
+    yield "validators.validate_password", lambda: validators.validate_password("Secr3tPassw0rd")
+    yield "validators.validate_shipping_address", lambda: validators.validate_shipping_address(
+        "1 Main Street, Springfield"
+    )
+    emails = [u.email for u in make_users(1000)] + ["not-an-email", ""] * 10
+    passwords = ["Secr3tPassw0rd", "short", "nouppercase1", "NoDigitsHere"] * 250
+    yield "validators.validate_email[1000 loop]", lambda: [
+        validators.validate_email(e) for e in emails
+    ]
+    yield "validators.validate_emails[1000]", lambda: list(validators.validate_emails(emails))
+    yield "validators.validate_password[1000 loop]", lambda: [
+        validators.validate_password(p) for p in passwords
+    ]
+    yield "validators.validate_passwords[1000]", lambda: list(
+        validators.validate_passwords(passwords)
+    )
+    yield "formatters.format_currency", lambda: formatters.format_currency(1234567.891)
+    yield "formatters.format_date", lambda: formatters.format_date(when)
+    yield "formatters.format_datetime", lambda: formatters.format_datetime(when)
+    yield "formatters.format_order_summary", lambda: formatters.format_order_summary(
+        42, 3, 99.5, "shipped"
+    )
+    history = [o.created_at for o in orders] * 4
+    summaries = [
+        (o.id, len(o.items), o.calculate_total(), o.status.value) for o in orders
+    ] * 4
+    yield "formatters.format_datetime[1024 loop]", lambda: [
+        formatters.format_datetime(dt) for dt in history
+    ]
+    yield "formatters.format_datetimes[1024]", lambda: formatters.format_datetimes(history)
+    yield "formatters.format_order_summary[1024 loop]", lambda: [
+        formatters.format_order_summary(*row) for row in summaries
+    ]
+    yield "formatters.write_order_summaries[1024]", lambda: formatters.write_order_summaries(
+        io.StringIO(), summaries
+    )
+
+
+def run(sizes, pattern: str, samples: int) -> Dict:
+    results = {}
+
+    def record(name, size, fn):
+        if pattern and pattern not in name:
+            return
+        key = f"{name}@{size}"
+        results[key] = measure(fn, samples=samples)
+        r = results[key]
+        print(f"{key:<52}{r['median_us']:>12.2f}{r['p95_us']:>12.2f}{r['peak_alloc_bytes']:>12}",
+              file=sys.stderr)
+
+    print(f"{'case':<52}{'median us':>12}{'p95 us':>12}{'peak B':>12}", file=sys.stderr)
+    for name, fn in standalone_cases():
+        record(name, "-", fn)
+    for size in sizes:
+        for name, fn in catalog_cases(size):
+            record(name, size, fn)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": list(sizes),
+            "samples": samples,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the public hot paths.")
+    parser.add_argument("--sizes", default="1000,10000",
+                        help="comma-separated catalog sizes (e.g. 1000,100000,1000000)")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--samples", type=int, default=15)
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed median slowdown before flagging, as a fraction")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    current = run(sizes, args.filter, args.samples)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(current, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.tolerance)
+        for case, ratio in sorted(regressions.items()):
+            print(f"REGRESSION {case}: {ratio:.2f}x baseline median")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
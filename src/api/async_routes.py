@@ -0,0 +1,77 @@
+"""
+Asyncio variants of the route handlers in src.api.routes.
+
+The inventory may be a plain InventoryService or a backend whose methods
+return awaitables; responses are identical to the sync handlers.
+"""
+import asyncio
+import inspect
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Tuple, Union
+
+from src.api.routes import build_product_detail, build_search_results
+from src.models.product import Product
+from src.models.user import User
+from src.services.pricing import PricingService
+
+# Carts smaller than this are priced inline; the executor hop costs more.
+PRICING_OFFLOAD_MIN_LINES = 32
+
+
+async def _call(method, *args):
+    result = method(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def get_product_detail(product_id: int, inventory) -> Dict[str, Any]:
+    """GET /api/products/{id}"""
+    return build_product_detail(await _call(inventory.get_product, product_id))
+
+
+async def search_products(query: str, inventory) -> Dict[str, Any]:
+    """GET /api/products/search?q={query}"""
+    if not query or len(query) < 2:
+        return {"status": 400, "error": "Query must be at least 2 characters"}
+
+    return build_search_results(await _call(inventory.search_products, query))
+
+
+async def _resolve_line(
+    item: dict, inventory
+) -> Union[Tuple[Product, int], Dict[str, Any]]:
+    product = await _call(inventory.get_product, item["product_id"])
+    if not product:
+        return {"status": 400, "error": f"Product {item['product_id']} not found"}
+    if not await _call(inventory.check_availability, product.id, item["quantity"]):
+        return {"status": 400, "error": f"Insufficient stock for {product.name}"}
+    return product, item["quantity"]
+
+
+async def calculate_cart(
+    items: list,
+    inventory,
+    user: Optional[User] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """POST /api/cart/calculate
+
+    All lines are resolved concurrently; the first failing line in request
+    order decides the error, as in the sync handler. Large carts are priced
+    in ``executor`` (the loop's default when None).
+    """
+    lines = await asyncio.gather(*(_resolve_line(item, inventory) for item in items))
+    for line in lines:
+        if isinstance(line, dict):
+            return line
+
+    pricing = PricingService()
+    if len(lines) >= PRICING_OFFLOAD_MIN_LINES:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            executor, pricing.calculate_cart_total, lines, user
+        )
+    else:
+        result = pricing.calculate_cart_total(lines, user)
+    return {"status": 200, "data": result}
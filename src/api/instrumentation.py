@@ -0,0 +1,151 @@
+"""
+Opt-in latency and status instrumentation for the route handlers.
+
+Instrumentation.enable() swaps timing wrappers into src.api.routes (and,
+with services=True, onto the InventoryService and PricingService methods the
+handlers call); disable() puts the originals back, so there is no cost at all
+while it is off. Callers must look handlers up through the module
+(``routes.get_product_detail``) for the wrappers to take effect.
+
+Only one Instrumentation can be enabled at a time; enabling a second one
+raises RuntimeError until the first is disabled.
+"""
+import functools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.api import routes
+from src.services.inventory import InventoryService
+from src.services.pricing import PricingService
+from src.utils.metrics import MetricsRegistry
+
+ROUTE_HANDLERS = (
+    "get_product_detail", "get_product_details", "search_products", "calculate_cart",
+)
+SERVICE_METHODS = (
+    (InventoryService, ("get_product", "check_availability", "search_products")),
+    (PricingService, ("calculate_item_price", "calculate_cart_total")),
+)
+
+# The patched functions are process-wide, so which instance owns them is too.
+_active: Optional["Instrumentation"] = None
+_active_lock = threading.Lock()
+
+
+class Instrumentation:
+    def __init__(self, registry: Optional[MetricsRegistry] = None, services: bool = False):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.services = services
+        self._originals: List[Tuple[object, str, Callable]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self) -> "Instrumentation":
+        global _active
+        with _active_lock:
+            if _active is self:
+                return self
+            if _active is not None:
+                raise RuntimeError("Another Instrumentation is already enabled")
+            _active = self
+            self._install()
+        return self
+
+    def _install(self) -> None:
+        for name in ROUTE_HANDLERS:
+            self._patch(routes, name, self._wrap_route(name, getattr(routes, name)))
+        if self.services:
+            for cls, methods in SERVICE_METHODS:
+                for name in methods:
+                    stage = f"{cls.__name__}.{name}"
+                    self._patch(cls, name, self._wrap_stage(stage, getattr(cls, name)))
+
+    def disable(self) -> None:
+        global _active
+        with _active_lock:
+            if _active is not self:
+                return
+            while self._originals:
+                owner, name, original = self._originals.pop()
+                setattr(owner, name, original)
+            _active = None
+
+    def __enter__(self) -> "Instrumentation":
+        return self.enable()
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def _patch(self, owner, name: str, wrapper: Callable) -> None:
+        self._originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, wrapper)
+
+    def _wrap_route(self, handler: str, fn: Callable) -> Callable:
+        histogram = self.registry.histogram(
+            "route_latency_seconds", "Route handler latency.", handler=handler
+        )
+        statuses = self.registry.counters.setdefault("route_requests_total", {})
+        status_keys: Dict[object, tuple] = {}
+        counts, sub_bits = histogram.counts, histogram.sub_bits
+        clock = time.perf_counter_ns
+
+        def status_key(status) -> tuple:
+            key = status_keys[status] = (("handler", handler), ("status", str(status)))
+            return key
+
+        # The bucket arithmetic of LatencyHistogram.record is inlined here to
+        # keep the per-call overhead down.
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                response = fn(*args, **kwargs)
+            except BaseException:
+                histogram.record(clock() - start)
+                key = status_keys.get("exception") or status_key("exception")
+                statuses[key] = statuses.get(key, 0) + 1
+                raise
+            elapsed = clock() - start
+            shift = elapsed.bit_length() - sub_bits - 1
+            if shift < 0:
+                shift = 0
+            counts[(shift << sub_bits) + (elapsed >> shift)] += 1
+            histogram.total += elapsed
+            status = response.get("status")
+            key = status_keys.get(status) or status_key(status)
+            statuses[key] = statuses.get(key, 0) + 1
+            return response
+
+        return wrapper
+
+    def _wrap_stage(self, stage: str, fn: Callable) -> Callable:
+        histogram = self.registry.histogram(
+            "stage_latency_seconds", "Latency of service calls made by the handlers.",
+            stage=stage,
+        )
+        errors = self.registry.counters.setdefault("stage_errors_total", {})
+        error_key = (("stage", stage),)
+        counts, sub_bits = histogram.counts, histogram.sub_bits
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                histogram.record(clock() - start)
+                errors[error_key] = errors.get(error_key, 0) + 1
+                raise
+            elapsed = clock() - start
+            shift = elapsed.bit_length() - sub_bits - 1
+            if shift < 0:
+                shift = 0
+            counts[(shift << sub_bits) + (elapsed >> shift)] += 1
+            histogram.total += elapsed
+            return result
+
+        return wrapper
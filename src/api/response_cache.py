@@ -0,0 +1,89 @@
+"""
+LRU/TTL cache for route responses that depend on a single product.
+
+Entries are stored with the product's version from
+InventoryService.product_version. Every change to a product bumps that
+version, so an entry is only served while the product is exactly as it was
+when the response was built; ``ttl`` additionally bounds how long any entry
+lives. Cached responses are shared between callers and must not be mutated.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """At most ``max_entries`` responses, least recently used evicted first.
+
+    Lookups take no lock (single OrderedDict operations are atomic), so the
+    statistics are approximate under concurrent use; puts are serialized.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Any, Tuple[int, float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, version: int) -> Optional[Dict[str, Any]]:
+        """The response stored for key at exactly this version, if still fresh."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            if self.ttl is None or self._clock() < entry[1]:
+                try:
+                    self._entries.move_to_end(key)
+                except KeyError:  # evicted by a concurrent put
+                    pass
+                self.hits += 1
+                return entry[2]
+            self.expirations += 1
+        self.misses += 1
+        return None
+
+    def put(self, key, version: int, response: Dict[str, Any]) -> None:
+        """Store response for key.
+
+        Read ``version`` before building the response, so a change racing
+        with the build can only make the entry look older than it is.
+        """
+        expires = self._clock() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (version, expires, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
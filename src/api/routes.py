@@ -2,38 +2,201 @@
 Simulated API route handlers (no framework dependency).
 Each handler takes a dict request and returns a dict response.
 """
-from typing import Dict, Any, Optional
+from itertools import islice
+from typing import Callable, Dict, Any, Iterable, List, Optional
 from src.models.user import User, UserRole, AccountStatus
 from src.models.product import Product, ProductCategory
 from src.services.pricing import PricingService
 from src.services.inventory import InventoryService
+from src.api.response_cache import ResponseCache
+from src.api.serialization import JSONFragments, encode
 
+MAX_SEARCH_PAGE = 100
+MAX_BATCH_IDS = 200
+# Paginated searches count matches past the page up to this many in total;
+# beyond it "count" is a lower bound and "count_exact" is False.
+SEARCH_COUNT_CAP = 1000
+# Enum.value is a descriptor call; detail payloads read it from here instead.
+_CATEGORY_VALUES = {category: category.value for category in ProductCategory}
 
-def get_product_detail(product_id: int, inventory: InventoryService) -> Dict[str, Any]:
-    """GET /api/products/{id}"""
-    product = inventory.get_product(product_id)
+
+def get_product_detail(
+    product_id: int, inventory: InventoryService, cache: Optional[ResponseCache] = None
+) -> Dict[str, Any]:
+    """GET /api/products/{id}
+
+    With a ``cache`` the response is reused until the product changes.
+    """
+    if cache is None:
+        return build_product_detail(inventory.get_product(product_id))
+    version = inventory.product_version(product_id)
+    response = cache.get(product_id, version)
+    if response is None:
+        response = build_product_detail(inventory.get_product(product_id))
+        cache.put(product_id, version, response)
+    return response
+
+
+def get_product_detail_json(
+    product_id: int, inventory: InventoryService, fragments: JSONFragments
+) -> bytes:
+    """GET /api/products/{id}, as the encoded JSON body."""
+    return fragments.product_detail(inventory.get_product(product_id))
+
+
+def get_product_details(product_ids: List[int], inventory: InventoryService) -> Dict[str, Any]:
+    """GET /api/products?ids={id},{id},...
+
+    One entry per distinct id, in request order, each with its own status:
+    the same "data" as get_product_detail, or a 404 error.
+    """
+    if len(product_ids) > MAX_BATCH_IDS:
+        return {"status": 400, "error": f"At most {MAX_BATCH_IDS} ids per request"}
+
+    entries = [
+        {"id": pid, "status": 200, "data": build_product_data(product)}
+        if product
+        else {"id": pid, "status": 404, "error": "Product not found"}
+        for pid, product in inventory.get_products(product_ids).items()
+    ]
+    return {"status": 200, "data": entries, "count": len(entries)}
+
+
+def build_product_detail(product: Optional[Product]) -> Dict[str, Any]:
+    """Response body for a product lookup (shared by the sync and async handlers)."""
     if not product:
         return {"status": 404, "error": "Product not found"}
 
+    return {"status": 200, "data": build_product_data(product)}
+
+
+def build_product_data(product: Product) -> Dict[str, Any]:
+    """The "data" of a product detail response, shared by the single and batch handlers."""
     return {
-        "status": 200,
-        "data": {
-            "id": product.id,
-            "name": product.name,
-            "price": product.price,
-            "category": product.category.value,
-            "in_stock": product.is_in_stock(),
-            "stock_count": product.stock,
-        },
+        "id": product.id,
+        "name": product.name,
+        "price": product.price,
+        "category": _CATEGORY_VALUES[product.category],
+        "in_stock": product.is_in_stock(),
+        "stock_count": product.stock,
     }
 
 
-def search_products(query: str, inventory: InventoryService) -> Dict[str, Any]:
-    """GET /api/products/search?q={query}"""
+def search_products(
+    query: str,
+    inventory: InventoryService,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    count_cap: int = SEARCH_COUNT_CAP,
+    ranked: bool = False,
+) -> Dict[str, Any]:
+    """GET /api/products/search?q={query}&limit={limit}&cursor={cursor}&ranked={ranked}
+
+    Without ``limit`` every match is returned. With it, one page is returned
+    along with ``next_cursor`` (None on the last page); matches are pulled
+    from InventoryService.iter_search, so only the page is ever held in
+    memory and the scan stops after ``count_cap`` matches.
+
+    With ``ranked`` the matches come most relevant first (see
+    InventoryService.ranked_search). Ranking has to see every match, so
+    the count is always exact; only the top ``cursor + limit`` are kept.
+    """
+    return _search(
+        query, inventory, limit, cursor, count_cap, ranked,
+        build_search_results, build_search_page,
+    )
+
+
+def search_products_json(
+    query: str,
+    inventory: InventoryService,
+    fragments: JSONFragments,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    count_cap: int = SEARCH_COUNT_CAP,
+    ranked: bool = False,
+) -> bytes:
+    """GET /api/products/search, as the encoded JSON body (see search_products)."""
+    body = _search(
+        query, inventory, limit, cursor, count_cap, ranked,
+        fragments.search_results, fragments.search_page,
+    )
+    return encode(body) if isinstance(body, dict) else body
+
+
+def _search(
+    query: str,
+    inventory: InventoryService,
+    limit: Optional[int],
+    cursor: Optional[str],
+    count_cap: int,
+    ranked: bool,
+    build_results: Callable,
+    build_page: Callable,
+):
+    """search_products with the success bodies built by the given builders.
+
+    Error responses are always returned as dicts.
+    """
     if not query or len(query) < 2:
         return {"status": 400, "error": "Query must be at least 2 characters"}
 
-    results = inventory.search_products(query)
+    if limit is None and not ranked:
+        return build_results(inventory.search_products(query))
+    if limit is None:
+        limit = MAX_SEARCH_PAGE
+    if not 1 <= limit <= MAX_SEARCH_PAGE:
+        return {"status": 400, "error": f"limit must be between 1 and {MAX_SEARCH_PAGE}"}
+    if cursor is None:
+        offset = 0
+    elif cursor.isascii() and cursor.isdigit():
+        offset = int(cursor)
+    else:
+        return {"status": 400, "error": "Invalid cursor"}
+
+    if ranked:
+        return _ranked_page(query, inventory, offset, limit, build_page)
+
+    matches = inventory.iter_search(query)
+    skipped = _consume(matches, offset)
+    page = list(islice(matches, limit))
+    returned = skipped + len(page)
+    wanted = max(count_cap - returned, 1)
+    remaining = _consume(matches, wanted)
+    return build_page(
+        page,
+        count=returned + remaining,
+        count_exact=remaining < wanted,
+        next_cursor=str(returned) if remaining else None,
+    )
+
+
+def _ranked_page(
+    query: str, inventory: InventoryService, offset: int, limit: int, build_page: Callable
+):
+    seen = [0]
+
+    def counted(matches):
+        for product in matches:
+            seen[0] += 1
+            yield product
+
+    top = inventory.rank_matches(query, counted(inventory.iter_search(query)), offset + limit)
+    page = top[offset:]
+    end = offset + len(page)
+    return build_page(
+        page, count=seen[0], count_exact=True,
+        next_cursor=str(end) if seen[0] > end else None,
+    )
+
+
+def _consume(iterator: Iterable, n: int) -> int:
+    """Advance iterator by up to n items; return how many there were."""
+    return sum(1 for _ in islice(iterator, n))
+
+
+def build_search_results(results: List[Product]) -> Dict[str, Any]:
+    """Response body for a successful search."""
     return {
         "status": 200,
         "data": [
@@ -44,6 +207,19 @@ def search_products(query: str, inventory: InventoryService) -> Dict[str, Any]:
     }
 
 
+def build_search_page(
+    page: List[Product], count: int, count_exact: bool, next_cursor: Optional[str]
+) -> Dict[str, Any]:
+    """Response body for one page of a paginated search."""
+    return {
+        "status": 200,
+        "data": [{"id": p.id, "name": p.name, "price": p.price} for p in page],
+        "count": count,
+        "count_exact": count_exact,
+        "next_cursor": next_cursor,
+    }
+
+
 def calculate_cart(
     items: list, inventory: InventoryService, user: Optional[User] = None
 ) -> Dict[str, Any]:
@@ -0,0 +1,109 @@
+"""
+JSON encoding of product responses from cached per-product fragments.
+
+The output is byte-for-byte ``json.dumps(response).encode()`` for the dicts
+built in src.api.routes, but each product's stable fields (id, name, price,
+category) are encoded once and reused. Only ``in_stock`` and ``stock_count``
+are formatted per request, and search results are joined from the cached
+item fragments.
+"""
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from src.models.product import Product
+
+_TRUE = b"true"
+_FALSE = b"false"
+
+
+class JSONFragments:
+    """Encoded fragments for up to ``max_entries`` products.
+
+    A fragment is reused while the product's name, price and category are
+    the very same objects it was built from; any reassignment rebuilds it.
+    Stock changes never do, since stock is spliced in at write time.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._entries: Dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, product: Product) -> tuple:
+        entry = self._entries.get(product.id)
+        if (
+            entry is None
+            or entry[0] is not product.name
+            or entry[1] is not product.price
+            or entry[2] is not product.category
+        ):
+            stable = json.dumps({
+                "id": product.id,
+                "name": product.name,
+                "price": product.price,
+            })
+            detail = (
+                b'{"status": 200, "data": '
+                + stable[:-1].encode()
+                + b", "
+                + json.dumps({"category": product.category.value})[1:-1].encode()
+                + b', "in_stock": '
+            )
+            entry = (product.name, product.price, product.category, detail, stable.encode())
+            if product.id not in self._entries and len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[product.id] = entry
+        return entry
+
+    def product_detail(self, product: Optional[Product]) -> bytes:
+        """Encoded routes.build_product_detail(product)."""
+        if not product:
+            return encode({"status": 404, "error": "Product not found"})
+        in_stock = product.is_in_stock()
+        stock = product.stock
+        return b"".join((
+            self._entry(product)[3],
+            _TRUE if in_stock is True else _FALSE if in_stock is False else encode(in_stock),
+            b', "stock_count": ',
+            str(stock).encode() if type(stock) is int else encode(stock),
+            b"}}",
+        ))
+
+    def search_results(self, products: Iterable[Product]) -> bytes:
+        """Encoded routes.build_search_results(products)."""
+        items = [self._entry(p)[4] for p in products]
+        return b"".join((
+            b'{"status": 200, "data": [',
+            b", ".join(items),
+            b'], "count": ',
+            str(len(items)).encode(),
+            b"}",
+        ))
+
+    def search_page(
+        self,
+        page: Iterable[Product],
+        count: int,
+        count_exact: bool,
+        next_cursor: Optional[str],
+    ) -> bytes:
+        """Encoded routes.build_search_page(...)."""
+        items = [self._entry(p)[4] for p in page]
+        return b"".join((
+            b'{"status": 200, "data": [',
+            b", ".join(items),
+            b'], "count": ',
+            str(count).encode(),
+            b', "count_exact": ',
+            _TRUE if count_exact else _FALSE,
+            b', "next_cursor": ',
+            json.dumps(next_cursor).encode(),
+            b"}",
+        ))
+
+
+def encode(value: Any) -> bytes:
+    """Plain encoding, for responses without cached fragments (errors)."""
+    return json.dumps(value).encode()
@@ -12,7 +12,7 @@ class OrderStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     product_id: int
     product_name: str
@@ -24,7 +24,7 @@ class OrderItem:
         return round(self.quantity * self.unit_price, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: int
     user_id: int
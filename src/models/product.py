@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Callable, List, Optional
 from enum import Enum
 
 
@@ -10,8 +10,14 @@ class ProductCategory(Enum):
     BOOKS = "books"
 
 
-@dataclass
-class Product:
+class _Observable:
+    """Holds the change listeners of a slotted model instance."""
+
+    __slots__ = ("_listeners",)
+
+
+@dataclass(slots=True)
+class Product(_Observable):
     id: int
     name: str
     price: float
@@ -20,6 +26,27 @@ class Product:
     is_active: bool = True
     tags: List[str] = field(default_factory=list)
 
+    def __reduce__(self):
+        # Listeners belong to the process that attached them; only the
+        # fields are pickled or copied.
+        return (Product, _field_values(self))
+
+    def add_listener(self, listener: Callable[["Product", str], None]) -> None:
+        """Call listener(product, field_name) after every public field assignment.
+
+        Products without listeners assign fields at plain slot speed; the
+        first listener switches this instance to an observing subclass, and
+        removing the last one switches it back.
+        """
+        self._listeners = getattr(self, "_listeners", ()) + (listener,)
+        self.__class__ = _ObservedProduct
+
+    def remove_listener(self, listener: Callable[["Product", str], None]) -> None:
+        listeners = tuple(l for l in getattr(self, "_listeners", ()) if l != listener)
+        object.__setattr__(self, "_listeners", listeners)
+        if not listeners:
+            object.__setattr__(self, "__class__", Product)
+
     def is_in_stock(self) -> bool:
         return self.stock > 0 and self.is_active
 
@@ -35,3 +62,34 @@ class Product:
             raise ValueError(f"Not enough stock. Available: {self.stock}")
         self.stock -= quantity
         return self.stock
+
+
+class _ObservedProduct(Product):
+    """A Product with listeners attached; see Product.add_listener."""
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        # Constructing from an observed product (dataclasses.replace calls
+        # type(obj)(...)) gives a plain, unobserved Product.
+        return Product(*args, **kwargs)
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            for listener in getattr(self, "_listeners", ()):
+                listener(self, name)
+
+    def __eq__(self, other):
+        if not isinstance(other, Product):
+            return NotImplemented
+        return _field_values(self) == _field_values(other)
+
+    __hash__ = None
+
+
+def _field_values(product: Product) -> tuple:
+    return (
+        product.id, product.name, product.price, product.category,
+        product.stock, product.is_active, product.tags,
+    )
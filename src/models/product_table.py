@@ -0,0 +1,378 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, MutableSequence, Optional, Sequence, Tuple,
+)
+
+from src.models.product import Product, ProductCategory
+
+CATEGORIES: Tuple[ProductCategory, ...] = tuple(ProductCategory)
+CATEGORY_CODES: Dict[ProductCategory, int] = {c: i for i, c in enumerate(CATEGORIES)}
+
+_TAG_POOL: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def check_row(
+    product_id: int, price: float, category: ProductCategory, stock: int, is_active: bool
+) -> None:
+    """Raise ValueError unless the values fit the table's typed columns."""
+    try:
+        array("q", (product_id, stock))
+        array("d", (price,))
+        array("b", (is_active,))
+    except (OverflowError, TypeError) as exc:
+        raise ValueError(f"Product {product_id!r} does not fit the table: {exc}") from None
+    if category not in CATEGORY_CODES:
+        raise ValueError(f"Unknown category {category!r}")
+
+
+def intern_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Return the shared tuple for this tag sequence, with interned strings."""
+    key = tuple(tags)
+    shared = _TAG_POOL.get(key)
+    if shared is None:
+        shared = _TAG_POOL.setdefault(key, tuple(sys.intern(tag) for tag in key))
+    return shared
+
+
+class ProductTable(Mapping):
+    """Columnar product store: one typed array per numeric field.
+
+    Behaves as a ``{product_id: Product}`` mapping. Each row is materialized
+    as a Product view on first access and cached; assignments to a view's
+    fields are written back to the columns, so whole-column operations always
+    see current values. Changing a view's ``id`` is not supported.
+
+    save() writes the table to a fixed-layout binary snapshot and load()
+    maps one back in without copying; see _SnapshotLayout.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.prices = array("d")
+        self.stock = array("q")
+        self.active = array("b")
+        self.category_codes = array("b")
+        self.names: MutableSequence[str] = []
+        self.tags: MutableSequence[Tuple[str, ...]] = []
+        self._rows: Dict[int, int] = {}
+        # Set for snapshot-backed tables: ids sorted, with the row of each.
+        self._sorted_ids: Optional[Sequence[int]] = None
+        self._sorted_rows: Optional[Sequence[int]] = None
+        self._mapped = False
+        self._views: Dict[int, Product] = {}
+        self._listeners: Tuple[Callable[[Product, str], None], ...] = ()
+        self._materialize_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def __contains__(self, product_id) -> bool:
+        return self.row_of(product_id) is not None
+
+    def __getitem__(self, product_id: int) -> Product:
+        view = self._views.get(product_id)
+        if view is None:
+            row = self.row_of(product_id)
+            if row is None:
+                raise KeyError(product_id)
+            with self._materialize_lock:
+                view = self._views.get(product_id)
+                if view is None:
+                    view = self._materialize(row)
+        return view
+
+    def __setitem__(self, product_id: int, product: Product) -> None:
+        """Store product in its row (appending a new one) and adopt it as the view."""
+        row = self.row_of(product_id)
+        if row is None:
+            self.append_row(
+                product_id, product.name, product.price, product.category,
+                product.stock, product.is_active, product.tags,
+            )
+        else:
+            self.check_product(product)
+            self._write_row(row, product)
+        previous = self._views.get(product_id)
+        if previous is not None and previous is not product:
+            previous.remove_listener(self._write_back)
+        if previous is not product:
+            product.add_listener(self._write_back)
+        self._views[product_id] = product
+
+    def append_row(
+        self,
+        product_id: int,
+        name: str,
+        price: float,
+        category: ProductCategory,
+        stock: int = 0,
+        is_active: bool = True,
+        tags: Sequence[str] = (),
+    ) -> int:
+        """Append a row without materializing a Product. Returns the row number.
+
+        The row is recorded only once every column holds it; values a column
+        cannot store raise ValueError and leave the table unchanged.
+        """
+        if product_id in self:
+            raise ValueError(f"Product {product_id} already exists")
+        check_row(product_id, price, category, stock, is_active)
+        if self._mapped:
+            self._copy_out()
+        columns = (
+            (self.ids, product_id),
+            (self.prices, price),
+            (self.stock, stock),
+            (self.active, is_active),
+            (self.category_codes, CATEGORY_CODES[category]),
+            (self.names, name),
+            (self.tags, intern_tags(tags)),
+        )
+        appended = 0
+        try:
+            for column, value in columns:
+                column.append(value)
+                appended += 1
+        except BaseException:
+            for column, _ in columns[:appended]:
+                column.pop()
+            raise
+        row = self._rows[product_id] = len(self.ids) - 1
+        return row
+
+    def check_product(self, product: Product) -> None:
+        """Raise ValueError if product's fields cannot be stored in the columns."""
+        check_row(product.id, product.price, product.category, product.stock, product.is_active)
+
+    def row_of(self, product_id: int) -> Optional[int]:
+        row = self._rows.get(product_id)
+        if row is None and self._sorted_ids is not None:
+            i = bisect_left(self._sorted_ids, product_id)
+            if i < len(self._sorted_ids) and self._sorted_ids[i] == product_id:
+                row = self._sorted_rows[i]
+        return row
+
+    def add_listener(self, listener: Callable[[Product, str], None]) -> None:
+        """Attach listener to every view, already materialized or not."""
+        with self._materialize_lock:
+            self._listeners = self._listeners + (listener,)
+            for product in self._views.values():
+                product.add_listener(listener)
+
+    def _materialize(self, row: int) -> Product:
+        product = Product(
+            id=self.ids[row],
+            name=self.names[row],
+            price=self.prices[row],
+            category=CATEGORIES[self.category_codes[row]],
+            stock=self.stock[row],
+            is_active=bool(self.active[row]),
+            tags=list(self.tags[row]),
+        )
+        product.add_listener(self._write_back)
+        for listener in self._listeners:
+            product.add_listener(listener)
+        self._views[product.id] = product
+        return product
+
+    def _write_row(self, row: int, product: Product) -> None:
+        self.prices[row] = product.price
+        self.stock[row] = product.stock
+        self.active[row] = product.is_active
+        self.category_codes[row] = CATEGORY_CODES[product.category]
+        self.names[row] = product.name
+        self.tags[row] = intern_tags(product.tags)
+
+    def _write_back(self, product: Product, field: str) -> None:
+        row = self.row_of(product.id)
+        if field == "stock":
+            self.stock[row] = product.stock
+        elif field == "price":
+            self.prices[row] = product.price
+        elif field == "is_active":
+            self.active[row] = product.is_active
+        elif field == "category":
+            self.category_codes[row] = CATEGORY_CODES[product.category]
+        elif field == "name":
+            self.names[row] = product.name
+        elif field == "tags":
+            self.tags[row] = intern_tags(product.tags)
+
+    def in_stock(self) -> List[bool]:
+        """Column-wise Product.is_in_stock."""
+        return [s > 0 and a == 1 for s, a in zip(self.stock, self.active)]
+
+    def apply_discount(self, percentage: float) -> array:
+        """Column-wise Product.apply_discount: discounted price for every row."""
+        if percentage < 0 or percentage > 1:
+            raise ValueError("Discount must be between 0 and 1")
+        factor = 1 - percentage
+        return array("d", [round(p * factor, 2) for p in self.prices])
+
+    def save(self, path: str) -> None:
+        """Write the table to path in the snapshot format read by load()."""
+        _SnapshotLayout.write(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ProductTable":
+        """Map a snapshot written by save().
+
+        Columns are views straight into a copy-on-write mmap of the file, so
+        loading does no per-row work and untouched pages stay shared between
+        processes that load the same file. Names and tags are decoded on
+        access. Appending a row copies the columns into ordinary arrays.
+        """
+        return _SnapshotLayout.read(cls(), path)
+
+    def _copy_out(self) -> None:
+        for column in ("ids", "prices", "stock", "active", "category_codes"):
+            view = getattr(self, column)
+            copy = array(view.format)
+            copy.frombytes(view.tobytes())
+            setattr(self, column, copy)
+        for row, product_id in enumerate(self.ids):
+            self._rows[product_id] = row
+        self._sorted_ids = self._sorted_rows = None
+        self._mapped = False
+
+
+class _HeapStrings:
+    """Read-mostly sequence of strings stored in a snapshot's string heap."""
+
+    def __init__(self, offsets: Sequence[int], heap: memoryview):
+        self._offsets = offsets
+        self._heap = heap
+        self._overrides: Dict[int, str] = {}
+        self._appended: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1 + len(self._appended)
+
+    def __getitem__(self, row: int) -> str:
+        stored = len(self._offsets) - 1
+        if row >= stored:
+            return self._appended[row - stored]
+        value = self._overrides.get(row)
+        if value is None:
+            value = str(self._heap[self._offsets[row] : self._offsets[row + 1]], "utf-8")
+        return value
+
+    def __setitem__(self, row: int, value: str) -> None:
+        stored = len(self._offsets) - 1
+        if row >= stored:
+            self._appended[row - stored] = value
+        else:
+            self._overrides[row] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[row] for row in range(len(self)))
+
+    def append(self, value: str) -> None:
+        self._appended.append(value)
+
+    def pop(self) -> str:
+        return self._appended.pop()
+
+
+class _HeapTags(_HeapStrings):
+    """Tag tuples stored as NUL-terminated strings in the string heap."""
+
+    def __getitem__(self, row: int) -> Tuple[str, ...]:
+        value = super().__getitem__(row)
+        if isinstance(value, tuple):
+            return value
+        return intern_tags(value.split("\0")[:-1])
+
+    @staticmethod
+    def encode(tags: Iterable[str]) -> str:
+        return "".join(tag + "\0" for tag in tags)
+
+
+class _SnapshotLayout:
+    """Binary snapshot layout, all little-endian and 8-byte aligned.
+
+    header: magic, version, row count, then (offset, length) of each section
+    sections: ids q, prices d, stock q, active b, category b, name offsets Q,
+    tag offsets Q, sorted ids q, sorted rows q, string heap (UTF-8)
+    """
+
+    MAGIC = b"PTBL"
+    VERSION = 1
+    SECTIONS = (
+        "ids", "prices", "stock", "active", "category_codes",
+        "name_offsets", "tag_offsets", "sorted_ids", "sorted_rows", "heap",
+    )
+    HEADER = struct.Struct("<4sIQ" + "QQ" * len(SECTIONS))
+
+    @classmethod
+    def write(cls, table: ProductTable, path: str) -> None:
+        heap = bytearray()
+        name_offsets = array("Q", [0])
+        tag_offsets = array("Q")
+        for name in table.names:
+            heap += name.encode("utf-8")
+            name_offsets.append(len(heap))
+        tag_offsets.append(len(heap))
+        for tags in table.tags:
+            heap += _HeapTags.encode(tags).encode("utf-8")
+            tag_offsets.append(len(heap))
+        order = sorted(range(len(table.ids)), key=table.ids.__getitem__)
+        payloads = [
+            bytes(array("q", table.ids)),
+            bytes(array("d", table.prices)),
+            bytes(array("q", table.stock)),
+            bytes(array("b", table.active)),
+            bytes(array("b", table.category_codes)),
+            bytes(name_offsets),
+            bytes(tag_offsets),
+            bytes(array("q", [table.ids[row] for row in order])),
+            bytes(array("q", order)),
+            bytes(heap),
+        ]
+        position = cls.HEADER.size
+        extents = []
+        for payload in payloads:
+            position += -position % 8
+            extents.extend((position, len(payload)))
+            position += len(payload)
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(table.ids), *extents))
+            for offset, payload in zip(extents[::2], payloads):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @classmethod
+    def read(cls, table: ProductTable, path: str) -> ProductTable:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, _count, *extents = cls.HEADER.unpack_from(mapped)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path} is not a product table snapshot")
+        buffer = memoryview(mapped)
+        sections = {
+            name: buffer[offset : offset + length]
+            for name, offset, length in zip(cls.SECTIONS, extents[::2], extents[1::2])
+        }
+        table.ids = sections["ids"].cast("q")
+        table.prices = sections["prices"].cast("d")
+        table.stock = sections["stock"].cast("q")
+        table.active = sections["active"].cast("b")
+        table.category_codes = sections["category_codes"].cast("b")
+        table.names = _HeapStrings(sections["name_offsets"].cast("Q"), sections["heap"])
+        table.tags = _HeapTags(sections["tag_offsets"].cast("Q"), sections["heap"])
+        table._sorted_ids = sections["sorted_ids"].cast("q")
+        table._sorted_rows = sections["sorted_rows"].cast("q")
+        table._mapped = True
+        return table
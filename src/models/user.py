@@ -15,7 +15,7 @@ class AccountStatus(Enum):
     PENDING = "pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     email: str
@@ -0,0 +1,239 @@
+"""
+Streaming bulk import of vendor catalog feeds (CSV or JSON Lines).
+
+The feed is read in chunks of ``chunk_rows`` lines. Each chunk is parsed and
+validated, in a process pool when ``workers`` > 1, and the valid rows are
+applied to the inventory with InventoryService.add_products, one chunk at a
+time and in file order. Bad rows are reported and skipped. At most
+``2 * workers`` chunks are in flight, so memory does not grow with the feed.
+
+CSV feeds need a header row with at least id, name, price and category;
+stock, is_active and tags (``|``-separated) are optional. Quoted fields must
+not contain newlines. JSON Lines feeds use the same keys, with tags as a list.
+"""
+import csv
+import json
+import math
+import os
+import resource
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+
+REQUIRED_FIELDS = ("id", "name", "price", "category")
+_CATEGORIES: Dict[str, ProductCategory] = {
+    **{c.name.lower(): c for c in ProductCategory},
+    **{c.value: c for c in ProductCategory},
+}
+_TRUE = frozenset({"1", "true", "yes", "y", "t"})
+_FALSE = frozenset({"0", "false", "no", "n", "f"})
+_INT64_MAX = 2**63 - 1
+
+Row = Tuple[int, str, float, ProductCategory, int, bool, List[str]]
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    imported: int = 0
+    error_count: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    seconds: float = 0.0
+    peak_rss_bytes: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def import_catalog(
+    path: str,
+    inventory: InventoryService,
+    fmt: Optional[str] = None,
+    chunk_rows: int = 20000,
+    workers: Optional[int] = None,
+    max_errors: int = 1000,
+) -> ImportReport:
+    """Import the feed at path into inventory and report on it.
+
+    ``fmt`` is "csv" or "jsonl" (taken from the file extension when None).
+    ``workers`` defaults to the CPU count; 0 or 1 parses in this process.
+    Only the first ``max_errors`` bad rows are kept in the report, but all
+    of them are counted. ``peak_rss_bytes`` is the peak resident size of
+    this process, including anything it held before the import.
+    """
+    fmt = fmt or _format_of(path)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    report = ImportReport()
+    start = time.perf_counter()
+
+    with open(path, newline="", encoding="utf-8") as f:
+        header = None
+        first_line = 1
+        if fmt == "csv":
+            header_line = f.readline()
+            header = next(csv.reader([header_line]), [])
+            missing = [name for name in REQUIRED_FIELDS if name not in header]
+            if missing:
+                raise ValueError(f"CSV header is missing: {', '.join(missing)}")
+            first_line = 2
+        chunks = _chunks(f, chunk_rows, first_line)
+
+        if workers <= 1:
+            for line, lines in chunks:
+                _apply(parse_chunk(fmt, header, line, lines), inventory, report, max_errors)
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                pending: deque = deque()
+                for line, lines in chunks:
+                    pending.append(pool.submit(parse_chunk, fmt, header, line, lines))
+                    if len(pending) >= 2 * workers:
+                        _apply(pending.popleft().result(), inventory, report, max_errors)
+                while pending:
+                    _apply(pending.popleft().result(), inventory, report, max_errors)
+
+    report.seconds = time.perf_counter() - start
+    report.peak_rss_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return report
+
+
+def parse_chunk(
+    fmt: str, header: Optional[List[str]], first_line: int, lines: List[str]
+) -> Tuple[int, List[Row], List[RowError]]:
+    """Parse and validate lines; returns (rows seen, valid rows, errors)."""
+    rows: List[Row] = []
+    errors: List[RowError] = []
+    seen = 0
+    if fmt == "csv":
+        records: Iterable = (
+            dict(zip(header, values)) if values else None for values in csv.reader(lines)
+        )
+    else:
+        records = (_json_record(line) for line in lines)
+    for line, record in enumerate(records, start=first_line):
+        if record is None:  # blank line
+            continue
+        seen += 1
+        try:
+            rows.append(_row(record))
+        except (ValueError, TypeError, KeyError, OverflowError) as exc:
+            errors.append(RowError(line, str(exc)))
+    return seen, rows, errors
+
+
+def _format_of(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the feed format of {path}")
+
+
+def _chunks(f, chunk_rows: int, first_line: int):
+    line = first_line
+    while True:
+        lines = list(islice(f, chunk_rows))
+        if not lines:
+            return
+        yield line, lines
+        line += len(lines)
+
+
+def _json_record(line: str) -> Optional[dict]:
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        return {"_error": f"Invalid JSON: {exc.msg}"}
+    if not isinstance(record, dict):
+        return {"_error": "Expected a JSON object"}
+    return record
+
+
+def _row(record: dict) -> Row:
+    if "_error" in record:
+        raise ValueError(record["_error"])
+    for name in REQUIRED_FIELDS:
+        if record.get(name) in (None, ""):
+            raise ValueError(f"Missing {name}")
+
+    product_id = _int(record["id"])
+    if not 0 < product_id <= _INT64_MAX:
+        raise ValueError(f"Invalid id {record['id']!r}")
+    name = str(record["name"]).strip()
+    if not name:
+        raise ValueError("Missing name")
+    price = float(record["price"])
+    if not 0 <= price < math.inf:
+        raise ValueError(f"Invalid price {record['price']!r}")
+    category = _CATEGORIES.get(str(record["category"]).strip().lower())
+    if category is None:
+        raise ValueError(f"Unknown category {record['category']!r}")
+    stock = record.get("stock")
+    stock = _int(stock) if stock not in (None, "") else 0
+    if not 0 <= stock <= _INT64_MAX:
+        raise ValueError(f"Invalid stock {record['stock']!r}")
+    return (product_id, name, price, category, stock,
+            _bool(record.get("is_active")), _tags(record.get("tags")))
+
+
+def _int(value) -> int:
+    # int() would truncate 1.9 and raise OverflowError on 1e999.
+    if isinstance(value, bool):
+        raise ValueError(f"Expected an integer, got {value!r}")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"Expected an integer, got {value!r}")
+    return int(value)
+
+
+def _bool(value) -> bool:
+    if value is None or value == "":
+        return True
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"Invalid is_active {value!r}")
+
+
+def _tags(value) -> List[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(tag) for tag in value]
+    return [tag.strip() for tag in str(value).split("|") if tag.strip()]
+
+
+def _apply(
+    parsed: Tuple[int, List[Row], List[RowError]],
+    inventory: InventoryService,
+    report: ImportReport,
+    max_errors: int,
+) -> None:
+    seen, rows, errors = parsed
+    inventory.add_products([Product(*row) for row in rows])
+    report.rows += seen
+    report.imported += len(rows)
+    report.error_count += len(errors)
+    room = max_errors - len(report.errors)
+    if room > 0:
+        report.errors.extend(errors[:room])
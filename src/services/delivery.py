@@ -0,0 +1,157 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from email.message import EmailMessage
+from typing import List, Optional, Tuple
+
+from src.services.notification import Notification
+
+_STOP = object()
+
+
+class Transport(ABC):
+    """Delivers batches of notifications. Raise to have the batch retried."""
+
+    @abstractmethod
+    def send_batch(self, notifications: List[Notification]) -> None:
+        ...
+
+
+class LocalSMTPTransport(Transport):
+    """In-process SMTP stand-in that renders messages into an outbox."""
+
+    def __init__(self, sender: str = "no-reply@shop.local"):
+        self.sender = sender
+        self.outbox: List[EmailMessage] = []
+        self.batches = 0
+
+    def send_batch(self, notifications: List[Notification]) -> None:
+        messages = []
+        for notification in notifications:
+            message = EmailMessage()
+            message["From"] = self.sender
+            message["To"] = notification.recipient_email
+            message["Subject"] = notification.subject
+            message.set_content(notification.body)
+            messages.append(message)
+        self.outbox.extend(messages)
+        self.batches += 1
+
+
+class DeliveryPipeline:
+    """Bounded queue drained in batches by background worker threads.
+
+    submit() returns as soon as the notification is queued. When the queue is
+    full it blocks for up to ``enqueue_timeout`` seconds (forever if None) and
+    then raises queue.Full. Failed batches are retried ``max_retries`` times
+    with exponential backoff before their futures fail. Once close() has
+    been called, submit() raises RuntimeError.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        max_queue: int = 10000,
+        workers: int = 1,
+        batch_size: int = 100,
+        max_retries: int = 3,
+        backoff: float = 0.1,
+        enqueue_timeout: Optional[float] = None,
+    ):
+        self.transport = transport
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._run, name=f"delivery-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, notification: Notification) -> "Future[Notification]":
+        if self._closed:
+            raise RuntimeError("Delivery pipeline is closed")
+        future: "Future[Notification]" = Future()
+        self._queue.put((notification, future), timeout=self.enqueue_timeout)
+        return future
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been delivered or failed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Deliver what is queued, then stop the workers."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        # A submit that raced with close() may have queued behind the stops.
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("Delivery pipeline is closed"))
+            self._queue.task_done()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._deliver(batch)
+            except Exception as exc:  # keep the worker alive for later batches
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _deliver(self, batch: List[Tuple[Notification, Future]]) -> None:
+        # Notifications whose futures were cancelled while queued are dropped;
+        # the rest can no longer be cancelled once marked running.
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        notifications = [notification for notification, _ in batch]
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.transport.send_batch(notifications)
+            except Exception as exc:
+                if attempt == self.max_retries:
+                    for _, future in batch:
+                        future.set_exception(exc)
+                    return
+                time.sleep(self.backoff * 2 ** attempt)
+            else:
+                for notification, future in batch:
+                    future.set_result(notification)
+                return
@@ -1,58 +1,571 @@
-from typing import Dict, List, Optional, Tuple
+import heapq
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from src.models.product import Product
+from src.models.product_table import ProductTable
+from src.services.search_index import NGramIndex
+from src.services.shared_stock import SharedStock
+from src.services.stock_index import StockIndex
+from src.services.stock_log import StockLog
+
+_SEARCH_FIELDS = frozenset({"name", "tags", "is_active"})
+_STOCK_FIELDS = frozenset({"stock", "is_active"})
 
 
 class InventoryService:
-    """Manages product inventory."""
+    """Manages product inventory.
+
+    With ``search_index=True`` an n-gram index over names and tags answers
+    search_products instead of a full scan. It follows field assignments on
+    the products, so reassign ``tags`` rather than mutating the list in place.
+
+    Passing a ProductTable as ``products`` keeps the catalog in columnar form;
+    get_product then returns the table's Product view of the row.
+
+    Stock mutations made through the service are guarded by striped
+    per-product locks (``lock_stripes`` of them), so concurrent reservations
+    of different products do not contend and the same product never oversells.
+
+    After open_stock_log every stock change is also written to a write-ahead
+    log. The service's mutating methods return once their records are
+    durable; concurrent callers share one fsync through group commit.
+
+    product_version(id) changes whenever that product is added, replaced or
+    has a field assigned, which lets callers cache anything derived from it.
+    catalog_generation does the same for search results: it changes when a
+    product is added or its name, tags or is_active change, but not on stock
+    changes. With ``search_cache_size`` set, search_products keeps that many
+    recent queries and reuses their results until the generation moves.
+
+    Field assignments are only followed once something depends on them (a
+    built index, the stock log, the search cache or a caller of
+    product_version / catalog_generation); until then products are left
+    unobserved and reservations cost no more than the field writes.
+
+    ranked_search orders matches by relevance: how the query matches the
+    name (exactly, as a prefix, anywhere) or only a tag, scored with
+    ``search_weights``; ties go to in-stock products, then higher stock,
+    then catalog order.
+
+    After share_stock (or attach_shared_stock in a worker), check_availability,
+    reserve_stock, reserve_cart and restock use the SharedStock counters, so
+    prefork workers on one host agree on stock. A product's own ``stock`` is
+    refreshed whenever this process changes it, but may lag changes made by
+    other workers. Products added after sharing keep using their own stock.
+    """
+
+    DEFAULT_SEARCH_WEIGHTS = {"exact": 4.0, "prefix": 3.0, "substring": 2.0, "tag": 1.0}
+
+    def __init__(
+        self,
+        search_index: bool = False,
+        products: Optional[ProductTable] = None,
+        lock_stripes: int = 64,
+        search_cache_size: int = 0,
+        search_weights: Optional[Dict[str, float]] = None,
+    ):
+        self._products: Union[Dict[int, Product], ProductTable] = {}
+        # Secondary indexes are built on first use, which keeps loading a
+        # large snapshot free of per-product work.
+        self._use_search_index = search_index
+        self._search_index: Optional[NGramIndex] = None
+        self._stock_index: Optional[StockIndex] = None
+        self._stripes = [threading.Lock() for _ in range(lock_stripes)]
+        self._index_lock = threading.Lock()
+        self._stock_log: Optional[StockLog] = None
+        self._log_waits = threading.local()
+        self._snapshot_path: Optional[str] = None
+        self._compact_after: Optional[int] = None
+        self._compact_lock = threading.Lock()
+        self._shared_stock: Optional[SharedStock] = None
+        # Versions come from one shared counter, so a version is never reused
+        # for a product even when two changes race to record theirs.
+        self._versions: Dict[int, int] = {}
+        self._version_clock = itertools.count(1)
+        self._generation = 0
+        self._search_cache: "OrderedDict[str, Tuple[int, Tuple[Product, ...]]]" = OrderedDict()
+        self._search_cache_size = search_cache_size
+        self._watching = bool(search_cache_size)
+        self._search_cache_lock = threading.Lock()
+        self.search_cache_hits = 0
+        self.search_cache_misses = 0
+        weights = dict(self.DEFAULT_SEARCH_WEIGHTS)
+        if search_weights:
+            unknown = set(search_weights) - set(weights)
+            if unknown:
+                raise ValueError(f"Unknown search weights: {', '.join(sorted(unknown))}")
+            weights.update(search_weights)
+        self.search_weights = weights
+        if products is not None:
+            self._products = products
+            if self._watching:
+                products.add_listener(self._on_product_change)
+
+    @property
+    def table(self) -> Optional[ProductTable]:
+        """The columnar store backing this inventory, if any."""
+        if isinstance(self._products, ProductTable):
+            return self._products
+        return None
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the catalog to a binary snapshot that load_snapshot can map."""
+        table = self.table
+        if table is None:
+            table = ProductTable()
+            for p in self._products.values():
+                table.append_row(
+                    p.id, p.name, p.price, p.category, p.stock, p.is_active, p.tags
+                )
+        table.save(path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, **kwargs) -> "InventoryService":
+        """Open a snapshot written by save_snapshot.
+
+        The file is memory-mapped rather than read, and products are only
+        materialized when first looked up.
+        """
+        return cls(products=ProductTable.load(path), **kwargs)
+
+    def open_stock_log(
+        self,
+        path: str,
+        commit_window: float = 0.002,
+        snapshot_path: Optional[str] = None,
+        compact_after: Optional[int] = None,
+    ) -> None:
+        """Replay the stock log at path onto the catalog, then keep logging to it.
 
-    def __init__(self):
-        self._products: Dict[int, Product] = {}
+        With ``snapshot_path`` and ``compact_after`` set, the log is folded
+        into that snapshot whenever it holds ``compact_after`` records.
+        """
+        for product_id, stock in StockLog.replay(path).items():
+            product = self.get_product(product_id)
+            if product is not None:
+                product.stock = stock
+        self._stock_log = StockLog(path, commit_window)
+        self._snapshot_path = snapshot_path
+        self._compact_after = compact_after
+        self._watch()
+
+    def compact_stock_log(self, snapshot_path: Optional[str] = None) -> None:
+        """Save a snapshot with every stock change so far, then empty the log."""
+        path = snapshot_path or self._snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path for log compaction")
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            self.save_snapshot(path + ".tmp")
+            os.replace(path + ".tmp", path)
+            self._stock_log.truncate()
+        finally:
+            for lock in reversed(self._stripes):
+                lock.release()
+
+    def share_stock(self, stripes: int = 64, mp_context=None) -> SharedStock:
+        """Move current stock levels into a new SharedStock and use it.
+
+        Call before starting the workers; the caller closes and unlinks it.
+        """
+        table = self.table
+        if table is not None:
+            levels = dict(zip(table.ids, table.stock))
+        else:
+            levels = {pid: p.stock for pid, p in self._products.items()}
+        stock = SharedStock.create(levels, stripes, mp_context)
+        self.attach_shared_stock(stock)
+        return stock
+
+    def attach_shared_stock(self, stock: SharedStock) -> None:
+        self._shared_stock = stock
+
+    @property
+    def shared_stock(self) -> Optional[SharedStock]:
+        return self._shared_stock
+
+    @contextmanager
+    def _logged(self, log: StockLog):
+        """Defer log waits to the end of a mutation, after its locks are released.
+
+        Only entered while a log is open; without one, mutations skip it.
+        """
+        self._log_waits.seq = 0
+        try:
+            yield
+        finally:
+            seq, self._log_waits.seq = self._log_waits.seq, None
+        if seq:
+            log.wait(seq)
+        if self._compact_after and log.records >= self._compact_after:
+            if self._compact_lock.acquire(blocking=False):
+                try:
+                    if log.records >= self._compact_after:
+                        self.compact_stock_log()
+                finally:
+                    self._compact_lock.release()
+
+    def _log_stock(self, product: Product) -> None:
+        seq = self._stock_log.append(product.id, product.stock)
+        if getattr(self._log_waits, "seq", None) is None:
+            self._stock_log.wait(seq)  # changed outside a service method
+        else:
+            self._log_waits.seq = seq
+
+    def _watch(self) -> None:
+        """Start following field assignments on every product."""
+        if not self._watching:
+            with self._index_lock:
+                self._watch_locked()
+
+    def _watch_locked(self) -> None:
+        if self._watching:
+            return
+        products = self._products
+        if isinstance(products, ProductTable):
+            products.add_listener(self._on_product_change)
+        else:
+            for product in products.values():
+                product.add_listener(self._on_product_change)
+        self._watching = True
+
+    def _ensure_stock_index(self) -> StockIndex:
+        if self._stock_index is None:
+            self._watch_locked()
+            # Published before it is filled (readers hold the index lock),
+            # so a change that finds no index is one the fill will see.
+            index = self._stock_index = StockIndex()
+            table = self.table
+            if table is not None:
+                for pid, stock, active in zip(table.ids, table.stock, table.active):
+                    if active:
+                        index.set(pid, stock)
+            else:
+                for p in self._products.values():
+                    if p.is_active:
+                        index.set(p.id, p.stock)
+        return self._stock_index
+
+    def _ensure_search_index(self) -> NGramIndex:
+        if self._search_index is None:
+            self._watch_locked()
+            index = self._search_index = NGramIndex()
+            table = self.table
+            if table is not None:
+                for pid, name, tags, active in zip(
+                    table.ids, table.names, table.tags, table.active
+                ):
+                    index.add(pid, name, tags, bool(active))
+            else:
+                for p in self._products.values():
+                    index.add(p.id, p.name, p.tags, p.is_active)
+        return self._search_index
 
     def add_product(self, product: Product) -> None:
+        with self._index_lock:
+            self._store(product)
+            self._index(product)
+        self._generation = next(self._version_clock)
+
+    def add_products(self, products: Sequence[Product]) -> None:
+        """Add or replace a batch of products in one step.
+
+        Every stripe lock and the index lock are held while the batch is
+        stored and indexed, so reservations, index queries and compaction
+        see either none of the batch or all of it. A table-backed catalog
+        checks the whole batch first: a product its columns cannot store
+        raises ValueError before anything is added.
+        """
+        table = self.table
+        if table is not None:
+            for product in products:
+                table.check_product(product)
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            with self._index_lock:
+                for product in products:
+                    self._store(product)
+                    self._index(product)
+            self._generation = next(self._version_clock)
+        finally:
+            for lock in reversed(self._stripes):
+                lock.release()
+
+    def _store(self, product: Product) -> None:
+        # Called with the index lock held, so _watch sees every product.
+        previous = self._products.get(product.id)
+        if self._watching and previous is not None and previous is not product:
+            previous.remove_listener(self._on_product_change)
         self._products[product.id] = product
+        if self._watching and previous is not product:
+            product.add_listener(self._on_product_change)
+        self._versions[product.id] = next(self._version_clock)
+
+    def _index(self, product: Product) -> None:
+        if self._stock_index is not None:
+            self._index_stock(product)
+        if self._search_index is not None:
+            self._index_for_search(product)
+
+    def _on_product_change(self, product: Product, field: str) -> None:
+        self._versions[product.id] = next(self._version_clock)
+        if self._stock_log is not None and field == "stock":
+            self._log_stock(product)
+        # Only changes that reach a built index take the index lock, so
+        # reservations of unrelated products never serialize on it.
+        stock = self._stock_index is not None and field in _STOCK_FIELDS
+        search = self._search_index is not None and field in _SEARCH_FIELDS
+        if stock or search:
+            with self._index_lock:
+                if stock:
+                    self._index_stock(product)
+                if search:
+                    self._index_for_search(product)
+        # Bumped after the index update, so a search that sees the new
+        # generation also sees the new index.
+        if field in _SEARCH_FIELDS:
+            self._generation = next(self._version_clock)
+
+    def _index_stock(self, product: Product) -> None:
+        if product.is_active:
+            self._stock_index.set(product.id, product.stock)
+        else:
+            self._stock_index.discard(product.id)
+
+    def _index_for_search(self, product: Product) -> None:
+        self._search_index.add(product.id, product.name, product.tags, product.is_active)
+
+    def _stripe_index(self, product_id: int) -> int:
+        return hash(product_id) % len(self._stripes)
 
     def get_product(self, product_id: int) -> Optional[Product]:
         return self._products.get(product_id)
 
+    def get_products(self, product_ids: Iterable[int]) -> Dict[int, Optional[Product]]:
+        """Look up many ids at once: {id: product or None}, deduplicated, in request order."""
+        products = self._products
+        return {pid: products.get(pid) for pid in product_ids}
+
+    def product_version(self, product_id: int) -> int:
+        """Token that changes on every change to the product; 0 if never added."""
+        if not self._watching:
+            self._watch()
+        return self._versions.get(product_id, 0)
+
+    @property
+    def catalog_generation(self) -> int:
+        """Changes whenever search results may have changed."""
+        if not self._watching:
+            self._watch()
+        return self._generation
+
     def check_availability(self, product_id: int, quantity: int) -> bool:
         product = self.get_product(product_id)
         if not product:
             return False
+        shared = self._shared_stock
+        if shared is not None and product_id in shared:
+            stock = shared.get(product_id)
+            return product.is_active and stock > 0 and stock >= quantity
         return product.is_in_stock() and product.stock >= quantity
 
     def reserve_stock(self, product_id: int, quantity: int) -> bool:
         """Reserve stock for an order. Returns True if successful."""
-        product = self.get_product(product_id)
-        if not product or not self.check_availability(product_id, quantity):
-            return False
-        product.reduce_stock(quantity)
-        return True
+        log = self._stock_log
+        if log is not None:
+            with self._logged(log):
+                return self._reserve_stock(product_id, quantity)
+        return self._reserve_stock(product_id, quantity)
+
+    def _reserve_stock(self, product_id: int, quantity: int) -> bool:
+        with self._stripes[self._stripe_index(product_id)]:
+            product = self._products.get(product_id)
+            shared = self._shared_stock
+            if product and shared is not None and product_id in shared:
+                if not product.is_active:
+                    return False
+                remaining = shared.reserve(product_id, quantity)
+                if remaining is None:
+                    return False
+                product.stock = remaining
+                return True
+            if not product or not product.is_in_stock() or product.stock < quantity:
+                return False
+            product.reduce_stock(quantity)
+            return True
+
+    def reserve_cart(self, items: Sequence[Tuple[int, int]]) -> bool:
+        """Reserve every (product_id, quantity) line, or none of them.
+
+        The stripe locks covering the cart are taken in ascending order, so
+        concurrent carts cannot deadlock. Returns True if everything was reserved.
+        """
+        quantities: Dict[int, int] = {}
+        for product_id, quantity in items:
+            quantities[product_id] = quantities.get(product_id, 0) + quantity
+        log = self._stock_log
+        if log is not None:
+            with self._logged(log):
+                return self._reserve_cart(quantities)
+        return self._reserve_cart(quantities)
+
+    def _reserve_cart(self, quantities: Dict[int, int]) -> bool:
+        stripes = sorted({self._stripe_index(pid) for pid in quantities})
+        for index in stripes:
+            self._stripes[index].acquire()
+        try:
+            for product_id, quantity in quantities.items():
+                if not self.check_availability(product_id, quantity):
+                    return False
+            shared = self._shared_stock
+            if shared is not None:
+                in_shared = {pid: q for pid, q in quantities.items() if pid in shared}
+                remaining = shared.reserve_many(in_shared) if in_shared else {}
+                if remaining is None:
+                    return False
+                for product_id, stock in remaining.items():
+                    self._products[product_id].stock = stock
+                quantities = {
+                    pid: q for pid, q in quantities.items() if pid not in in_shared
+                }
+            for product_id, quantity in quantities.items():
+                self._products[product_id].reduce_stock(quantity)
+            return True
+        finally:
+            for index in reversed(stripes):
+                self._stripes[index].release()
 
     def restock(self, product_id: int, quantity: int) -> int:
         """Add stock. Returns new stock level."""
-        product = self.get_product(product_id)
-        if not product:
-            raise ValueError(f"Product {product_id} not found")
-        product.stock += quantity
-        return product.stock
+        log = self._stock_log
+        if log is not None:
+            with self._logged(log):
+                return self._restock(product_id, quantity)
+        return self._restock(product_id, quantity)
+
+    def _restock(self, product_id: int, quantity: int) -> int:
+        with self._stripes[self._stripe_index(product_id)]:
+            product = self._products.get(product_id)
+            if not product:
+                raise ValueError(f"Product {product_id} not found")
+            shared = self._shared_stock
+            if shared is not None and product_id in shared:
+                product.stock = shared.add(product_id, quantity)
+            else:
+                product.stock += quantity
+            return product.stock
 
     def get_low_stock_products(self, threshold: int = 10) -> List[Product]:
-        """Get products with stock below threshold."""
-        return [
-            p
-            for p in self._products.values()
-            if p.is_active and p.stock < threshold
-        ]
+        """Get active products with stock below threshold, lowest stock first."""
+        with self._index_lock:
+            ids = self._ensure_stock_index().below(threshold)
+        return [self._products[pid] for pid in ids]
 
     def search_products(self, query: str) -> List[Product]:
         """Search products by name or tags."""
         query_lower = query.lower()
-        results = []
+        if not self._search_cache_size:
+            return self._search(query_lower)
+
+        generation = self._generation
+        entry = self._search_cache.get(query_lower)
+        if entry is not None and entry[0] == generation:
+            self.search_cache_hits += 1
+            try:
+                self._search_cache.move_to_end(query_lower)
+            except KeyError:  # evicted by a concurrent search
+                pass
+            return list(entry[1])
+        self.search_cache_misses += 1
+        results = self._search(query_lower)
+        with self._search_cache_lock:
+            self._search_cache[query_lower] = (generation, tuple(results))
+            self._search_cache.move_to_end(query_lower)
+            if len(self._search_cache) > self._search_cache_size:
+                self._search_cache.popitem(last=False)
+        return results
+
+    def iter_search(self, query: str) -> Iterator[Product]:
+        """Yield the matches of search_products, in the same order, as they are found.
+
+        A scan stops as soon as the caller stops consuming; the n-gram index
+        and the result cache hand out their match ids one product at a time.
+        """
+        query_lower = query.lower()
+        if self._search_cache_size:
+            entry = self._search_cache.get(query_lower)
+            if entry is not None and entry[0] == self._generation:
+                self.search_cache_hits += 1
+                return iter(entry[1])
+        if self._use_search_index:
+            with self._index_lock:
+                ids = self._ensure_search_index().search(query_lower)
+            if ids is not None:
+                products = self._products
+                return (products[pid] for pid in ids)
+        return self._scan(query_lower)
+
+    def ranked_search(self, query: str, k: int = 10) -> List[Product]:
+        """The k most relevant matches, best first.
+
+        Matches stream from iter_search through a heap of size k, so the full
+        result set is never materialized or sorted.
+        """
+        return self.rank_matches(query, self.iter_search(query), k)
+
+    def rank_matches(self, query: str, matches: Iterable[Product], k: int) -> List[Product]:
+        """The k most relevant of matches (results of iter_search for query)."""
+        query_lower = query.lower()
+        weights = self.search_weights
+        exact, prefix = weights["exact"], weights["prefix"]
+        substring, tag = weights["substring"], weights["tag"]
+
+        def relevance(product: Product) -> Tuple[float, bool, int]:
+            name = product.name.lower()
+            if name == query_lower:
+                score = exact
+            elif name.startswith(query_lower):
+                score = prefix
+            elif query_lower in name:
+                score = substring
+            else:
+                score = tag
+            return score, product.stock > 0, product.stock
+
+        # nlargest keeps equal keys in input order, i.e. catalog order.
+        return heapq.nlargest(k, matches, key=relevance)
+
+    def _search(self, query_lower: str) -> List[Product]:
+        if self._use_search_index:
+            with self._index_lock:
+                ids = self._ensure_search_index().search(query_lower)
+            if ids is not None:
+                return [self._products[pid] for pid in ids]
+        return list(self._scan(query_lower))
+
+    def _scan(self, query_lower: str) -> Iterator[Product]:
+        table = self.table
+        if table is not None:
+            # Match against the columns so only matching rows are materialized.
+            for pid, name, tags, active in zip(
+                table.ids, table.names, table.tags, table.active
+            ):
+                if active and (
+                    query_lower in name.lower()
+                    or any(query_lower in tag.lower() for tag in tags)
+                ):
+                    yield table[pid]
+            return
         for product in self._products.values():
             if not product.is_active:
                 continue
             if query_lower in product.name.lower():
-                results.append(product)
+                yield product
             elif any(query_lower in tag.lower() for tag in product.tags):
-                results.append(product)
-        return results
+                yield product
@@ -1,7 +1,15 @@
-from typing import List, Optional
-from dataclasses import dataclass
+import json
+import threading
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future
+from typing import IO, TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+if TYPE_CHECKING:
+    from src.services.delivery import DeliveryPipeline
+
 
 class NotificationType(Enum):
     ORDER_CONFIRMED = "order_confirmed"
@@ -18,13 +26,184 @@ class Notification:
     subject: str
     body: str
     notification_type: NotificationType
+    delivery: Optional[Future] = field(default=None, repr=False, compare=False)
+
+
+class _Entry:
+    __slots__ = ("notification", "alive")
+
+    def __init__(self, notification: Notification):
+        self.notification = notification
+        self.alive = True
+
+
+class NotificationStore(Sequence):
+    """Retained notifications, indexed by recipient and by type.
+
+    ``max_entries`` bounds the whole store (oldest first out) and
+    ``max_per_recipient`` bounds each recipient's history. Evicted
+    notifications are appended as JSON lines to ``spill_path`` when given.
+    With no limits the store keeps everything.
+
+    It reads like the list it replaces: a sequence of the retained
+    notifications, oldest first, that supports indexing, slicing and
+    comparison with a list. All methods are safe to call from several
+    threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_per_recipient: Optional[int] = None,
+        spill_path: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_per_recipient = max_per_recipient
+        self.spill_path = spill_path
+        self._all: Deque[_Entry] = deque()
+        self._by_recipient: Dict[str, Deque[_Entry]] = {}
+        self._by_type: Dict[NotificationType, Deque[_Entry]] = {}
+        self._live = 0
+        self._spill_file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __iter__(self) -> Iterator[Notification]:
+        """Retained notifications, oldest first."""
+        return iter(self._snapshot())
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self._snapshot()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NotificationStore):
+            other = other._snapshot()
+        if isinstance(other, list):
+            return self._snapshot() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def _snapshot(self) -> List[Notification]:
+        with self._lock:
+            return [e.notification for e in self._all if e.alive]
+
+    def append(self, notification: Notification) -> None:
+        with self._lock:
+            self._append(notification)
+
+    def _append(self, notification: Notification) -> None:
+        entry = _Entry(notification)
+        self._all.append(entry)
+        self._by_type.setdefault(notification.notification_type, deque()).append(entry)
+        history = self._by_recipient.get(notification.recipient_email)
+        if history is None:
+            history = self._by_recipient[notification.recipient_email] = deque()
+        history.append(entry)
+        self._live += 1
+
+        if self.max_per_recipient is not None and len(history) > self.max_per_recipient:
+            self._evict(history.popleft())
+        if self.max_entries is not None:
+            while self._live > self.max_entries:
+                self._evict_oldest()
+        if len(self._all) > 2 * self._live + 64:
+            self._compact()
+
+    def for_recipient(self, email: str) -> List[Notification]:
+        with self._lock:
+            return [e.notification for e in self._by_recipient.get(email, ())]
+
+    def for_type(self, notification_type: NotificationType) -> List[Notification]:
+        with self._lock:
+            return [
+                e.notification
+                for e in self._by_type.get(notification_type, ())
+                if e.alive
+            ]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def _evict_oldest(self) -> None:
+        entry = self._all.popleft()
+        while not entry.alive:
+            entry = self._all.popleft()
+        # The oldest live entry is also the oldest live one in its indexes;
+        # anything ahead of it there is already dead.
+        email = entry.notification.recipient_email
+        history = self._by_recipient[email]
+        history.popleft()
+        if not history:
+            del self._by_recipient[email]
+        notification_type = entry.notification.notification_type
+        same_type = self._by_type[notification_type]
+        while same_type.popleft() is not entry:
+            pass
+        if not same_type:
+            del self._by_type[notification_type]
+        self._evict(entry)
+
+    def _evict(self, entry: _Entry) -> None:
+        entry.alive = False
+        self._live -= 1
+        if self.spill_path is not None:
+            self._spill(entry.notification)
+
+    def _spill(self, notification: Notification) -> None:
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+        self._spill_file.write(
+            json.dumps(
+                {
+                    "recipient_email": notification.recipient_email,
+                    "subject": notification.subject,
+                    "body": notification.body,
+                    "notification_type": notification.notification_type.value,
+                }
+            )
+            + "\n"
+        )
+
+    def _compact(self) -> None:
+        """Drop dead entries left behind by per-recipient evictions (lock held)."""
+        self._all = deque(e for e in self._all if e.alive)
+        for notification_type, entries in list(self._by_type.items()):
+            live = deque(e for e in entries if e.alive)
+            if live:
+                self._by_type[notification_type] = live
+            else:
+                del self._by_type[notification_type]
 
 
 class NotificationService:
-    """Handles sending notifications."""
+    """Handles sending notifications.
+
+    With a DeliveryPipeline the send_* methods only enqueue the message; its
+    ``delivery`` future resolves once the transport has accepted it.
 
-    def __init__(self):
-        self.sent_notifications: List[Notification] = []
+    Sent notifications are kept in a NotificationStore; pass one with limits
+    to bound retention.
+    """
+
+    def __init__(
+        self,
+        pipeline: Optional["DeliveryPipeline"] = None,
+        store: Optional[NotificationStore] = None,
+    ):
+        self.sent_notifications = store if store is not None else NotificationStore()
+        self.pipeline = pipeline
+
+    def _record(self, notification: Notification) -> Notification:
+        if self.pipeline is not None:
+            notification.delivery = self.pipeline.submit(notification)
+        self.sent_notifications.append(notification)
+        return notification
 
     def send_order_confirmation(self, email: str, order_id: int, total: float) -> Notification:
         notification = Notification(
@@ -33,8 +212,7 @@ class NotificationService:
             body=f"Your order #{order_id} has been confirmed. Total: ${total:.2f}",
             notification_type=NotificationType.ORDER_CONFIRMED,
         )
-        self.sent_notifications.append(notification)
-        return notification
+        return self._record(notification)
 
     def send_shipping_notification(
         self, email: str, order_id: int, tracking_number: str
@@ -45,8 +223,7 @@ class NotificationService:
             body=f"Your order #{order_id} has been shipped. Tracking: {tracking_number}",
             notification_type=NotificationType.ORDER_SHIPPED,
         )
-        self.sent_notifications.append(notification)
-        return notification
+        return self._record(notification)
 
     def send_low_stock_alert(
         self, email: str, product_name: str, current_stock: int
@@ -57,8 +234,10 @@ class NotificationService:
             body=f"{product_name} is running low. Current stock: {current_stock}",
             notification_type=NotificationType.LOW_STOCK,
         )
-        self.sent_notifications.append(notification)
-        return notification
+        return self._record(notification)
 
     def get_notifications_for(self, email: str) -> List[Notification]:
-        return [n for n in self.sent_notifications if n.recipient_email == email]
+        return self.sent_notifications.for_recipient(email)
+
+    def get_notifications_by_type(self, notification_type: NotificationType) -> List[Notification]:
+        return self.sent_notifications.for_type(notification_type)
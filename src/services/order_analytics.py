@@ -0,0 +1,161 @@
+"""
+Columnar order history for finance reporting.
+
+OrderAnalytics copies what the reports need out of Order objects into typed
+arrays, one slot per order (plus a flattened item section), and answers
+group-by aggregations with column-wise passes. Every money figure is computed
+with the same rounding steps as Order.subtotal, calculate_tax,
+calculate_shipping and calculate_total, and group sums are added in
+ingestion order, so results equal the per-object computation exactly.
+"""
+from array import array
+from datetime import date, datetime
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from src.models.order import Order, OrderStatus
+
+STATUSES = list(OrderStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_US_PER_DAY = 86_400_000_000
+_NO_TIMESTAMP = -(2 ** 63)
+
+
+class OrderAnalytics:
+    """Orders as columns.
+
+    ``timestamps`` hold created_at as wall-clock microseconds since
+    1970-01-01 (so days group the way ``created_at.date()`` does); items are
+    stored flattened, with order i owning rows ``item_offsets[i]`` to
+    ``item_offsets[i + 1]``. Product names and shipping addresses are not
+    kept.
+    """
+
+    def __init__(self, orders: Iterable[Order] = ()):
+        self.order_ids = array("q")
+        self.user_ids = array("q")
+        self.status_codes = array("b")
+        self.timestamps = array("q")
+        self.item_offsets = array("q", [0])
+        self.item_product_ids = array("q")
+        self.item_quantities = array("q")
+        self.item_prices = array("d")
+        self.subtotals = array("d")
+        self._totals: Dict[float, array] = {}
+        self.extend(orders)
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def add(self, order: Order) -> None:
+        self.extend((order,))
+
+    def extend(self, orders: Iterable[Order]) -> None:
+        for order in orders:
+            self.order_ids.append(order.id)
+            self.user_ids.append(order.user_id)
+            self.status_codes.append(STATUS_CODES[order.status])
+            created = order.created_at
+            if created is None:
+                self.timestamps.append(_NO_TIMESTAMP)
+            else:
+                wall = created.replace(tzinfo=None) - _EPOCH
+                self.timestamps.append(
+                    (wall.days * 86_400 + wall.seconds) * 1_000_000 + wall.microseconds
+                )
+            for item in order.items:
+                self.item_product_ids.append(item.product_id)
+                self.item_quantities.append(item.quantity)
+                self.item_prices.append(item.unit_price)
+            self.item_offsets.append(len(self.item_prices))
+            self.subtotals.append(order.subtotal)
+        self._totals.clear()
+
+    def taxes(self, tax_rate: float = 0.08) -> List[float]:
+        """Column-wise Order.calculate_tax."""
+        return [round(s * tax_rate, 2) for s in self.subtotals]
+
+    def shipping(self) -> List[float]:
+        """Column-wise Order.calculate_shipping."""
+        return [0.0 if s >= 50 else 5.99 for s in self.subtotals]
+
+    def totals(self, tax_rate: float = 0.08) -> array:
+        """Column-wise Order.calculate_total, cached per tax rate."""
+        totals = self._totals.get(tax_rate)
+        if totals is None:
+            totals = self._totals[tax_rate] = array("d", [
+                round(s + round(s * tax_rate, 2) + (0.0 if s >= 50 else 5.99), 2)
+                for s in self.subtotals
+            ])
+        return totals
+
+    def revenue_by_day(self, tax_rate: float = 0.08) -> Dict[Optional[date], float]:
+        """Sum of order totals per created_at date (None for undated orders)."""
+        by_ordinal = _group_sum(self._day_ordinals(), self.totals(tax_rate))
+        return {
+            (date.fromordinal(ordinal) if ordinal is not None else None): revenue
+            for ordinal, revenue in by_ordinal.items()
+        }
+
+    def revenue_by_status(self, tax_rate: float = 0.08) -> Dict[OrderStatus, float]:
+        by_code = _group_sum(self.status_codes, self.totals(tax_rate))
+        return {STATUSES[code]: revenue for code, revenue in by_code.items()}
+
+    def revenue_by_user(self, tax_rate: float = 0.08) -> Dict[int, float]:
+        return _group_sum(self.user_ids, self.totals(tax_rate))
+
+    def status_counts(self) -> Dict[OrderStatus, int]:
+        counts = [0] * len(STATUSES)
+        for code in self.status_codes:
+            counts[code] += 1
+        return {status: counts[code] for code, status in enumerate(STATUSES) if counts[code]}
+
+    def average_order_value(self, tax_rate: float = 0.08) -> float:
+        if not self:
+            return 0.0
+        return sum(self.totals(tax_rate)) / len(self)
+
+    def cancellation_rate(self) -> float:
+        if not self:
+            return 0.0
+        return self.status_codes.count(STATUS_CODES[OrderStatus.CANCELLED]) / len(self)
+
+    def summary(self, tax_rate: float = 0.08) -> Dict[str, float]:
+        """Overall subtotal, tax, shipping and revenue."""
+        return {
+            "orders": len(self),
+            "subtotal": round(sum(self.subtotals), 2),
+            "tax": round(sum(self.taxes(tax_rate)), 2),
+            "shipping": round(sum(self.shipping()), 2),
+            "revenue": round(sum(self.totals(tax_rate)), 2),
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns."""
+        columns = (
+            self.order_ids, self.user_ids, self.status_codes, self.timestamps,
+            self.item_offsets, self.item_product_ids, self.item_quantities,
+            self.item_prices, self.subtotals,
+        )
+        return sum(len(c) * c.itemsize for c in columns)
+
+    def _day_ordinals(self) -> List[Optional[int]]:
+        return [
+            ts // _US_PER_DAY + _EPOCH_ORDINAL if ts != _NO_TIMESTAMP else None
+            for ts in self.timestamps
+        ]
+
+
+def _group_sum(keys: Iterable[Hashable], values: Iterable[float]) -> Dict[Hashable, float]:
+    """round(sum(values in group), 2) per key, adding in input order."""
+    groups: Dict[Hashable, List[float]] = {}
+    for key, value in zip(keys, values):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [value]
+        else:
+            group.append(value)
+    return {key: round(sum(group), 2) for key, group in groups.items()}
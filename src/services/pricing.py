@@ -1,4 +1,5 @@
-from typing import List, Optional, Tuple
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from src.models.product import Product
 from src.models.user import User
 
@@ -30,6 +31,29 @@ class PricingService:
 
         return round(base_price * (1 - discount), 2)
 
+    def calculate_item_prices(
+        self,
+        prices: Sequence[float],
+        quantities: Sequence[int],
+        user: Optional[User] = None,
+    ) -> array:
+        """Column-wise calculate_item_price over parallel price/quantity columns."""
+        user_discount = user.get_discount_percentage() if user else 0.0
+        bulk_discount = min(user_discount + self.BULK_DISCOUNT_RATE, self.MAX_DISCOUNT)
+        plain_discount = min(user_discount, self.MAX_DISCOUNT)
+        threshold = self.BULK_DISCOUNT_THRESHOLD
+        return array(
+            "d",
+            [
+                round(
+                    price * qty
+                    * (1 - (bulk_discount if qty >= threshold else plain_discount)),
+                    2,
+                )
+                for price, qty in zip(prices, quantities)
+            ],
+        )
+
     def calculate_cart_total(
         self,
         items: List[Tuple[Product, int]],
@@ -54,3 +78,49 @@ class PricingService:
             "tax": tax,
             "total": round(subtotal + shipping + tax, 2),
         }
+
+    def calculate_cart_totals(
+        self,
+        carts: Iterable[Tuple[List[Tuple[Product, int]], Optional[User]]],
+    ) -> List[dict]:
+        """Batch calculate_cart_total: one breakdown per (items, user) cart.
+
+        Each user's discount is looked up once per cart and the discount
+        multipliers are shared between carts of the same tier. The arithmetic
+        is the same as calculate_cart_total, so results match to the cent.
+        """
+        threshold = self.BULK_DISCOUNT_THRESHOLD
+        multipliers: Dict[float, Tuple[float, float]] = {}
+        results = []
+        for items, user in carts:
+            user_discount = user.get_discount_percentage() if user else 0.0
+            rates = multipliers.get(user_discount)
+            if rates is None:
+                rates = multipliers[user_discount] = (
+                    1 - min(user_discount, self.MAX_DISCOUNT),
+                    1 - min(user_discount + self.BULK_DISCOUNT_RATE, self.MAX_DISCOUNT),
+                )
+            plain, bulk = rates
+            line_totals = [
+                {
+                    "product_id": product.id,
+                    "quantity": qty,
+                    "line_total": round(
+                        product.price * qty * (bulk if qty >= threshold else plain), 2
+                    ),
+                }
+                for product, qty in items
+            ]
+            subtotal = sum([lt["line_total"] for lt in line_totals])
+            shipping = 0.0 if subtotal >= 50 else 5.99
+            tax = round(subtotal * 0.08, 2)
+            results.append(
+                {
+                    "lines": line_totals,
+                    "subtotal": round(subtotal, 2),
+                    "shipping": shipping,
+                    "tax": tax,
+                    "total": round(subtotal + shipping + tax, 2),
+                }
+            )
+        return results
@@ -0,0 +1,92 @@
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class NGramIndex:
+    """Inverted n-gram index over lowercased product names and tags.
+
+    Every substring of length ``min_n`` to ``n`` of each text is indexed, so a
+    query no longer than ``n`` is answered by a single posting list and longer
+    queries by intersecting the postings of their n-grams.
+    """
+
+    def __init__(self, n: int = 3, min_n: int = 2):
+        self.n = n
+        self.min_n = min_n
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._texts: Dict[int, Tuple[str, ...]] = {}
+        self._rank: Dict[int, int] = {}
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, product_id: int) -> bool:
+        return product_id in self._texts
+
+    def _grams(self, texts: Iterable[str]) -> Set[str]:
+        grams = set()
+        for text in texts:
+            for size in range(self.min_n, self.n + 1):
+                for i in range(len(text) - size + 1):
+                    grams.add(text[i : i + size])
+        return grams
+
+    def add(
+        self, product_id: int, name: str, tags: Iterable[str], active: bool = True
+    ) -> None:
+        """Index (or re-index) a product under its name and tags.
+
+        Inactive products are kept out of the postings but still hold their
+        place in the result order, so re-activating them later matches a scan.
+        """
+        if product_id not in self._rank:
+            self._rank[product_id] = next(self._counter)
+        self.remove(product_id)
+        if not active:
+            return
+        texts = (name.lower(),) + tuple(tag.lower() for tag in tags)
+        self._texts[product_id] = texts
+        for gram in self._grams(texts):
+            self._postings[gram].add(product_id)
+
+    def remove(self, product_id: int) -> None:
+        """Drop a product from the postings. Its place in the result order is kept."""
+        texts = self._texts.pop(product_id, None)
+        if texts is None:
+            return
+        for gram in self._grams(texts):
+            posting = self._postings[gram]
+            posting.discard(product_id)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query_lower: str) -> Optional[List[int]]:
+        """Return ids whose name or a tag contains query_lower, in first-added order.
+
+        Returns None when the query is shorter than ``min_n`` and cannot be
+        answered from the index.
+        """
+        if len(query_lower) < self.min_n:
+            return None
+        if len(query_lower) <= self.n:
+            matches = self._postings.get(query_lower, ())
+        else:
+            postings = []
+            for gram in {
+                query_lower[i : i + self.n]
+                for i in range(len(query_lower) - self.n + 1)
+            }:
+                posting = self._postings.get(gram)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            matches = [
+                pid
+                for pid in candidates
+                if any(query_lower in text for text in self._texts[pid])
+            ]
+        return sorted(matches, key=self._rank.__getitem__)
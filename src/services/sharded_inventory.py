@@ -0,0 +1,215 @@
+"""
+InventoryService partitioned by product id across worker processes.
+
+Each shard is a process owning a plain InventoryService for the ids that hash
+to it, so catalog work runs on as many cores as there are shards. Point
+operations go to the one shard that owns the id; searches and low-stock
+queries are sent to every shard first and then collected, so the shards work
+on them at the same time.
+"""
+import heapq
+import multiprocessing
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from src.models.product import Product
+from src.services.inventory import InventoryService
+
+_METHODS = frozenset({
+    "add_product", "add_products", "get_product", "get_products", "check_availability",
+    "reserve_stock", "restock", "search_products", "get_low_stock_products",
+})
+
+
+def _serve(conn, service_kwargs: dict) -> None:
+    service = InventoryService(**service_kwargs)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        method, args = request
+        try:
+            if method not in _METHODS:
+                raise ValueError(f"Unsupported inventory method {method!r}")
+            result = getattr(service, method)(*args)
+        except Exception as exc:
+            conn.send((False, exc))
+        else:
+            conn.send((True, result))
+
+
+class ShardedInventory:
+    """The InventoryService catalog API over ``shards`` worker processes.
+
+    Products returned are copies: assign through reserve_stock/restock (or
+    add_product again) rather than mutating them. Search results come back
+    in the order products were first added through this object; low-stock
+    results come back lowest stock first. Keyword arguments such as
+    ``search_index=True`` configure every shard's InventoryService.
+
+    Calls are thread-safe; each shard serves one request at a time, and
+    scatter-gather calls lock the shards in index order. A shard whose
+    connection fails mid-request is marked broken and later calls to it
+    raise ConnectionError; the other shards of a failed scatter still have
+    their replies read, so they stay in step.
+    """
+
+    def __init__(self, shards: int = 4, mp_context=None, **service_kwargs):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        context = mp_context or multiprocessing.get_context()
+        self._conns = []
+        self._processes = []
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._broken = [False] * shards
+        self._rank: Dict[int, int] = {}
+        for index in range(shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_serve, args=(child, service_kwargs),
+                name=f"inventory-shard-{index}", daemon=True,
+            )
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    @property
+    def shards(self) -> int:
+        return len(self._conns)
+
+    def __enter__(self) -> "ShardedInventory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for conn, lock in zip(self._conns, self._locks):
+            with lock:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+        for process, broken in zip(self._processes, self._broken):
+            if broken:
+                process.terminate()
+            process.join()
+        for conn in self._conns:
+            conn.close()
+
+    def shard_of(self, product_id: int) -> int:
+        return hash(product_id) % len(self._conns)
+
+    def _send(self, shard: int, request: tuple) -> None:
+        if self._broken[shard]:
+            raise ConnectionError(f"Inventory shard {shard} failed earlier")
+        try:
+            self._conns[shard].send(request)
+        except OSError:
+            # Possibly a partial message; pickling errors happen before any write.
+            self._broken[shard] = True
+            raise
+
+    def _recv(self, shard: int) -> tuple:
+        try:
+            return self._conns[shard].recv()
+        except BaseException:
+            self._broken[shard] = True
+            raise
+
+    def _call(self, shard: int, method: str, *args):
+        with self._locks[shard]:
+            self._send(shard, (method, args))
+            ok, result = self._recv(shard)
+        if not ok:
+            raise result
+        return result
+
+    def _scatter(self, method: str, args_per_shard: List[tuple]) -> list:
+        shards = [i for i, args in enumerate(args_per_shard) if args is not None]
+        for i in shards:
+            self._locks[i].acquire()
+        try:
+            error: Optional[BaseException] = None
+            sent = []
+            try:
+                for i in shards:
+                    self._send(i, (method, args_per_shard[i]))
+                    sent.append(i)
+            except BaseException as exc:
+                error = exc
+            # Every request that went out has its reply read, even after a
+            # failure, so the next call on that shard gets its own reply.
+            replies = []
+            for i in sent:
+                try:
+                    replies.append(self._recv(i))
+                except BaseException as exc:
+                    error = error or exc
+            if error is not None:
+                raise error
+        finally:
+            for i in reversed(shards):
+                self._locks[i].release()
+        for ok, result in replies:
+            if not ok:
+                raise result
+        return [result for _, result in replies]
+
+    def _note(self, product_id: int) -> None:
+        if product_id not in self._rank:
+            self._rank[product_id] = len(self._rank)
+
+    def add_product(self, product: Product) -> None:
+        self._note(product.id)
+        self._call(self.shard_of(product.id), "add_product", product)
+
+    def add_products(self, products: Iterable[Product]) -> None:
+        """Add a batch; each shard applies its part atomically."""
+        parts: List[Optional[list]] = [None] * self.shards
+        for product in products:
+            self._note(product.id)
+            shard = self.shard_of(product.id)
+            if parts[shard] is None:
+                parts[shard] = []
+            parts[shard].append(product)
+        self._scatter("add_products", [(p,) if p else None for p in parts])
+
+    def get_product(self, product_id: int) -> Optional[Product]:
+        return self._call(self.shard_of(product_id), "get_product", product_id)
+
+    def get_products(self, product_ids: Iterable[int]) -> Dict[int, Optional[Product]]:
+        """Bulk lookup like InventoryService.get_products, one round trip per shard."""
+        ids = list(dict.fromkeys(product_ids))
+        parts: List[Optional[list]] = [None] * self.shards
+        for pid in ids:
+            shard = self.shard_of(pid)
+            if parts[shard] is None:
+                parts[shard] = []
+            parts[shard].append(pid)
+        found: Dict[int, Optional[Product]] = {}
+        for result in self._scatter("get_products", [(p,) if p else None for p in parts]):
+            found.update(result)
+        return {pid: found[pid] for pid in ids}
+
+    def check_availability(self, product_id: int, quantity: int) -> bool:
+        return self._call(self.shard_of(product_id), "check_availability", product_id, quantity)
+
+    def reserve_stock(self, product_id: int, quantity: int) -> bool:
+        return self._call(self.shard_of(product_id), "reserve_stock", product_id, quantity)
+
+    def restock(self, product_id: int, quantity: int) -> int:
+        return self._call(self.shard_of(product_id), "restock", product_id, quantity)
+
+    def search_products(self, query: str) -> List[Product]:
+        rank = self._rank
+        per_shard = self._scatter("search_products", [(query,)] * self.shards)
+        return list(heapq.merge(*per_shard, key=lambda p: rank.get(p.id, len(rank))))
+
+    def get_low_stock_products(self, threshold: int = 10) -> List[Product]:
+        per_shard = self._scatter("get_low_stock_products", [(threshold,)] * self.shards)
+        return list(heapq.merge(*per_shard, key=lambda p: p.stock))
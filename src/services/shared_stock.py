@@ -0,0 +1,146 @@
+"""
+Stock counters in shared memory, for prefork workers on one host.
+
+SharedStock keeps one int64 counter per product in a
+multiprocessing.shared_memory block, next to the sorted product ids that
+define each product's slot, so any process can attach by name and rebuild
+the same slot map. Updates take one of ``stripes`` process-shared locks
+(chosen by slot), so every process sees a single consistent stock level
+without a round trip to another process.
+
+Create it in the parent before starting the workers and hand it to them as a
+Process argument (or let them inherit it through fork); the locks can only be
+shared that way.
+"""
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+from typing import Dict, Mapping, Optional, Tuple
+
+_HEADER = struct.Struct("<4sIQ")
+_MAGIC = b"STCK"
+
+
+class SharedStock:
+    """Per-product stock levels shared by every process attached to ``name``.
+
+    The set of products is fixed when the block is created; ids outside it
+    raise ValueError. Reads are lock-free, and every update holds the stripe
+    lock of the product's slot.
+    """
+
+    def __init__(self, name: str, locks: tuple, _block: Optional[shared_memory.SharedMemory] = None):
+        self._block = _block or shared_memory.SharedMemory(name=name)
+        magic, _, count = _HEADER.unpack_from(self._block.buf)
+        if magic != _MAGIC:
+            raise ValueError(f"{name} is not a shared stock block")
+        self._words = self._block.buf[_HEADER.size:_HEADER.size + 16 * count].cast("q")
+        self._ids = self._words[:count]
+        self._levels = self._words[count:]
+        self._slots: Dict[int, int] = {pid: slot for slot, pid in enumerate(self._ids)}
+        self._locks = locks
+        self.name = self._block.name
+
+    @classmethod
+    def create(
+        cls, levels: Mapping[int, int], stripes: int = 64, mp_context=None
+    ) -> "SharedStock":
+        """A new block holding levels ({product_id: stock}); the caller owns it.
+
+        Locks come from ``mp_context``, which must match how the workers are
+        started.
+        """
+        context = mp_context or multiprocessing.get_context()
+        ids = sorted(levels)
+        block = shared_memory.SharedMemory(create=True, size=_HEADER.size + 16 * max(len(ids), 1))
+        _HEADER.pack_into(block.buf, 0, _MAGIC, 1, len(ids))
+        words = block.buf[_HEADER.size:_HEADER.size + 16 * len(ids)].cast("q")
+        for slot, pid in enumerate(ids):
+            words[slot] = pid
+            words[len(ids) + slot] = levels[pid]
+        words.release()
+        locks = tuple(context.Lock() for _ in range(stripes))
+        return cls(block.name, locks, _block=block)
+
+    def __getstate__(self) -> Tuple[str, tuple]:
+        return self.name, self._locks
+
+    def __setstate__(self, state: Tuple[str, tuple]) -> None:
+        self.__init__(*state)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, product_id) -> bool:
+        return product_id in self._slots
+
+    def _slot(self, product_id: int) -> int:
+        slot = self._slots.get(product_id)
+        if slot is None:
+            raise ValueError(f"Product {product_id} has no shared stock slot")
+        return slot
+
+    def get(self, product_id: int) -> int:
+        # A single aligned 8-byte load; no lock needed to read a level.
+        return self._levels[self._slot(product_id)]
+
+    def reserve(self, product_id: int, quantity: int) -> Optional[int]:
+        """Take quantity if that much is in stock; returns the new level or None."""
+        slot = self._slot(product_id)
+        with self._locks[slot % len(self._locks)]:
+            level = self._levels[slot]
+            if level <= 0 or level < quantity:
+                return None
+            self._levels[slot] = level - quantity
+            return level - quantity
+
+    def reserve_many(self, quantities: Mapping[int, int]) -> Optional[Dict[int, int]]:
+        """Reserve every (product_id, quantity) or none; returns the new levels or None.
+
+        Stripe locks are taken in ascending order, so concurrent calls cannot
+        deadlock.
+        """
+        slots = {pid: self._slot(pid) for pid in quantities}
+        stripes = sorted({slot % len(self._locks) for slot in slots.values()})
+        for index in stripes:
+            self._locks[index].acquire()
+        try:
+            for pid, slot in slots.items():
+                level = self._levels[slot]
+                if level <= 0 or level < quantities[pid]:
+                    return None
+            result = {}
+            for pid, slot in slots.items():
+                self._levels[slot] -= quantities[pid]
+                result[pid] = self._levels[slot]
+            return result
+        finally:
+            for index in reversed(stripes):
+                self._locks[index].release()
+
+    def add(self, product_id: int, quantity: int) -> int:
+        """Add quantity (may be negative); returns the new level."""
+        slot = self._slot(product_id)
+        with self._locks[slot % len(self._locks)]:
+            self._levels[slot] += quantity
+            return self._levels[slot]
+
+    def set(self, product_id: int, level: int) -> None:
+        slot = self._slot(product_id)
+        with self._locks[slot % len(self._locks)]:
+            self._levels[slot] = level
+
+    def levels(self) -> Dict[int, int]:
+        return dict(zip(self._ids, self._levels))
+
+    def close(self) -> None:
+        """Detach this process from the block."""
+        self._ids.release()
+        self._levels.release()
+        self._words.release()
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Free the block; call once, from the creating process, after close()."""
+        self._block.unlink()
+
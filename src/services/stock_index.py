@@ -0,0 +1,55 @@
+from bisect import bisect_left, insort
+from typing import Dict, List
+
+
+class StockIndex:
+    """Secondary index of product ids ordered by stock level.
+
+    Ids are bucketed by their exact stock level and the distinct levels are
+    kept sorted, so a threshold query is a bisect plus a walk over the
+    matching buckets.
+    """
+
+    def __init__(self):
+        self._levels: List[int] = []
+        self._buckets: Dict[int, Dict[int, None]] = {}
+        self._stock: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._stock)
+
+    def __contains__(self, product_id: int) -> bool:
+        return product_id in self._stock
+
+    def set(self, product_id: int, stock: int) -> None:
+        """Insert a product or move it to a new stock level."""
+        current = self._stock.get(product_id)
+        if current == stock:
+            return
+        if current is not None:
+            self._remove_from_bucket(product_id, current)
+        self._stock[product_id] = stock
+        bucket = self._buckets.get(stock)
+        if bucket is None:
+            bucket = self._buckets[stock] = {}
+            insort(self._levels, stock)
+        bucket[product_id] = None
+
+    def discard(self, product_id: int) -> None:
+        current = self._stock.pop(product_id, None)
+        if current is not None:
+            self._remove_from_bucket(product_id, current)
+
+    def _remove_from_bucket(self, product_id: int, stock: int) -> None:
+        bucket = self._buckets[stock]
+        del bucket[product_id]
+        if not bucket:
+            del self._buckets[stock]
+            del self._levels[bisect_left(self._levels, stock)]
+
+    def below(self, threshold: int) -> List[int]:
+        """Ids with stock strictly below threshold, lowest stock first."""
+        ids: List[int] = []
+        for level in self._levels[: bisect_left(self._levels, threshold)]:
+            ids.extend(self._buckets[level])
+        return ids
@@ -0,0 +1,108 @@
+import os
+import struct
+import threading
+from typing import Dict, Optional
+
+RECORD = struct.Struct("<qq")
+
+
+class StockLog:
+    """Append-only write-ahead log of stock levels with group commit.
+
+    Each record is a fixed-size (product_id, stock) pair holding the new
+    absolute level, so replay is idempotent and the last record per product
+    wins. Writers that wait for durability share a single write + fsync:
+    the first waiter becomes the leader, gathers records for up to
+    ``commit_window`` seconds and flushes them on behalf of everyone.
+
+    A failed write or fsync leaves the log failed: records that were not
+    yet durable stay buffered, the leader's wait() re-raises the error and
+    every later wait() for a record past the last good commit raises
+    OSError instead of returning.
+    """
+
+    def __init__(self, path: str, commit_window: float = 0.002):
+        self.path = path
+        self.commit_window = commit_window
+        self._file = open(path, "ab")
+        self._cond = threading.Condition()
+        self._pending = bytearray()
+        self._appended = 0
+        self._durable = 0
+        self._flushing = False
+        self._failed: Optional[BaseException] = None
+        self.records = os.path.getsize(path) // RECORD.size
+        self.commits = 0
+
+    @staticmethod
+    def replay(path: str) -> Dict[int, int]:
+        """Final stock level per product id. A torn trailing record is ignored."""
+        levels: Dict[int, int] = {}
+        if not os.path.exists(path):
+            return levels
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % RECORD.size
+        for product_id, stock in RECORD.iter_unpack(data[:usable]):
+            levels[product_id] = stock
+        return levels
+
+    def append(self, product_id: int, stock: int) -> int:
+        """Buffer a record and return its sequence number for wait()."""
+        with self._cond:
+            self._pending += RECORD.pack(product_id, stock)
+            self._appended += 1
+            self.records += 1
+            return self._appended
+
+    def wait(self, seq: int) -> None:
+        """Block until record seq (and everything before it) is on disk."""
+        with self._cond:
+            while self._durable < seq:
+                if self._failed is not None:
+                    failed = self._failed
+                    raise OSError(f"Stock log {self.path} failed: {failed}") from failed
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+                self._flushing = True
+                self._cond.wait(self.commit_window)
+                data = bytes(self._pending)
+                upto = self._appended
+                self._cond.release()
+                try:
+                    self._file.write(data)
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                except BaseException as exc:
+                    self._cond.acquire()
+                    self._failed = exc
+                    self._flushing = False
+                    self._cond.notify_all()
+                    raise
+                self._cond.acquire()
+                # Appends made during the write stay buffered for the next commit.
+                del self._pending[:len(data)]
+                self._durable = upto
+                self.commits += 1
+                self._flushing = False
+                self._cond.notify_all()
+
+    def record(self, product_id: int, stock: int) -> None:
+        self.wait(self.append(product_id, stock))
+
+    def truncate(self) -> None:
+        """Drop every record; call once their effect is saved elsewhere."""
+        with self._cond:
+            self.wait(self._appended)
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records = 0
+
+    def close(self) -> None:
+        with self._cond:
+            try:
+                self.wait(self._appended)
+            finally:
+                self._file.close()
@@ -1,5 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import IO, Dict, Iterable, List, Optional, Tuple
+
+SummaryRow = Tuple[int, int, float, str]
+
+_SAMPLE = 256
+_MINUTES = [f"{minute:02d}" for minute in range(60)]
 
 
 def format_currency(amount: float) -> str:
@@ -35,3 +41,94 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     if len(text) <= max_length:
         return text
     return text[: max_length - 3] + "..."
+
+
+def format_currencies(amounts: Iterable[float]) -> List[str]:
+    """format_currency for each amount.
+
+    When a sample of the amounts shows repeats (typical of prices), the
+    formatted strings are kept in a table keyed by amount so each distinct
+    value is formatted once. Zero bypasses the table because 0.0 and -0.0
+    compare equal but format differently.
+    """
+    amounts = list(amounts)
+    sample = amounts[:_SAMPLE]
+    if len(set(sample)) > len(sample) * 3 // 4:
+        return [f"${amount:,.2f}" for amount in amounts]
+    table: Dict[float, str] = {}
+    result = []
+    append = result.append
+    for amount in amounts:
+        text = table.get(amount) if amount else None
+        if text is None:
+            text = f"${amount:,.2f}"
+            if amount:
+                table[amount] = text
+        append(text)
+    return result
+
+
+def format_dates(dts: Iterable[datetime]) -> List[str]:
+    """format_date for each datetime, calling strftime once per distinct day."""
+    days: Dict[int, str] = {}
+    result = []
+    append = result.append
+    for dt in dts:
+        key = dt.toordinal()
+        text = days.get(key)
+        if text is None:
+            text = days[key] = dt.strftime("%B %d, %Y")
+        append(text)
+    return result
+
+
+def format_datetimes(dts: Iterable[datetime]) -> List[str]:
+    """format_datetime for each datetime.
+
+    strftime runs once per distinct day for the date part and once per
+    distinct hour for the "%I:" and " %p" pieces; minutes come from a table.
+    """
+    days: Dict[int, str] = {}
+    hours: Dict[int, Tuple[str, str]] = {}
+    minutes = _MINUTES
+    result = []
+    append = result.append
+    for dt in dts:
+        day_key = dt.toordinal()
+        day = days.get(day_key)
+        if day is None:
+            day = days[day_key] = dt.strftime("%B %d, %Y at ")
+        hour = hours.get(dt.hour)
+        if hour is None:
+            hour = hours[dt.hour] = (dt.strftime("%I:"), dt.strftime(" %p"))
+        append(day + hour[0] + minutes[dt.minute] + hour[1])
+    return result
+
+
+def format_order_summaries(rows: Iterable[SummaryRow]) -> List[str]:
+    """format_order_summary for each (order_id, items_count, total, status) row."""
+    return [
+        f"Order #{order_id}: {items_count} item(s) | "
+        f"Total: ${total:,.2f} | Status: {status.upper()}"
+        for order_id, items_count, total, status in rows
+    ]
+
+
+def write_order_summaries(
+    out: IO[str], rows: Iterable[SummaryRow], chunk_size: int = 1000
+) -> int:
+    """Write one order summary per line to out; returns the number written.
+
+    Rows are formatted and written ``chunk_size`` at a time, so memory
+    stays bounded however long the listing is.
+    """
+    rows = iter(rows)
+    written = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return written
+        lines = format_order_summaries(chunk)
+        out.write("\n".join(lines))
+        out.write("\n")
+        written += len(lines)
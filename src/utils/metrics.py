@@ -0,0 +1,151 @@
+import os
+from typing import Dict, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of durations in nanoseconds.
+
+    Values below ``2 ** (sub_bits + 1)`` get exact buckets; above that each
+    power of two is split into ``2 ** sub_bits`` buckets, so any recorded
+    value is off by at most ``1 / 2 ** sub_bits`` of itself. Recording only
+    touches ``counts`` and ``total``; count and max are derived on read, which
+    lets hot paths inline the bucket arithmetic.
+    """
+
+    def __init__(self, sub_bits: int = 4):
+        self.sub_bits = sub_bits
+        self.counts: List[int] = [0] * ((64 - sub_bits) << sub_bits)
+        self.total = 0
+
+    def record(self, value: int) -> None:
+        shift = value.bit_length() - self.sub_bits - 1
+        if shift < 0:
+            shift = 0
+        self.counts[(shift << self.sub_bits) + (value >> shift)] += 1
+        self.total += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def max(self) -> int:
+        """Upper bound of the highest non-empty bucket."""
+        for index in range(len(self.counts) - 1, -1, -1):
+            if self.counts[index]:
+                return self.bucket_upper(index)
+        return 0
+
+    def bucket_upper(self, index: int) -> int:
+        """Largest value that lands in bucket index."""
+        if index < 2 << self.sub_bits:
+            return index
+        shift = (index >> self.sub_bits) - 1
+        mantissa = index - (shift << self.sub_bits)
+        return ((mantissa + 1) << shift) - 1
+
+    def quantile(self, q: float) -> int:
+        """Upper bound of the bucket holding the q-th recorded value."""
+        count = self.count
+        if not count:
+            return 0
+        rank = max(1, round(q * count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bucket_upper(index)
+        return 0
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """(upper bound, cumulative count) for every non-empty bucket."""
+        cumulative = 0
+        result = []
+        for index, n in enumerate(self.counts):
+            if n:
+                cumulative += n
+                result.append((self.bucket_upper(index), cumulative))
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        count = self.count
+        return {
+            "count": count,
+            "mean_us": self.total / count / 1e3 if count else 0.0,
+            "p50_us": self.quantile(0.50) / 1e3,
+            "p90_us": self.quantile(0.90) / 1e3,
+            "p99_us": self.quantile(0.99) / 1e3,
+            "max_us": self.max / 1e3,
+        }
+
+
+class MetricsRegistry:
+    """Named latency histograms and counters, keyed by sorted label pairs."""
+
+    def __init__(self):
+        self.histograms: Dict[str, Dict[Labels, LatencyHistogram]] = {}
+        self.counters: Dict[str, Dict[Labels, int]] = {}
+        self.help: Dict[str, str] = {}
+
+    def histogram(self, name: str, help_text: str = "", **labels: str) -> LatencyHistogram:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = LatencyHistogram()
+            if help_text:
+                self.help.setdefault(name, help_text)
+        return histogram
+
+    def increment(self, name: str, amount: int = 1, **labels: str) -> None:
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        result: Dict[str, Dict[str, object]] = {}
+        for name, series in self.histograms.items():
+            result[name] = {_format_labels(k): h.summary() for k, h in series.items()}
+        for name, series in self.counters.items():
+            result[name] = {_format_labels(k): v for k, v in series.items()}
+        return result
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition; histogram values are in seconds."""
+        lines = []
+        for name, series in sorted(self.histograms.items()):
+            if name in self.help:
+                lines.append(f"# HELP {name} {self.help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in sorted(series.items()):
+                for upper, cumulative in histogram.buckets():
+                    le = _format_labels(key + (("le", repr(upper / 1e9)),))
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                count = histogram.count
+                lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {histogram.total / 1e9!r}")
+                lines.append(f"{name}_count{_format_labels(key)} {count}")
+        for name, series in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the exposition atomically, e.g. for a textfile collector."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
@@ -1,39 +1,148 @@
 import re
-from typing import Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+_EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$").match
+_UPPER = re.compile(r"[A-Z]").search
+_LOWER = re.compile(r"[a-z]").search
+_DIGIT = re.compile(r"\d").search
+
+_VALID = (True, "")
+_EMAIL_REQUIRED = (False, "Email is required")
+_EMAIL_INVALID = (False, "Invalid email format")
+_PASSWORD_SHORT = (False, "Password must be at least 8 characters")
+_PASSWORD_NO_UPPER = (False, "Password must contain an uppercase letter")
+_PASSWORD_NO_LOWER = (False, "Password must contain a lowercase letter")
+_PASSWORD_NO_DIGIT = (False, "Password must contain a digit")
+_ADDRESS_REQUIRED = (False, "Shipping address is required")
+_ADDRESS_SHORT = (False, "Address seems too short")
+_ADDRESS_LONG = (False, "Address is too long")
 
 
 def validate_email(email: str) -> Tuple[bool, str]:
     """Validate email format. Returns (is_valid, error_message)."""
     if not email:
-        return False, "Email is required"
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
-        return False, "Invalid email format"
-    return True, ""
+        return _EMAIL_REQUIRED
+    if not _EMAIL(email):
+        return _EMAIL_INVALID
+    return _VALID
 
 
 def validate_password(password: str) -> Tuple[bool, str]:
     """Validate password strength. Returns (is_valid, error_message)."""
     if len(password) < 8:
-        return False, "Password must be at least 8 characters"
-    if not re.search(r"[A-Z]", password):
-        return False, "Password must contain an uppercase letter"
-    if not re.search(r"[a-z]", password):
-        return False, "Password must contain a lowercase letter"
-    if not re.search(r"\d", password):
-        return False, "Password must contain a digit"
-    return True, ""
+        return _PASSWORD_SHORT
+    if not _UPPER(password):
+        return _PASSWORD_NO_UPPER
+    if not _LOWER(password):
+        return _PASSWORD_NO_LOWER
+    if not _DIGIT(password):
+        return _PASSWORD_NO_DIGIT
+    return _VALID
 
 
 def validate_shipping_address(address: str) -> Tuple[bool, str]:
     """Validate shipping address."""
     if not address:
-        return False, "Shipping address is required"
+        return _ADDRESS_REQUIRED
     if len(address) < 10:
-        return False, "Address seems too short"
+        return _ADDRESS_SHORT
     if len(address) > 500:
-        return False, "Address is too long"
-    return True, ""
+        return _ADDRESS_LONG
+    return _VALID
+
+
+def validate_emails(
+    emails: Iterable[str], workers: int = 0, chunk_size: int = 10000
+) -> Iterator[Tuple[bool, str]]:
+    """validate_email for each value, yielded in input order.
+
+    With ``workers`` > 1 chunks of ``chunk_size`` values are validated in
+    a process pool; only ``2 * workers`` chunks are in flight at a time.
+    """
+    if workers > 1:
+        return _in_pool(_check_emails, emails, workers, chunk_size)
+    return _check_emails(emails)
+
+
+def validate_passwords(
+    passwords: Iterable[str], workers: int = 0, chunk_size: int = 10000
+) -> Iterator[Tuple[bool, str]]:
+    """validate_password for each value, yielded in input order (see validate_emails)."""
+    if workers > 1:
+        return _in_pool(_check_passwords, passwords, workers, chunk_size)
+    return _check_passwords(passwords)
+
+
+def validate_shipping_addresses(
+    addresses: Iterable[str], workers: int = 0, chunk_size: int = 10000
+) -> Iterator[Tuple[bool, str]]:
+    """validate_shipping_address for each value, yielded in input order (see validate_emails)."""
+    if workers > 1:
+        return _in_pool(_check_addresses, addresses, workers, chunk_size)
+    return _check_addresses(addresses)
+
+
+# The _check_* loops repeat the single-value rules inline; a function call
+# per value would cost about as much as the checks themselves.
+def _check_emails(emails: Iterable[str]) -> Iterator[Tuple[bool, str]]:
+    match = _EMAIL
+    for email in emails:
+        if not email:
+            yield _EMAIL_REQUIRED
+        elif not match(email):
+            yield _EMAIL_INVALID
+        else:
+            yield _VALID
+
+
+def _check_passwords(passwords: Iterable[str]) -> Iterator[Tuple[bool, str]]:
+    upper, lower, digit = _UPPER, _LOWER, _DIGIT
+    for password in passwords:
+        if len(password) < 8:
+            yield _PASSWORD_SHORT
+        elif not upper(password):
+            yield _PASSWORD_NO_UPPER
+        elif not lower(password):
+            yield _PASSWORD_NO_LOWER
+        elif not digit(password):
+            yield _PASSWORD_NO_DIGIT
+        else:
+            yield _VALID
+
+
+def _check_addresses(addresses: Iterable[str]) -> Iterator[Tuple[bool, str]]:
+    for address in addresses:
+        if not address:
+            yield _ADDRESS_REQUIRED
+        elif len(address) < 10:
+            yield _ADDRESS_SHORT
+        elif len(address) > 500:
+            yield _ADDRESS_LONG
+        else:
+            yield _VALID
+
+
+def _check_chunk(check: Callable, values: List[str]) -> List[Tuple[bool, str]]:
+    return list(check(values))
+
+
+def _in_pool(
+    check: Callable, values: Iterable[str], workers: int, chunk_size: int
+) -> Iterator[Tuple[bool, str]]:
+    values = iter(values)
+    with ProcessPoolExecutor(workers) as pool:
+        pending: deque = deque()
+        while True:
+            chunk = list(islice(values, chunk_size))
+            if chunk:
+                pending.append(pool.submit(_check_chunk, check, chunk))
+            if pending and (not chunk or len(pending) >= 2 * workers):
+                yield from pending.popleft().result()
+            if not chunk and not pending:
+                return
 
 
 def sanitize_input(text: str) -> str:
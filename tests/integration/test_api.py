@@ -1,5 +1,6 @@
 import pytest
-from src.api.routes import get_product_detail, search_products, calculate_cart
+from src.api.routes import get_product_detail, get_product_details, search_products, calculate_cart
+from src.api.response_cache import ResponseCache
 from src.services.inventory import InventoryService
 from src.models.product import Product, ProductCategory
 from src.models.user import User, UserRole, AccountStatus
@@ -44,6 +45,64 @@ class TestGetProductDetail:
         assert resp["status"] == 404
 
 
+class TestGetProductDetails:
+    def test_entries_match_single_lookups(self, inventory):
+        resp = get_product_details([3, 999, 1, 3, 2, 1], inventory)
+        assert resp["status"] == 200
+        assert [entry["id"] for entry in resp["data"]] == [3, 999, 1, 2]
+        assert resp["count"] == 4
+        for entry in resp["data"]:
+            single = get_product_detail(entry["id"], inventory)
+            assert entry["status"] == single["status"]
+            assert entry.get("data") == single.get("data")
+            assert entry.get("error") == single.get("error")
+
+    def test_empty_request(self, inventory):
+        assert get_product_details([], inventory) == {"status": 200, "data": [], "count": 0}
+
+    def test_too_many_ids(self, inventory):
+        assert get_product_details(list(range(201)), inventory)["status"] == 400
+
+    def test_bulk_lookup(self, inventory):
+        found = inventory.get_products([2, 5, 2])
+        assert list(found) == [2, 5]
+        assert found[2].name == "Python Book" and found[5] is None
+
+
+class TestCachedProductDetail:
+    def test_repeated_lookups_hit(self, inventory):
+        cache = ResponseCache()
+        first = get_product_detail(1, inventory, cache)
+        assert get_product_detail(1, inventory, cache) is first
+        assert first == get_product_detail(1, inventory)
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.parametrize("mutate", [
+        lambda inv: inv.restock(1, 5),
+        lambda inv: inv.reserve_stock(1, 3),
+        lambda inv: inv.reserve_cart([(1, 2)]),
+        lambda inv: inv.get_product(1).reduce_stock(1),
+        lambda inv: setattr(inv.get_product(1), "is_active", False),
+        lambda inv: inv.add_product(Product(
+            id=1, name="Laptop Pro", price=1299.0,
+            category=ProductCategory.ELECTRONICS, stock=4,
+        )),
+    ])
+    def test_every_mutation_invalidates(self, inventory, mutate):
+        cache = ResponseCache()
+        get_product_detail(1, inventory, cache)
+        mutate(inventory)
+        assert get_product_detail(1, inventory, cache) == get_product_detail(1, inventory)
+
+    def test_not_found_until_added(self, inventory):
+        cache = ResponseCache()
+        assert get_product_detail(7, inventory, cache)["status"] == 404
+        inventory.add_product(Product(
+            id=7, name="Mug", price=8.0, category=ProductCategory.FOOD, stock=3,
+        ))
+        assert get_product_detail(7, inventory, cache)["data"]["stock_count"] == 3
+
+
 class TestSearchProducts:
     def test_search_by_name(self, inventory):
         resp = search_products("laptop", inventory)
@@ -65,6 +124,78 @@ class TestSearchProducts:
         assert resp["count"] == 0
 
 
+class TestPaginatedSearch:
+    @pytest.fixture
+    def catalog(self):
+        svc = InventoryService()
+        for i in range(1, 26):
+            svc.add_product(Product(
+                id=i, name=f"Cable {i}", price=float(i),
+                category=ProductCategory.ELECTRONICS, stock=5,
+            ))
+        return svc
+
+    def test_pages_cover_all_matches_in_order(self, catalog):
+        ids, cursor = [], None
+        while True:
+            resp = search_products("cable", catalog, limit=10, cursor=cursor)
+            assert resp["status"] == 200
+            assert len(resp["data"]) <= 10
+            ids += [item["id"] for item in resp["data"]]
+            cursor = resp["next_cursor"]
+            if cursor is None:
+                break
+        assert ids == [item["id"] for item in search_products("cable", catalog)["data"]]
+
+    def test_exact_count(self, catalog):
+        resp = search_products("cable", catalog, limit=10)
+        assert resp["count"] == 25
+        assert resp["count_exact"] is True
+
+    def test_capped_count(self, catalog):
+        resp = search_products("cable", catalog, limit=5, count_cap=12)
+        assert resp["count"] == 12
+        assert resp["count_exact"] is False
+        assert resp["next_cursor"] == "5"
+
+    def test_last_page(self, catalog):
+        resp = search_products("cable", catalog, limit=10, cursor="20")
+        assert [item["id"] for item in resp["data"]] == [21, 22, 23, 24, 25]
+        assert resp["next_cursor"] is None
+        assert resp["count"] == 25
+
+    def test_scan_stops_after_cap(self, catalog):
+        pulled = []
+        original = catalog.iter_search
+
+        def counting(query):
+            for product in original(query):
+                pulled.append(product.id)
+                yield product
+
+        catalog.iter_search = counting
+        search_products("cable", catalog, limit=3, count_cap=0)
+        assert pulled == [1, 2, 3, 4]
+
+    def test_ranked_pages(self, catalog):
+        catalog.get_product(7).name = "Cable"
+        first = search_products("cable", catalog, limit=3, ranked=True)
+        assert [item["id"] for item in first["data"]] == [7, 1, 2]
+        assert first["count"] == 25 and first["count_exact"] is True
+        second = search_products("cable", catalog, limit=3, cursor=first["next_cursor"], ranked=True)
+        assert [item["id"] for item in second["data"]] == [3, 4, 5]
+        last = search_products("cable", catalog, limit=10, cursor="20", ranked=True)
+        assert len(last["data"]) == 5
+        assert last["next_cursor"] is None
+
+    @pytest.mark.parametrize("kwargs", [
+        {"limit": 0}, {"limit": 101}, {"limit": 5, "cursor": "x"}, {"limit": 5, "cursor": "-1"},
+        {"limit": 5, "cursor": "\u00b2"}, {"limit": 5, "cursor": "\u0663"},
+    ])
+    def test_invalid_paging(self, catalog, kwargs):
+        assert search_products("cable", catalog, **kwargs)["status"] == 400
+
+
 class TestCalculateCart:
     def test_basic_cart(self, inventory):
         items = [{"product_id": 2, "quantity": 2}]
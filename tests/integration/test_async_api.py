@@ -0,0 +1,86 @@
+import asyncio
+import json
+import pytest
+from src.api import async_routes, routes
+from src.api.async_routes import PRICING_OFFLOAD_MIN_LINES
+from src.services.inventory import InventoryService
+from src.models.product import Product, ProductCategory
+from src.models.user import User, AccountStatus
+
+
+class AsyncInventory:
+    """Awaitable facade over an InventoryService, standing in for a remote backend."""
+
+    def __init__(self, inventory):
+        self._inventory = inventory
+
+    async def get_product(self, product_id):
+        await asyncio.sleep(0)
+        return self._inventory.get_product(product_id)
+
+    async def check_availability(self, product_id, quantity):
+        await asyncio.sleep(0)
+        return self._inventory.check_availability(product_id, quantity)
+
+    async def search_products(self, query):
+        await asyncio.sleep(0)
+        return self._inventory.search_products(query)
+
+
+@pytest.fixture
+def inventory():
+    svc = InventoryService()
+    svc.add_product(Product(
+        id=1, name="Laptop", price=999.99,
+        category=ProductCategory.ELECTRONICS, stock=10,
+        is_active=True, tags=["computer", "tech"],
+    ))
+    svc.add_product(Product(
+        id=2, name="Python Book", price=39.99,
+        category=ProductCategory.BOOKS, stock=500,
+        is_active=True, tags=["programming", "education"],
+    ))
+    svc.add_product(Product(
+        id=3, name="Vintage Shirt", price=25.0,
+        category=ProductCategory.CLOTHING, stock=0,
+        is_active=True, tags=["retro"],
+    ))
+    return svc
+
+
+@pytest.fixture(params=["sync", "async"])
+def backend(request, inventory):
+    return inventory if request.param == "sync" else AsyncInventory(inventory)
+
+
+def same_bytes(a, b):
+    return json.dumps(a) == json.dumps(b)
+
+
+class TestAsyncHandlers:
+    @pytest.mark.parametrize("product_id", [1, 3, 999])
+    def test_product_detail(self, inventory, backend, product_id):
+        resp = asyncio.run(async_routes.get_product_detail(product_id, backend))
+        assert same_bytes(resp, routes.get_product_detail(product_id, inventory))
+
+    @pytest.mark.parametrize("query", ["laptop", "programming", "a", "", "xyz"])
+    def test_search(self, inventory, backend, query):
+        resp = asyncio.run(async_routes.search_products(query, backend))
+        assert same_bytes(resp, routes.search_products(query, inventory))
+
+    @pytest.mark.parametrize("items", [
+        [{"product_id": 2, "quantity": 2}, {"product_id": 1, "quantity": 1}],
+        [{"product_id": 3, "quantity": 1}, {"product_id": 999, "quantity": 1}],
+        [{"product_id": 999, "quantity": 1}, {"product_id": 3, "quantity": 1}],
+        [],
+    ])
+    def test_calculate_cart(self, inventory, backend, items):
+        user = User(id=1, email="a@b.com", name="A", discount_tier=2,
+                    status=AccountStatus.ACTIVE)
+        resp = asyncio.run(async_routes.calculate_cart(items, backend, user))
+        assert same_bytes(resp, routes.calculate_cart(items, inventory, user))
+
+    def test_large_cart_priced_in_executor(self, inventory, backend):
+        items = [{"product_id": 2, "quantity": 1}] * PRICING_OFFLOAD_MIN_LINES
+        resp = asyncio.run(async_routes.calculate_cart(items, backend))
+        assert same_bytes(resp, routes.calculate_cart(items, inventory))
@@ -0,0 +1,68 @@
+import pytest
+from src.api import routes
+from src.api.instrumentation import Instrumentation
+from src.services.inventory import InventoryService
+from src.models.product import Product, ProductCategory
+
+
+@pytest.fixture
+def inventory():
+    svc = InventoryService()
+    svc.add_product(Product(
+        id=1, name="Laptop", price=999.99,
+        category=ProductCategory.ELECTRONICS, stock=10, tags=["tech"],
+    ))
+    return svc
+
+
+class TestInstrumentation:
+    def test_counts_and_latency_per_handler(self, inventory):
+        with Instrumentation(services=True) as instrumentation:
+            routes.get_product_detail(1, inventory)
+            routes.get_product_detail(999, inventory)
+            routes.search_products("lap", inventory)
+            routes.calculate_cart([{"product_id": 1, "quantity": 1}], inventory)
+        snapshot = instrumentation.registry.snapshot()
+        requests = snapshot["route_requests_total"]
+        assert requests['{handler="get_product_detail",status="200"}'] == 1
+        assert requests['{handler="get_product_detail",status="404"}'] == 1
+        assert snapshot["route_latency_seconds"]['{handler="calculate_cart"}']["count"] == 1
+        stages = snapshot["stage_latency_seconds"]
+        # two lookups plus the cart line and its availability check
+        assert stages['{stage="InventoryService.get_product"}']["count"] == 4
+        assert stages['{stage="PricingService.calculate_cart_total"}']["count"] == 1
+
+    def test_disable_restores_originals(self, inventory):
+        original = routes.get_product_detail
+        original_method = InventoryService.get_product
+        instrumentation = Instrumentation(services=True).enable()
+        assert routes.get_product_detail is not original
+        instrumentation.disable()
+        assert routes.get_product_detail is original
+        assert InventoryService.get_product is original_method
+
+    def test_one_instance_enabled_at_a_time(self, inventory):
+        original = routes.get_product_detail
+        a, b = Instrumentation(), Instrumentation()
+        a.enable()
+        with pytest.raises(RuntimeError, match="already enabled"):
+            b.enable()
+        assert not b.enabled
+        a.disable()
+        b.disable()  # never enabled: nothing to undo
+        assert routes.get_product_detail is original
+        b.enable()
+        routes.get_product_detail(1, inventory)
+        b.disable()
+        routes.get_product_detail(1, inventory)
+        assert routes.get_product_detail is original
+        assert a.registry.snapshot().get("route_requests_total", {}) == {}
+        requests = b.registry.snapshot()["route_requests_total"]
+        assert sum(requests.values()) == 1
+
+    def test_exceptions_counted_and_reraised(self, inventory):
+        with Instrumentation() as instrumentation:
+            with pytest.raises(KeyError):
+                routes.calculate_cart([{"quantity": 1}], inventory)
+        requests = instrumentation.registry.snapshot()["route_requests_total"]
+        assert requests['{handler="calculate_cart",status="exception"}'] == 1
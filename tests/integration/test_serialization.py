@@ -0,0 +1,76 @@
+import json
+import pytest
+from src.api.routes import (
+    get_product_detail,
+    get_product_detail_json,
+    search_products,
+    search_products_json,
+)
+from src.api.serialization import JSONFragments
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+
+
+@pytest.fixture
+def inventory():
+    svc = InventoryService()
+    rows = [
+        (1, "Laptop", 999.99, ProductCategory.ELECTRONICS, 10, True),
+        (2, 'Café "Press" \\ Kit', 39.0, ProductCategory.FOOD, 0, True),
+        (3, "Lap Desk", 25, ProductCategory.CLOTHING, 4, False),
+        (4, "Laptop Bag", 1e-7, ProductCategory.BOOKS, 3, True),
+    ]
+    for pid, name, price, category, stock, active in rows:
+        svc.add_product(Product(
+            id=pid, name=name, price=price, category=category,
+            stock=stock, is_active=active, tags=["lap"],
+        ))
+    return svc
+
+
+def dumped(response):
+    return json.dumps(response).encode()
+
+
+class TestJSONFragments:
+    def setup_method(self):
+        self.fragments = JSONFragments()
+
+    def test_detail_bytes_match_json_dumps(self, inventory):
+        for pid in (1, 2, 3, 4, 404):
+            assert get_product_detail_json(pid, inventory, self.fragments) == dumped(
+                get_product_detail(pid, inventory)
+            )
+
+    @pytest.mark.parametrize("kwargs", [
+        {}, {"limit": 2}, {"limit": 2, "cursor": "2"}, {"limit": 2, "count_cap": 1},
+        {"ranked": True}, {"limit": 0}, {"cursor": "x", "limit": 1},
+    ])
+    def test_search_bytes_match_json_dumps(self, inventory, kwargs):
+        for query in ("lap", "caf", "zz", "l"):
+            assert search_products_json(query, inventory, self.fragments, **kwargs) == dumped(
+                search_products(query, inventory, **kwargs)
+            )
+
+    def test_stock_changes_reuse_fragment(self, inventory):
+        get_product_detail_json(1, inventory, self.fragments)
+        entry = self.fragments._entries[1]
+        inventory.reserve_stock(1, 10)
+        body = get_product_detail_json(1, inventory, self.fragments)
+        assert self.fragments._entries[1] is entry
+        assert body == dumped(get_product_detail(1, inventory))
+
+    def test_field_changes_rebuild_fragment(self, inventory):
+        get_product_detail_json(1, inventory, self.fragments)
+        product = inventory.get_product(1)
+        product.name = "Laptop Pro"
+        product.price = 1299.5
+        product.category = ProductCategory.BOOKS
+        assert get_product_detail_json(1, inventory, self.fragments) == dumped(
+            get_product_detail(1, inventory)
+        )
+
+    def test_bounded(self, inventory):
+        fragments = JSONFragments(max_entries=2)
+        search_products_json("lap", inventory, fragments)
+        assert len(fragments) == 2
@@ -0,0 +1,24 @@
+import json
+from benchmarks import suite
+from benchmarks.harness import compare
+
+
+def result(median):
+    return {"median_us": median, "p95_us": median, "peak_alloc_bytes": 0,
+            "retained_bytes": 0, "calls": 1}
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = {"results": {"a@-": result(10.0), "b@-": result(10.0), "c@-": result(10.0)}}
+    current = {"results": {"a@-": result(10.5), "b@-": result(13.0), "d@-": result(1.0)}}
+    assert compare(baseline, current, tolerance=0.10) == {"b@-": 1.3}
+
+
+def test_suite_smoke(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    assert suite.main(["--sizes", "50", "--samples", "1", "--output", str(out)]) == 0
+    data = json.loads(out.read_text())
+    assert "routes.calculate_cart[10]@50" in data["results"]
+    assert "validators.validate_email@-" in data["results"]
+    assert suite.main(["--sizes", "50", "--samples", "1", "--filter", "email",
+                       "--compare", str(out), "--tolerance", "100"]) == 0
@@ -0,0 +1,125 @@
+import json
+import pytest
+from src.models.product import ProductCategory
+from src.models.product_table import ProductTable
+from src.services.catalog_import import import_catalog
+from src.services.inventory import InventoryService
+
+CSV_FEED = """id,name,price,category,stock,is_active,tags
+1,Laptop,999.99,Electronics,10,true,computer|tech
+2,Python Book,39.99,books,50,,programming
+3,Broken,abc,books,1,true,
+4,Mystery,5.0,toys,1,true,
+
+5,Hat,15.5,CLOTHING,0,no,
+6,,1.0,food,1,true,
+"""
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+class TestCatalogImport:
+    def setup_method(self):
+        self.inventory = InventoryService(search_index=True)
+
+    def test_csv_import_reports_bad_rows(self, tmp_path):
+        path = write(tmp_path, "feed.csv", CSV_FEED)
+        report = import_catalog(path, self.inventory, chunk_rows=2, workers=0)
+        assert report.rows == 6
+        assert report.imported == 3
+        assert [(e.line, e.message.split()[0]) for e in report.errors] == [
+            (4, "could"), (5, "Unknown"), (8, "Missing"),
+        ]
+        laptop = self.inventory.get_product(1)
+        assert laptop.category is ProductCategory.ELECTRONICS
+        assert laptop.tags == ["computer", "tech"]
+        hat = self.inventory.get_product(5)
+        assert hat.is_active is False and hat.category is ProductCategory.CLOTHING
+        assert self.inventory.get_product(2).is_active is True
+        assert report.rows_per_second > 0
+        assert report.peak_rss_bytes > 0
+
+    def test_jsonl_import(self, tmp_path):
+        lines = [
+            json.dumps({"id": 1, "name": "Lamp", "price": 20, "category": "electronics",
+                        "stock": 3, "tags": ["light"]}),
+            "{not json",
+            "",
+            json.dumps({"id": 2, "name": "Rice", "price": 2.5, "category": "food"}),
+            json.dumps([1, 2]),
+        ]
+        path = write(tmp_path, "feed.jsonl", "\n".join(lines) + "\n")
+        report = import_catalog(path, self.inventory, workers=0)
+        assert report.imported == 2
+        assert [e.line for e in report.errors] == [2, 5]
+        assert self.inventory.get_product(2).stock == 0
+
+    def test_rejects_non_integral_and_out_of_range_numbers(self, tmp_path):
+        good = {"name": "Lamp", "price": 20, "category": "food"}
+        records = [
+            {**good, "id": 1e999},
+            {**good, "id": 2, "stock": 1e999},
+            {**good, "id": 1.9},
+            {**good, "id": 3, "stock": 2.7},
+            {**good, "id": 2**64},
+            {**good, "id": 4, "price": 1e999},
+            {**good, "id": 5.0, "stock": 6.0},
+        ]
+        path = write(tmp_path, "feed.jsonl", "\n".join(json.dumps(r) for r in records) + "\n")
+        report = import_catalog(path, self.inventory, workers=0)
+        assert [e.line for e in report.errors] == [1, 2, 3, 4, 5, 6]
+        assert report.imported == 1
+        assert self.inventory.get_product(5).stock == 6
+
+    def test_out_of_range_csv_id_leaves_table_untouched(self, tmp_path):
+        table = ProductTable()
+        inventory = InventoryService(products=table)
+        path = write(tmp_path, "feed.csv",
+                     "id,name,price,category\n1,A,1,books\n99999999999999999999,B,1,books\n")
+        report = import_catalog(path, inventory, workers=0)
+        assert [e.line for e in report.errors] == [3]
+        assert list(table.ids) == [1]
+        assert 99999999999999999999 not in table
+
+    def test_batches_update_indexes(self, tmp_path):
+        self.inventory.search_products("laptop")  # build the index first
+        self.inventory.get_low_stock_products()
+        path = write(tmp_path, "feed.csv", CSV_FEED)
+        import_catalog(path, self.inventory, workers=0)
+        assert [p.id for p in self.inventory.search_products("laptop")] == [1]
+        assert [p.id for p in self.inventory.get_low_stock_products(20)] == [1]
+
+    def test_process_pool_matches_in_process(self, tmp_path):
+        rows = "\n".join(
+            f"{i},Item {i},{i}.5,books,{i % 7},true,tag{i % 3}" for i in range(1, 501)
+        )
+        path = write(tmp_path, "feed.csv", "id,name,price,category,stock,is_active,tags\n" + rows)
+        pooled = InventoryService()
+        report = import_catalog(path, pooled, chunk_rows=64, workers=2)
+        import_catalog(path, self.inventory, chunk_rows=64, workers=0)
+        assert report.imported == 500
+        assert [vars_of(p) for p in pooled._products.values()] == [
+            vars_of(p) for p in self.inventory._products.values()
+        ]
+
+    def test_max_errors_keeps_counting(self, tmp_path):
+        rows = "\n".join(f"{i},Item,bad,books" for i in range(1, 11))
+        path = write(tmp_path, "feed.csv", "id,name,price,category\n" + rows)
+        report = import_catalog(path, self.inventory, workers=0, max_errors=3)
+        assert report.error_count == 10
+        assert len(report.errors) == 3
+
+    def test_header_and_format_checks(self, tmp_path):
+        with pytest.raises(ValueError):
+            import_catalog(write(tmp_path, "feed.csv", "id,name\n1,x\n"), self.inventory)
+        with pytest.raises(ValueError):
+            import_catalog(write(tmp_path, "feed.txt", ""), self.inventory)
+
+
+def vars_of(product):
+    return (product.id, product.name, product.price, product.category,
+            product.stock, product.is_active, product.tags)
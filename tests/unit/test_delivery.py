@@ -0,0 +1,146 @@
+import queue
+import threading
+import pytest
+from src.services.delivery import DeliveryPipeline, LocalSMTPTransport, Transport
+from src.services.notification import NotificationService
+
+
+class FlakyTransport(LocalSMTPTransport):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    def send_batch(self, notifications):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("smtp down")
+        super().send_batch(notifications)
+
+
+class BlockingTransport(Transport):
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def send_batch(self, notifications):
+        self.entered.set()
+        self.release.wait()
+
+
+class TestDeliveryPipeline:
+    def test_send_returns_future_and_delivers(self):
+        transport = LocalSMTPTransport()
+        pipeline = DeliveryPipeline(transport)
+        service = NotificationService(pipeline=pipeline)
+        n = service.send_order_confirmation("a@b.com", 7, 12.5)
+        assert n.delivery.result(timeout=5) is n
+        pipeline.close()
+        message = transport.outbox[0]
+        assert message["To"] == "a@b.com"
+        assert message["Subject"] == "Order #7 Confirmed"
+        assert "$12.50" in message.get_content()
+
+    def test_batches_queued_messages(self):
+        transport = BlockingTransport()
+        pipeline = DeliveryPipeline(transport, batch_size=10)
+        service = NotificationService(pipeline=pipeline)
+        first = service.send_low_stock_alert("ops@co.com", "Widget", 1)
+        assert transport.entered.wait(timeout=5)
+        rest = [service.send_low_stock_alert("ops@co.com", "Widget", i) for i in range(25)]
+        smtp = LocalSMTPTransport()
+        pipeline.transport = smtp
+        transport.release.set()
+        pipeline.close()
+        assert first.delivery.done()
+        assert all(n.delivery.done() for n in rest)
+        assert len(smtp.outbox) == 25
+        assert smtp.batches == 3
+
+    def test_retries_with_backoff(self):
+        transport = FlakyTransport(failures=2)
+        pipeline = DeliveryPipeline(transport, max_retries=2, backoff=0.001)
+        future = pipeline.submit(
+            NotificationService().send_shipping_notification("a@b.com", 1, "T1")
+        )
+        assert future.result(timeout=5).subject == "Order #1 Shipped"
+        assert transport.attempts == 3
+        pipeline.close()
+
+    def test_gives_up_after_max_retries(self):
+        pipeline = DeliveryPipeline(FlakyTransport(failures=10), max_retries=1, backoff=0.001)
+        future = pipeline.submit(
+            NotificationService().send_shipping_notification("a@b.com", 1, "T1")
+        )
+        with pytest.raises(ConnectionError):
+            future.result(timeout=5)
+        pipeline.close()
+
+    def test_backpressure_when_queue_full(self):
+        transport = BlockingTransport()
+        pipeline = DeliveryPipeline(transport, max_queue=2, batch_size=1,
+                                    enqueue_timeout=0.01)
+        service = NotificationService(pipeline=pipeline)
+        service.send_low_stock_alert("ops@co.com", "Widget", 1)
+        assert transport.entered.wait(timeout=5)
+        # the worker holds the first message; two more fill the queue
+        service.send_low_stock_alert("ops@co.com", "Widget", 2)
+        service.send_low_stock_alert("ops@co.com", "Widget", 3)
+        with pytest.raises(queue.Full):
+            service.send_low_stock_alert("ops@co.com", "Widget", 4)
+        transport.release.set()
+        pipeline.close()
+
+    def test_cancelled_notifications_are_dropped(self):
+        transport = BlockingTransport()
+        pipeline = DeliveryPipeline(transport, batch_size=10)
+        service = NotificationService(pipeline=pipeline)
+        service.send_low_stock_alert("ops@co.com", "Widget", 1)
+        assert transport.entered.wait(timeout=5)
+        cancelled = service.send_low_stock_alert("ops@co.com", "Widget", 2)
+        kept = service.send_low_stock_alert("ops@co.com", "Widget", 3)
+        assert cancelled.delivery.cancel()
+        smtp = LocalSMTPTransport()
+        pipeline.transport = smtp
+        transport.release.set()
+        pipeline.flush()
+        assert kept.delivery.result(timeout=5) is kept
+        later = service.send_low_stock_alert("ops@co.com", "Widget", 4)
+        assert later.delivery.result(timeout=5) is later
+        pipeline.close()
+        assert [m.get_content() for m in smtp.outbox] == [
+            kept.body + "\n", later.body + "\n",
+        ]
+
+    def test_worker_survives_unexpected_errors(self):
+        pipeline = DeliveryPipeline(LocalSMTPTransport())
+        deliver = pipeline._deliver
+        calls = []
+
+        def broken_once(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            deliver(batch)
+
+        pipeline._deliver = broken_once
+        service = NotificationService()
+        failed = pipeline.submit(service.send_shipping_notification("a@b.com", 1, "T1"))
+        with pytest.raises(RuntimeError):
+            failed.result(timeout=5)
+        pipeline.flush()
+        future = pipeline.submit(service.send_shipping_notification("a@b.com", 2, "T2"))
+        assert future.result(timeout=5).subject == "Order #2 Shipped"
+        pipeline.close()
+
+    def test_submit_after_close_raises(self):
+        pipeline = DeliveryPipeline(LocalSMTPTransport())
+        pipeline.close()
+        pipeline.close()  # idempotent
+        with pytest.raises(RuntimeError, match="closed"):
+            pipeline.submit(NotificationService().send_shipping_notification("a@b.com", 1, "T1"))
+        pipeline.flush()
+
+    def test_transport_is_abstract(self):
+        with pytest.raises(TypeError):
+            Transport()
@@ -1,11 +1,17 @@
+import io
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from src.utils.formatters import (
     format_currency,
     format_date,
     format_datetime,
     format_order_summary,
     truncate_text,
+    format_currencies,
+    format_dates,
+    format_datetimes,
+    format_order_summaries,
+    write_order_summaries,
 )
 
 
@@ -61,3 +67,34 @@ class TestFormatOrderSummaryWithStatus:
         from src.models.order import OrderStatus
         result = format_order_summary(1, 1, 25.0, OrderStatus.DELIVERED.value)
         assert "DELIVERED" in result
+
+
+class TestBulkFormatters:
+    def setup_method(self):
+        start = datetime(2024, 2, 28, 23, 30)
+        self.datetimes = [start + timedelta(minutes=37 * i) for i in range(200)]
+        self.datetimes += [datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 12, 5)]
+
+    def test_currencies_match_scalar(self):
+        distinct = [i * 13.37 for i in range(300)]
+        repeated = [0.0, -0.0, 5, -12.5, 1234567.891, 0.005, 99.99] * 40
+        for amounts in (distinct, repeated):
+            assert format_currencies(amounts) == [format_currency(a) for a in amounts]
+
+    def test_dates_match_scalar(self):
+        assert format_dates(self.datetimes) == [format_date(d) for d in self.datetimes]
+
+    def test_datetimes_match_scalar(self):
+        assert format_datetimes(self.datetimes) == [
+            format_datetime(d) for d in self.datetimes
+        ]
+
+    def test_order_summaries_match_scalar(self):
+        rows = [(i, i % 4, i * 10.5, "shipped" if i % 2 else "pending") for i in range(50)]
+        assert format_order_summaries(rows) == [format_order_summary(*r) for r in rows]
+
+    def test_write_order_summaries_streams(self):
+        rows = [(i, 1, 9.99, "delivered") for i in range(25)]
+        out = io.StringIO()
+        assert write_order_summaries(out, iter(rows), chunk_size=10) == 25
+        assert out.getvalue() == "".join(format_order_summary(*r) + "\n" for r in rows)
@@ -1,3 +1,7 @@
+import random
+import sys
+import threading
+import time
 import pytest
 from src.services.inventory import InventoryService
 from src.models.product import Product, ProductCategory
@@ -76,3 +80,268 @@ class TestInventoryService:
         self.service.add_product(inactive)
         results = self.service.search_products("widget")
         assert len(results) == 1  # only active widget
+
+
+class TestInventorySearchIndex:
+    def setup_method(self):
+        self.indexed = InventoryService(search_index=True)
+        self.scanned = InventoryService()
+        names = ["Widget", "Widget Pro", "Gizmo", "Cable Set", "Cat Toy", "Camera"]
+        tags = [["gadget", "tech"], ["tech"], ["gadget"], ["cables"], ["pets"], ["photo"]]
+        for i, (name, product_tags) in enumerate(zip(names, tags), start=1):
+            for service in (self.indexed, self.scanned):
+                service.add_product(Product(
+                    id=i, name=name, price=10.0,
+                    category=ProductCategory.ELECTRONICS, stock=5,
+                    is_active=i != 2, tags=list(product_tags),
+                ))
+
+    def assert_same_results(self, query):
+        expected = [p.id for p in self.scanned.search_products(query)]
+        assert [p.id for p in self.indexed.search_products(query)] == expected
+
+    def test_matches_scan(self):
+        for query in ["widget", "WID", "ca", "cab", "gadget", "tech", "et", "xyz", "c", ""]:
+            self.assert_same_results(query)
+
+    def test_deactivation_updates_index(self):
+        self.indexed.get_product(1).is_active = False
+        self.scanned.get_product(1).is_active = False
+        self.assert_same_results("widget")
+
+    def test_reactivation_keeps_order(self):
+        for service in (self.indexed, self.scanned):
+            service.get_product(2).is_active = True
+        self.assert_same_results("widget")
+        assert [p.id for p in self.indexed.search_products("widget")] == [1, 2]
+
+    def test_rename_and_retag_updates_index(self):
+        for service in (self.indexed, self.scanned):
+            service.get_product(3).name = "Gadget Box"
+            service.get_product(5).tags = ["box"]
+        self.assert_same_results("gizmo")
+        self.assert_same_results("box")
+        self.assert_same_results("pets")
+
+    def test_iter_search_matches_list(self):
+        for service in (self.indexed, self.scanned):
+            for query in ["widget", "ca", "tech", "c", "xyz"]:
+                assert list(service.iter_search(query)) == service.search_products(query)
+
+    def test_iter_search_is_lazy(self):
+        matches = self.scanned.iter_search("ca")
+        assert next(matches).id == 4
+        self.scanned.get_product(6).is_active = False
+        assert [p.id for p in matches] == [5]
+
+    def test_replacing_product_reindexes(self):
+        replacement = Product(
+            id=1, name="Sprocket", price=5.0,
+            category=ProductCategory.ELECTRONICS, stock=1,
+        )
+        self.indexed.add_product(replacement)
+        assert [p.id for p in self.indexed.search_products("widget")] == []
+        assert self.indexed.search_products("sprocket") == [replacement]
+
+
+class TestRankedSearch:
+    def setup_method(self):
+        self.service = InventoryService()
+        rows = [
+            (1, "Lamp Shade", ["lamp"], 5),
+            (2, "Desk", ["lamp"], 50),
+            (3, "Floor Lamp", [], 5),
+            (4, "Lamp", [], 1),
+            (5, "Lamp Oil", [], 9),
+            (6, "Lava Lamp", [], 0),
+            (7, "Lamp", [], 0),
+        ]
+        for pid, name, tags, stock in rows:
+            self.service.add_product(Product(
+                id=pid, name=name, price=1.0,
+                category=ProductCategory.ELECTRONICS, stock=stock, tags=tags,
+            ))
+
+    def test_relevance_order(self):
+        ranked = [p.id for p in self.service.ranked_search("lamp", k=10)]
+        assert ranked == [4, 7, 5, 1, 3, 6, 2]
+
+    def test_top_k(self):
+        assert [p.id for p in self.service.ranked_search("LAMP", k=2)] == [4, 7]
+
+    def test_configurable_weights(self):
+        service = InventoryService(search_weights={"tag": 10.0})
+        for product in self.service._products.values():
+            service.add_product(product)
+        assert service.ranked_search("lamp", k=2)[0].id == 2
+
+    def test_unknown_weight_rejected(self):
+        with pytest.raises(ValueError):
+            InventoryService(search_weights={"popularity": 1.0})
+
+
+class TestSearchCache:
+    def setup_method(self):
+        self.services = [
+            InventoryService(search_cache_size=2),
+            InventoryService(search_index=True, search_cache_size=2),
+        ]
+        for service in self.services:
+            for i, name in enumerate(["Widget", "Widget Pro", "Gizmo"], start=1):
+                service.add_product(Product(
+                    id=i, name=name, price=10.0,
+                    category=ProductCategory.ELECTRONICS, stock=5, tags=["tech"],
+                ))
+
+    def test_repeated_query_hits(self):
+        for service in self.services:
+            first = service.search_products("Widget")
+            assert service.search_products("widget") == first
+            assert service.search_cache_hits == 1
+            assert service.search_cache_misses == 1
+
+    def test_stock_changes_keep_generation(self):
+        for service in self.services:
+            generation = service.catalog_generation
+            service.search_products("widget")
+            service.reserve_stock(1, 5)
+            service.restock(2, 3)
+            assert service.catalog_generation == generation
+            service.search_products("widget")
+            assert service.search_cache_hits == 1
+
+    def test_search_field_changes_invalidate(self):
+        for service in self.services:
+            service.search_products("widget")
+            service.get_product(1).is_active = False
+            assert [p.id for p in service.search_products("widget")] == [2]
+            service.get_product(3).name = "Widget Mini"
+            assert [p.id for p in service.search_products("widget")] == [2, 3]
+            service.get_product(2).tags = ["gear"]
+            assert [p.id for p in service.search_products("gear")] == [2]
+            service.add_product(Product(
+                id=4, name="Widget Max", price=1.0, category=ProductCategory.ELECTRONICS,
+            ))
+            assert [p.id for p in service.search_products("widget")] == [2, 3, 4]
+            assert service.search_cache_hits == 0
+
+    def test_size_bounded(self):
+        for service in self.services:
+            for query in ["widget", "gizmo", "tech", "widget"]:
+                service.search_products(query)
+            assert len(service._search_cache) == 2
+            assert service.search_cache_misses == 4
+
+    def test_results_are_copies(self):
+        for service in self.services:
+            service.search_products("widget").clear()
+            assert len(service.search_products("widget")) == 2
+
+
+class TestLowStockIndex:
+    def setup_method(self):
+        self.service = InventoryService()
+        for pid, stock in [(1, 50), (2, 3), (3, 8), (4, 0), (5, 3)]:
+            self.service.add_product(Product(
+                id=pid, name=f"Item {pid}", price=10.0,
+                category=ProductCategory.FOOD, stock=stock,
+            ))
+
+    def low_ids(self, threshold):
+        return [p.id for p in self.service.get_low_stock_products(threshold)]
+
+    def test_ordered_by_stock(self):
+        assert self.low_ids(10) == [4, 2, 5, 3]
+
+    def test_arbitrary_thresholds(self):
+        assert self.low_ids(0) == []
+        assert self.low_ids(1) == [4]
+        assert self.low_ids(4) == [4, 2, 5]
+        assert self.low_ids(100) == [4, 2, 5, 3, 1]
+
+    def test_follows_stock_mutations(self):
+        self.service.reserve_stock(1, 45)
+        self.service.restock(4, 20)
+        self.service.get_product(3).reduce_stock(8)
+        assert self.low_ids(10) == [3, 2, 5, 1]
+
+    def test_excludes_inactive(self):
+        self.service.get_product(2).is_active = False
+        assert self.low_ids(10) == [4, 5, 3]
+        self.service.get_product(2).is_active = True
+        assert sorted(self.low_ids(10)) == [2, 3, 4, 5]
+
+
+class TestConcurrentReservation:
+    def setup_method(self):
+        self.service = InventoryService(lock_stripes=4)
+        for pid in range(1, 7):
+            self.service.add_product(Product(
+                id=pid, name=f"Item {pid}", price=10.0,
+                category=ProductCategory.FOOD, stock=100,
+            ))
+
+    def test_reserve_cart_all_or_nothing(self):
+        assert self.service.reserve_cart([(1, 60), (2, 10), (1, 30)]) is True
+        assert self.service.get_product(1).stock == 10
+        assert self.service.reserve_cart([(2, 5), (1, 11)]) is False
+        assert self.service.get_product(2).stock == 90  # untouched
+        assert self.service.reserve_cart([(2, 1), (999, 1)]) is False
+
+    def test_no_overselling_under_contention(self):
+        # Yield to other threads inside every stock write to widen race windows.
+        for pid in range(1, 7):
+            self.service.get_product(pid).add_listener(lambda p, f: time.sleep(0))
+        reserved = {pid: 0 for pid in range(1, 7)}
+        counts_lock = threading.Lock()
+        errors = []
+
+        def worker(seed):
+            try:
+                reserve(random.Random(seed))
+            except Exception as exc:  # surfaced below, threads swallow it otherwise
+                errors.append(exc)
+
+        def reserve(rng):
+            for _ in range(300):
+                cart = [(rng.randint(1, 6), rng.randint(1, 3)) for _ in range(rng.randint(1, 3))]
+                if rng.random() < 0.5:
+                    ok = self.service.reserve_cart(cart)
+                else:
+                    cart = cart[:1]
+                    ok = self.service.reserve_stock(*cart[0])
+                if ok:
+                    with counts_lock:
+                        for pid, qty in cart:
+                            reserved[pid] += qty
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        for pid, qty in reserved.items():
+            stock = self.service.get_product(pid).stock
+            assert stock >= 0
+            assert stock + qty == 100
+
+    def test_unindexed_reservations_skip_the_index_lock(self):
+        self.service.product_version(1)  # products are observed from here on
+        done = threading.Event()
+
+        def reserve():
+            self.service.reserve_stock(1, 1)
+            self.service.restock(2, 1)
+            done.set()
+
+        with self.service._index_lock:
+            threading.Thread(target=reserve).start()
+            assert done.wait(5)
+        assert self.service.get_product(1).stock == 99
@@ -0,0 +1,54 @@
+import pytest
+from src.utils.metrics import LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    def test_small_values_exact(self):
+        h = LatencyHistogram()
+        for v in range(32):
+            h.record(v)
+        assert h.quantile(0.5) == 15
+        assert h.quantile(1.0) == 31
+
+    def test_relative_error_bounded(self):
+        h = LatencyHistogram(sub_bits=4)
+        for v in (1_000, 12_345, 999_999, 7_654_321_000):
+            single = LatencyHistogram(sub_bits=4)
+            single.record(v)
+            upper = single.bucket_upper(single.counts.index(1))
+            assert v <= upper <= v * (1 + 1 / 16)
+            h.record(v)
+        assert h.count == 4
+        assert 7_654_321_000 <= h.max <= 7_654_321_000 * (1 + 1 / 16)
+
+    def test_quantiles(self):
+        h = LatencyHistogram()
+        for v in range(1, 1001):
+            h.record(v * 1000)
+        assert h.quantile(0.5) == pytest.approx(500_000, rel=1 / 16)
+        assert h.quantile(0.99) == pytest.approx(990_000, rel=1 / 16)
+        assert h.summary()["count"] == 1000
+
+
+class TestMetricsRegistry:
+    def test_prometheus_export(self, tmp_path):
+        registry = MetricsRegistry()
+        h = registry.histogram("route_latency_seconds", "Latency.", handler="detail")
+        h.record(1500)
+        h.record(3000)
+        registry.increment("route_requests_total", handler="detail", status="200")
+        registry.increment("route_requests_total", handler="detail", status="200")
+        text = registry.to_prometheus()
+        assert "# TYPE route_latency_seconds histogram" in text
+        assert 'route_latency_seconds_bucket{handler="detail",le="+Inf"} 2' in text
+        assert 'route_latency_seconds_count{handler="detail"} 2' in text
+        assert 'route_requests_total{handler="detail",status="200"} 2' in text
+
+        path = tmp_path / "metrics.prom"
+        registry.write_prometheus(str(path))
+        assert path.read_text() == text
+
+    def test_label_escaping(self):
+        registry = MetricsRegistry()
+        registry.increment("errors_total", reason='bad "quote"')
+        assert 'errors_total{reason="bad \\"quote\\""} 1' in registry.to_prometheus()
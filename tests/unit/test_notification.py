@@ -1,5 +1,8 @@
+import json
+import sys
+import threading
 import pytest
-from src.services.notification import NotificationService, NotificationType
+from src.services.notification import NotificationService, NotificationStore, NotificationType
 
 
 class TestNotificationService:
@@ -34,3 +37,103 @@ class TestNotificationService:
     def test_notifications_stored(self):
         self.service.send_order_confirmation("a@b.com", 1, 10.0)
         assert len(self.service.sent_notifications) == 1
+
+    def test_sent_notifications_reads_like_a_list(self):
+        assert self.service.sent_notifications == []
+        first = self.service.send_order_confirmation("a@b.com", 1, 10.0)
+        second = self.service.send_low_stock_alert("ops@co.com", "Widget", 2)
+        sent = self.service.sent_notifications
+        assert sent[0] is first and sent[-1] is second
+        assert sent[:1] == [first]
+        assert sent == [first, second]
+        assert first in sent and sent.index(second) == 1
+        with pytest.raises(IndexError):
+            sent[2]
+
+
+class TestNotificationStore:
+    def make_service(self, **limits):
+        return NotificationService(store=NotificationStore(**limits))
+
+    def test_lookup_by_type(self):
+        service = self.make_service()
+        service.send_order_confirmation("a@b.com", 1, 10.0)
+        service.send_low_stock_alert("ops@co.com", "Widget", 2)
+        service.send_order_confirmation("x@y.com", 2, 20.0)
+        confirmed = service.get_notifications_by_type(NotificationType.ORDER_CONFIRMED)
+        assert [n.recipient_email for n in confirmed] == ["a@b.com", "x@y.com"]
+
+    def test_global_ring_buffer(self):
+        service = self.make_service(max_entries=3)
+        for order_id in range(5):
+            service.send_order_confirmation(f"u{order_id % 2}@b.com", order_id, 1.0)
+        assert len(service.sent_notifications) == 3
+        assert [n.subject for n in service.sent_notifications] == [
+            "Order #2 Confirmed", "Order #3 Confirmed", "Order #4 Confirmed",
+        ]
+        assert [n.subject for n in service.get_notifications_for("u0@b.com")] == [
+            "Order #2 Confirmed", "Order #4 Confirmed",
+        ]
+        assert len(service.get_notifications_by_type(NotificationType.ORDER_CONFIRMED)) == 3
+
+    def test_per_recipient_cap(self):
+        service = self.make_service(max_per_recipient=2)
+        for order_id in range(4):
+            service.send_order_confirmation("a@b.com", order_id, 1.0)
+        service.send_order_confirmation("x@y.com", 9, 1.0)
+        assert [n.subject for n in service.get_notifications_for("a@b.com")] == [
+            "Order #2 Confirmed", "Order #3 Confirmed",
+        ]
+        assert len(service.sent_notifications) == 3
+        assert len(service.get_notifications_by_type(NotificationType.ORDER_CONFIRMED)) == 3
+
+    def test_spills_evicted_to_disk(self, tmp_path):
+        path = tmp_path / "evicted.jsonl"
+        store = NotificationStore(max_entries=1, spill_path=str(path))
+        service = NotificationService(store=store)
+        service.send_order_confirmation("a@b.com", 1, 10.0)
+        service.send_shipping_notification("a@b.com", 1, "T1")
+        store.close()
+        spilled = [json.loads(line) for line in path.read_text().splitlines()]
+        assert spilled == [{
+            "recipient_email": "a@b.com", "subject": "Order #1 Confirmed",
+            "body": "Your order #1 has been confirmed. Total: $10.00",
+            "notification_type": "order_confirmed",
+        }]
+
+    def test_memory_stays_bounded(self):
+        store = NotificationStore(max_entries=50, max_per_recipient=3)
+        service = NotificationService(store=store)
+        for i in range(5000):
+            service.send_low_stock_alert(f"u{i % 40}@b.com", "Widget", i)
+        assert len(store) == 50
+        assert len(store._all) <= 2 * len(store) + 64
+        assert sum(len(q) for q in store._by_type.values()) <= 2 * len(store) + 64
+
+    def test_concurrent_senders_and_readers(self):
+        store = NotificationStore(max_entries=200, max_per_recipient=5)
+        service = NotificationService(store=store)
+        errors = []
+
+        def work(seed):
+            try:
+                for i in range(500):
+                    service.send_order_confirmation(f"u{(seed + i) % 30}@b.com", i, 1.0)
+                    service.get_notifications_for(f"u{i % 30}@b.com")
+                    service.get_notifications_by_type(NotificationType.ORDER_CONFIRMED)
+                    list(store)
+            except Exception as exc:  # surfaced below, threads swallow it otherwise
+                errors.append(exc)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=work, args=(seed,)) for seed in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert errors == []
+        assert len(store) == len(list(store)) == 150
@@ -0,0 +1,80 @@
+import random
+from datetime import datetime, timedelta, timezone
+from src.models.order import Order, OrderItem, OrderStatus
+from src.services.order_analytics import OrderAnalytics
+
+
+def make_orders(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2024, 3, 30, 22)
+    orders = []
+    for oid in range(1, count + 1):
+        items = [
+            OrderItem(product_id=rng.randint(1, 50), product_name="x",
+                      quantity=rng.randint(1, 5), unit_price=round(rng.uniform(0.5, 80), 2))
+            for _ in range(rng.randint(0, 4))
+        ]
+        created = start + timedelta(minutes=rng.randint(0, 6000))
+        if oid % 17 == 0:
+            created = None
+        elif oid % 13 == 0:
+            created = created.replace(tzinfo=timezone(timedelta(hours=-5)))
+        orders.append(Order(id=oid, user_id=rng.randint(1, 20), items=items,
+                            status=rng.choice(list(OrderStatus)), created_at=created))
+    return orders
+
+
+def grouped(orders, key, tax_rate=0.08):
+    groups = {}
+    for order in orders:
+        groups.setdefault(key(order), []).append(order.calculate_total(tax_rate))
+    return {k: round(sum(v), 2) for k, v in groups.items()}
+
+
+class TestOrderAnalytics:
+    def setup_method(self):
+        self.orders = make_orders(500)
+        self.analytics = OrderAnalytics(self.orders)
+
+    def test_totals_match_orders(self):
+        for rate in (0.08, 0.2):
+            assert list(self.analytics.totals(rate)) == [
+                o.calculate_total(rate) for o in self.orders
+            ]
+        assert self.analytics.taxes() == [o.calculate_tax() for o in self.orders]
+        assert self.analytics.shipping() == [o.calculate_shipping() for o in self.orders]
+
+    def test_revenue_by_day(self):
+        expected = grouped(self.orders, lambda o: o.created_at.date() if o.created_at else None)
+        assert self.analytics.revenue_by_day() == expected
+
+    def test_revenue_by_status_and_user(self):
+        assert self.analytics.revenue_by_status() == grouped(self.orders, lambda o: o.status)
+        assert self.analytics.revenue_by_user(0.1) == grouped(
+            self.orders, lambda o: o.user_id, 0.1
+        )
+
+    def test_average_and_cancellation_rate(self):
+        totals = [o.calculate_total() for o in self.orders]
+        assert self.analytics.average_order_value() == sum(totals) / len(totals)
+        cancelled = sum(o.status is OrderStatus.CANCELLED for o in self.orders)
+        assert self.analytics.cancellation_rate() == cancelled / len(self.orders)
+
+    def test_status_counts_and_summary(self):
+        counts = self.analytics.status_counts()
+        assert sum(counts.values()) == 500
+        summary = self.analytics.summary()
+        assert summary["revenue"] == round(sum(o.calculate_total() for o in self.orders), 2)
+        assert summary["shipping"] == round(sum(o.calculate_shipping() for o in self.orders), 2)
+
+    def test_incremental_add_refreshes_totals(self):
+        analytics = OrderAnalytics(self.orders[:10])
+        analytics.totals()
+        analytics.add(self.orders[10])
+        assert len(analytics.totals()) == 11
+
+    def test_empty(self):
+        analytics = OrderAnalytics()
+        assert analytics.average_order_value() == 0.0
+        assert analytics.cancellation_rate() == 0.0
+        assert analytics.revenue_by_day() == {}
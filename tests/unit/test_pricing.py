@@ -1,3 +1,4 @@
+import random
 import pytest
 from src.services.pricing import PricingService
 from src.models.product import Product, ProductCategory
@@ -56,3 +57,37 @@ class TestPricingService:
         assert result["shipping"] == 5.99
         assert result["tax"] == 0.8
         assert result["total"] == 16.79
+
+    def test_item_prices_match_scalar(self):
+        prices = [100.0, 19.99, 0.35, 1234.5]
+        quantities = [1, 5, 7, 3]
+        for tier in (None, 0, 1, 3):
+            user = None if tier is None else User(id=1, email="a@b.com", name="A",
+                                                  discount_tier=tier)
+            expected = [
+                self.service.calculate_item_price(
+                    Product(id=1, name="P", price=price,
+                            category=ProductCategory.BOOKS, stock=10),
+                    qty, user,
+                )
+                for price, qty in zip(prices, quantities)
+            ]
+            assert list(self.service.calculate_item_prices(prices, quantities, user)) == expected
+
+    def test_cart_totals_match_single_cart(self):
+        rng = random.Random(7)
+        products = [
+            Product(id=i, name=f"P{i}", price=round(rng.uniform(0.5, 300), 2),
+                    category=ProductCategory.BOOKS, stock=100)
+            for i in range(20)
+        ]
+        carts = []
+        for _ in range(200):
+            items = [(rng.choice(products), rng.randint(1, 8))
+                     for _ in range(rng.randint(0, 6))]
+            tier = rng.randint(-1, 4)
+            user = None if tier < 0 else User(id=1, email="a@b.com", name="A",
+                                              discount_tier=tier)
+            carts.append((items, user))
+        expected = [self.service.calculate_cart_total(items, user) for items, user in carts]
+        assert self.service.calculate_cart_totals(carts) == expected
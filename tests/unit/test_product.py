@@ -1,3 +1,5 @@
+import dataclasses
+import pickle
 import pytest
 from src.models.product import Product, ProductCategory
 
@@ -55,3 +57,50 @@ class TestProduct:
         p = self.make_product(stock=5)
         with pytest.raises(ValueError, match="Not enough stock"):
             p.reduce_stock(10)
+
+    def test_listener_notified_on_field_change(self):
+        p = self.make_product(stock=50)
+        changes = []
+        listener = lambda product, name: changes.append((product.id, name))
+        p.add_listener(listener)
+        p.reduce_stock(10)
+        p.is_active = False
+        p.remove_listener(listener)
+        p.price = 1.0
+        assert changes == [(1, "stock"), (1, "is_active")]
+
+    def test_pickle_drops_listeners(self):
+        p = self.make_product(stock=5)
+        changes = []
+        p.add_listener(lambda product, name: changes.append(name))
+        copy = pickle.loads(pickle.dumps(p))
+        assert copy == p and p == copy
+        copy.stock = 4
+        assert changes == []
+
+    def test_observed_product_compares_like_a_product(self):
+        p, q = self.make_product(stock=5), self.make_product(stock=5)
+        p.add_listener(lambda product, name: None)
+        assert p == q and q == p
+        assert isinstance(p, Product) and type(p) is not Product
+        assert type(p).__name__ == type(p).__qualname__ == "_ObservedProduct"
+        q.stock = 4
+        assert p != q
+        p.remove_listener(p._listeners[0])
+        assert type(p) is Product
+
+    def test_replace_observed_product_gives_plain_copy(self):
+        p = self.make_product(stock=5)
+        changes = []
+        p.add_listener(lambda product, name: changes.append(name))
+        copy = dataclasses.replace(p, price=3.0)
+        assert type(copy) is Product
+        assert copy.price == 3.0 and copy.stock == 5 and p.price == 29.99
+        copy.stock = 1
+        assert changes == []
+
+    def test_slotted_without_dict(self):
+        p = self.make_product()
+        assert not hasattr(p, "__dict__")
+        assert p == self.make_product()
+        assert repr(p).startswith("Product(id=1, name='Widget', price=29.99")
@@ -0,0 +1,213 @@
+import pytest
+from src.models.product import Product, ProductCategory
+from src.models.product_table import ProductTable
+from src.services.inventory import InventoryService
+from src.services.stock_log import StockLog
+
+
+def make_products():
+    return [
+        Product(id=1, name="Widget", price=29.99, category=ProductCategory.ELECTRONICS,
+                stock=50, tags=["gadget"]),
+        Product(id=2, name="Novel", price=12.49, category=ProductCategory.BOOKS, stock=0),
+        Product(id=3, name="Shirt", price=19.95, category=ProductCategory.CLOTHING,
+                stock=5, is_active=False),
+    ]
+
+
+class TestProductTable:
+    def setup_method(self):
+        self.products = make_products()
+        self.table = ProductTable()
+        for p in self.products:
+            self.table[p.id] = p
+
+    def test_columns(self):
+        assert list(self.table.ids) == [1, 2, 3]
+        assert list(self.table.stock) == [50, 0, 5]
+        assert list(self.table.active) == [1, 1, 0]
+        assert self.table.tags[0] == ("gadget",)
+
+    def test_mapping_returns_adopted_product(self):
+        assert self.table[1] is self.products[0]
+        assert self.table.get(999) is None
+        assert 2 in self.table and len(self.table) == 3
+
+    def test_view_writes_back(self):
+        self.products[0].reduce_stock(10)
+        self.products[1].is_active = False
+        assert self.table.stock[0] == 40
+        assert self.table.active[1] == 0
+
+    def test_in_stock_matches_products(self):
+        assert self.table.in_stock() == [p.is_in_stock() for p in self.products]
+
+    def test_apply_discount_matches_products(self):
+        for pct in (0.0, 0.15, 0.333, 1.0):
+            assert list(self.table.apply_discount(pct)) == [
+                p.apply_discount(pct) for p in self.products
+            ]
+
+    def test_append_row_rejects_duplicate(self):
+        with pytest.raises(ValueError, match="already exists"):
+            self.table.append_row(1, "Dup", 1.0, ProductCategory.FOOD)
+
+    def test_apply_discount_invalid(self):
+        with pytest.raises(ValueError):
+            self.table.apply_discount(1.5)
+
+    def test_append_row_out_of_range_leaves_table_unchanged(self):
+        with pytest.raises(ValueError, match="does not fit"):
+            self.table.append_row(2**64, "Huge", 1.0, ProductCategory.FOOD)
+        with pytest.raises(ValueError, match="does not fit"):
+            self.table[2] = Product(id=2, name="Novel", price=1.0,
+                                    category=ProductCategory.BOOKS, stock=2**63)
+        assert 2**64 not in self.table
+        assert list(self.table.ids) == [1, 2, 3]
+        assert list(self.table.prices) == [29.99, 12.49, 19.95]
+        assert self.table.append_row(4, "Lamp", 5.0, ProductCategory.FOOD) == 3
+
+    def test_append_row_rolls_back_a_failed_column(self):
+        class FullList(list):
+            def append(self, value):
+                raise MemoryError
+
+        self.table.tags = FullList(self.table.tags)
+        with pytest.raises(MemoryError):
+            self.table.append_row(4, "Lamp", 5.0, ProductCategory.FOOD)
+        assert 4 not in self.table
+        assert len(self.table.ids) == len(self.table.names) == 3
+
+
+class TestInventoryOnTable:
+    def setup_method(self):
+        self.table = ProductTable()
+        for p in make_products():
+            self.table.append_row(p.id, p.name, p.price, p.category, p.stock,
+                                  p.is_active, p.tags)
+        self.service = InventoryService(search_index=True, products=self.table)
+
+    def test_get_product_materializes_view(self):
+        p = self.service.get_product(1)
+        assert p.name == "Widget" and p.stock == 50
+        assert self.service.get_product(1) is p
+
+    def test_mutations_reach_columns_and_indexes(self):
+        assert self.service.reserve_stock(1, 45) is True
+        assert self.table.stock[0] == 5
+        assert [p.id for p in self.service.get_low_stock_products(10)] == [2, 1]
+        self.service.get_product(1).is_active = False
+        assert self.service.search_products("widget") == []
+
+    def test_add_product_appends_row(self):
+        self.service.add_product(Product(
+            id=4, name="Lamp", price=5.0, category=ProductCategory.ELECTRONICS, stock=2,
+        ))
+        assert list(self.table.ids) == [1, 2, 3, 4]
+        assert [p.id for p in self.service.search_products("lamp")] == [4]
+
+    def test_add_products_stores_none_of_a_failing_batch(self):
+        batch = [
+            Product(id=4, name="Lamp", price=5.0, category=ProductCategory.ELECTRONICS),
+            Product(id=2**64, name="Huge", price=1.0, category=ProductCategory.BOOKS),
+        ]
+        with pytest.raises(ValueError, match="does not fit"):
+            self.service.add_products(batch)
+        assert list(self.table.ids) == [1, 2, 3]
+        assert self.service.get_product(4) is None
+        assert self.service.search_products("lamp") == []
+
+    def test_views_materialized_before_the_service_notify_it(self, tmp_path):
+        table = ProductTable()
+        for p in make_products():
+            table.append_row(p.id, p.name, p.price, p.category, p.stock, p.is_active, p.tags)
+        early = table[1]
+        service = InventoryService(products=table)
+        service.open_stock_log(str(tmp_path / "stock.log"))
+        version = service.product_version(1)
+        assert service.reserve_stock(1, 49) is True
+        assert early.stock == 1
+        assert service.product_version(1) != version
+        assert [p.id for p in service.get_low_stock_products(2)] == [2, 1]
+        assert StockLog.replay(str(tmp_path / "stock.log")) == {1: 1}
+
+
+def test_intern_tags_shares_tuples():
+    from src.models.product_table import intern_tags
+    a = intern_tags(["gadget", "tech"])
+    b = intern_tags(("gadget", "tech"))
+    assert a == ("gadget", "tech")
+    assert a is b
+
+
+class TestSnapshot:
+    def setup_method(self):
+        self.service = InventoryService()
+        for p in make_products():
+            self.service.add_product(p)
+        self.service.add_product(Product(
+            id=-7, name="Café ☕", price=3.5, category=ProductCategory.FOOD,
+            stock=9, tags=["", "hot drink"],
+        ))
+
+    def load(self, tmp_path, **kwargs):
+        path = str(tmp_path / "catalog.snap")
+        self.service.save_snapshot(path)
+        return InventoryService.load_snapshot(path, **kwargs)
+
+    def test_round_trip(self, tmp_path):
+        loaded = self.load(tmp_path)
+        for pid in (1, 2, 3, -7):
+            assert loaded.get_product(pid) == self.service.get_product(pid)
+        assert loaded.get_product(999) is None
+        assert list(loaded.table) == [1, 2, 3, -7]
+
+    def test_loaded_columns_are_mapped(self, tmp_path):
+        loaded = self.load(tmp_path)
+        assert isinstance(loaded.table.stock, memoryview)
+        assert loaded.table._views == {}
+
+    def test_queries_and_mutations_after_load(self, tmp_path):
+        loaded = self.load(tmp_path, search_index=True)
+        assert [p.id for p in loaded.search_products("hot")] == [-7]
+        assert loaded.reserve_stock(-7, 4) is True
+        assert loaded.table.stock[3] == 5
+        assert [p.id for p in loaded.get_low_stock_products(6)] == [2, -7]
+        loaded.get_product(-7).name = "Tea"
+        assert loaded.get_product(-7).name == "Tea"
+        assert loaded.search_products("café") == []
+
+    def test_scan_materializes_only_matches(self, tmp_path):
+        loaded = self.load(tmp_path)
+        assert loaded.search_products("nothing") == []
+        assert loaded.table._views == {}
+        assert [p.id for p in loaded.search_products("drink")] == [-7]
+        assert list(loaded.table._views) == [-7]
+        loaded.get_product(1).tags = ["drinkware"]
+        assert [p.id for p in loaded.search_products("drink")] == [1, -7]
+        assert loaded.search_products("shirt") == []  # inactive
+
+    def test_add_product_after_load(self, tmp_path):
+        loaded = self.load(tmp_path)
+        loaded.get_product(1).reduce_stock(5)
+        loaded.add_product(Product(id=4, name="Lamp", price=5.0,
+                                   category=ProductCategory.ELECTRONICS, stock=2))
+        assert list(loaded.table) == [1, 2, 3, -7, 4]
+        assert loaded.get_product(1).stock == 45
+        assert loaded.table.stock[0] == 45
+        assert loaded.get_product(4).name == "Lamp"
+        assert loaded.get_product(-7).tags == ["", "hot drink"]
+
+    def test_snapshot_of_loaded_table(self, tmp_path):
+        loaded = self.load(tmp_path)
+        loaded.restock(2, 3)
+        path = str(tmp_path / "again.snap")
+        loaded.save_snapshot(path)
+        again = InventoryService.load_snapshot(path)
+        assert again.get_product(2).stock == 3
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bogus.snap"
+        path.write_bytes(b"\0" * 256)
+        with pytest.raises(ValueError, match="not a product table snapshot"):
+            ProductTable.load(str(path))
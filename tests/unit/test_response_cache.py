@@ -0,0 +1,62 @@
+import pytest
+from src.api.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    def test_hit_for_same_version(self):
+        cache = ResponseCache()
+        assert cache.get(1, 5) is None
+        response = {"status": 200}
+        cache.put(1, 5, response)
+        assert cache.get(1, 5) is response
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_other_version_misses(self):
+        cache = ResponseCache()
+        cache.put(1, 5, {"status": 200})
+        assert cache.get(1, 6) is None
+        cache.put(1, 6, {"status": 404})
+        assert cache.get(1, 6) == {"status": 404}
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(1, 1, {})
+        cache.put(2, 1, {})
+        cache.get(1, 1)  # 1 is now the most recently used
+        cache.put(3, 1, {})
+        assert cache.stats()["evictions"] == 1
+        assert cache.get(1, 1) is not None
+        assert cache.get(2, 1) is None
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, clock=clock)
+        cache.put(1, 1, {})
+        clock.now = 9.9
+        assert cache.get(1, 1) is not None
+        clock.now = 10.0
+        assert cache.get(1, 1) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_and_clear(self):
+        cache = ResponseCache()
+        cache.put(1, 1, {})
+        cache.put(2, 1, {})
+        cache.invalidate(1)
+        assert cache.get(1, 1) is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_empty_bound(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
@@ -0,0 +1,88 @@
+import pytest
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+from src.services.sharded_inventory import ShardedInventory
+
+NAMES = ["Widget", "Widget Pro", "Gizmo", "Cable Set", "Cat Toy", "Camera", "Cable Ties"]
+
+
+def make_products():
+    return [
+        Product(id=i * 7, name=name, price=10.0 + i, category=ProductCategory.ELECTRONICS,
+                stock=(i * 3) % 11, is_active=i != 4, tags=["tech"] if i % 2 else ["cables"])
+        for i, name in enumerate(NAMES, start=1)
+    ]
+
+
+class TestShardedInventory:
+    def setup_method(self):
+        self.sharded = ShardedInventory(shards=3, search_index=True)
+        self.single = InventoryService()
+        self.sharded.add_products(make_products())
+        for product in make_products():
+            self.single.add_product(product)
+
+    def teardown_method(self):
+        self.sharded.close()
+
+    def test_spreads_products(self):
+        assert len({self.sharded.shard_of(p.id) for p in make_products()}) == 3
+
+    def test_point_operations(self):
+        assert self.sharded.get_product(14) == self.single.get_product(14)
+        assert self.sharded.get_product(999) is None
+        assert self.sharded.check_availability(14, 6) is True
+        assert self.sharded.reserve_stock(14, 6) is True
+        assert self.sharded.reserve_stock(14, 1) is False
+        assert self.sharded.restock(14, 4) == 4
+        assert self.sharded.get_product(14).stock == 4
+
+    def test_errors_propagate(self):
+        with pytest.raises(ValueError):
+            self.sharded.restock(999, 1)
+
+    def test_search_matches_single_service(self):
+        for query in ["widget", "ca", "cable", "tech", "c", "xyz"]:
+            assert [p.id for p in self.sharded.search_products(query)] == [
+                p.id for p in self.single.search_products(query)
+            ]
+
+    def test_low_stock_merged_lowest_first(self):
+        stocks = [p.stock for p in self.sharded.get_low_stock_products(8)]
+        assert stocks == sorted(stocks)
+        assert sorted(p.id for p in self.sharded.get_low_stock_products(8)) == sorted(
+            p.id for p in self.single.get_low_stock_products(8)
+        )
+
+    def test_bulk_lookup_keeps_request_order(self):
+        found = self.sharded.get_products([21, 999, 7, 21])
+        assert list(found) == [21, 999, 7]
+        assert found[999] is None and found[7].name == "Widget"
+
+    def test_failed_scatter_keeps_other_shards_in_step(self):
+        class Unpicklable:  # local classes cannot be pickled
+            def __hash__(self):
+                return 2
+
+        with pytest.raises(Exception):
+            self.sharded.get_products([21, 7, Unpicklable()])
+        assert self.sharded.get_product(21).name == "Gizmo"
+        assert self.sharded.get_product(7).name == "Widget"
+        assert self.sharded.get_product(14).name == "Widget Pro"
+
+    def test_dead_shard_is_marked_broken(self):
+        self.sharded._processes[0].terminate()
+        self.sharded._processes[0].join()
+        with pytest.raises((EOFError, OSError)):
+            self.sharded.search_products("widget")
+        assert self.sharded.get_product(7).name == "Widget"
+        assert self.sharded.get_product(14).name == "Widget Pro"
+        with pytest.raises(ConnectionError):
+            self.sharded.get_product(21)
+
+    def test_add_product_replaces(self):
+        self.sharded.add_product(Product(
+            id=7, name="Sprocket", price=1.0, category=ProductCategory.ELECTRONICS,
+        ))
+        assert [p.id for p in self.sharded.search_products("widget")] == [14]
+        assert self.sharded.get_product(7).name == "Sprocket"
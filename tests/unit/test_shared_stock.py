@@ -0,0 +1,142 @@
+import multiprocessing
+
+import pytest
+from src.api.routes import calculate_cart
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+from src.services.shared_stock import SharedStock
+
+
+def _reserve_until_empty(inventory, product_id, results):
+    reserved = 0
+    while inventory.reserve_stock(product_id, 1):
+        reserved += 1
+    results.put(reserved)
+
+
+def _reserve_and_restock(stock, product_ids, rounds):
+    for i in range(rounds):
+        pid = product_ids[i % len(product_ids)]
+        if stock.reserve(pid, 2) is not None:
+            stock.add(pid, 2)
+
+
+def _attach_and_reserve(stock, results):
+    inventory = InventoryService()
+    inventory.add_product(Product(id=1, name="Widget", price=5.0,
+                                  category=ProductCategory.ELECTRONICS, stock=0))
+    inventory.attach_shared_stock(stock)
+    results.put(inventory.reserve_stock(1, 3))
+    stock.close()
+
+
+class TestSharedStock:
+    def setup_method(self):
+        self.stock = SharedStock.create({3: 10, 1: 0, 2: 5}, stripes=4)
+
+    def teardown_method(self):
+        self.stock.close()
+        self.stock.unlink()
+
+    def test_levels(self):
+        assert len(self.stock) == 3
+        assert 2 in self.stock and 9 not in self.stock
+        assert self.stock.levels() == {1: 0, 2: 5, 3: 10}
+
+    def test_reserve_add_set(self):
+        assert self.stock.reserve(3, 4) == 6
+        assert self.stock.reserve(3, 7) is None
+        assert self.stock.reserve(1, 0) is None
+        assert self.stock.add(3, 2) == 8
+        self.stock.set(2, 1)
+        assert self.stock.get(2) == 1
+
+    def test_reserve_many_is_all_or_nothing(self):
+        assert self.stock.reserve_many({2: 5, 3: 11}) is None
+        assert self.stock.levels() == {1: 0, 2: 5, 3: 10}
+        assert self.stock.reserve_many({2: 5, 3: 1}) == {2: 0, 3: 9}
+
+    def test_unknown_product(self):
+        with pytest.raises(ValueError):
+            self.stock.reserve(9, 1)
+
+    def test_attach_by_name(self):
+        other = SharedStock(self.stock.name, self.stock._locks)
+        other.reserve(3, 1)
+        assert self.stock.get(3) == 9
+        other.close()
+
+    def test_contention_keeps_counts_exact(self):
+        workers = [
+            multiprocessing.Process(target=_reserve_and_restock, args=(self.stock, [2, 3], 2000))
+            for _ in range(4)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        assert all(w.exitcode == 0 for w in workers)
+        assert self.stock.levels() == {1: 0, 2: 5, 3: 10}
+
+
+class TestInventorySharedStock:
+    def setup_method(self):
+        self.inventory = InventoryService()
+        self.inventory.add_product(Product(id=1, name="Widget", price=5.0,
+                                           category=ProductCategory.ELECTRONICS, stock=40))
+        self.inventory.add_product(Product(id=2, name="Gizmo", price=8.0,
+                                           category=ProductCategory.ELECTRONICS, stock=3))
+        self.stock = self.inventory.share_stock(stripes=4)
+
+    def teardown_method(self):
+        self.stock.close()
+        self.stock.unlink()
+
+    def test_workers_never_oversell(self):
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_reserve_until_empty, args=(self.inventory, 1, results))
+            for _ in range(4)
+        ]
+        for w in workers:
+            w.start()
+        reserved = sum(results.get(timeout=30) for _ in workers)
+        for w in workers:
+            w.join()
+        assert reserved == 40
+        assert self.stock.get(1) == 0
+        assert self.inventory.check_availability(1, 1) is False
+
+    def test_spawned_worker_sees_parent_changes(self):
+        context = multiprocessing.get_context("spawn")
+        self.stock.close()
+        self.stock.unlink()
+        self.stock = self.inventory.share_stock(stripes=4, mp_context=context)
+        results = context.Queue()
+        self.inventory.restock(1, -37)
+        worker = context.Process(target=_attach_and_reserve, args=(self.stock, results))
+        worker.start()
+        assert results.get(timeout=30) is True
+        worker.join()
+        assert self.stock.get(1) == 0
+        assert self.inventory.reserve_stock(1, 1) is False
+
+    def test_local_copy_follows_own_changes(self):
+        assert self.inventory.reserve_stock(2, 2) is True
+        assert self.inventory.get_product(2).stock == 1
+        assert self.inventory.restock(2, 4) == 5
+
+    def test_reserve_cart_and_calculate_cart(self):
+        self.stock.set(2, 1)
+        assert calculate_cart([{"product_id": 2, "quantity": 2}], self.inventory)["status"] == 400
+        assert self.inventory.reserve_cart([(1, 5), (2, 2)]) is False
+        assert self.stock.levels() == {1: 40, 2: 1}
+        assert self.inventory.reserve_cart([(1, 5), (2, 1)]) is True
+        assert self.stock.levels() == {1: 35, 2: 0}
+
+    def test_products_added_later_use_local_stock(self):
+        self.inventory.add_product(Product(id=3, name="Cable", price=2.0,
+                                           category=ProductCategory.ELECTRONICS, stock=2))
+        assert self.inventory.reserve_stock(3, 2) is True
+        assert self.inventory.reserve_cart([(1, 1), (3, 1)]) is False
+        assert self.inventory.get_product(3).stock == 0
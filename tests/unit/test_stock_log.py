@@ -0,0 +1,104 @@
+import errno
+import os
+import threading
+import pytest
+from src.models.product import Product, ProductCategory
+from src.services.inventory import InventoryService
+from src.services.stock_log import RECORD, StockLog
+
+
+def make_catalog():
+    service = InventoryService()
+    for pid in range(1, 5):
+        service.add_product(Product(
+            id=pid, name=f"Item {pid}", price=10.0,
+            category=ProductCategory.FOOD, stock=100,
+        ))
+    return service
+
+
+class TestStockLog:
+    def test_replay_recovers_stock(self, tmp_path):
+        log_path = str(tmp_path / "stock.log")
+        service = make_catalog()
+        service.open_stock_log(log_path)
+        service.reserve_stock(1, 30)
+        service.restock(2, 5)
+        service.reserve_cart([(3, 10), (1, 20)])
+        service.get_product(4).reduce_stock(1)
+        expected = {pid: service.get_product(pid).stock for pid in range(1, 5)}
+
+        recovered = make_catalog()  # rebuilt from the original catalog after a crash
+        recovered.open_stock_log(log_path)
+        assert {pid: recovered.get_product(pid).stock for pid in range(1, 5)} == expected
+        assert [p.id for p in recovered.get_low_stock_products(60)] == [1]
+
+    def test_torn_record_ignored(self, tmp_path):
+        path = tmp_path / "stock.log"
+        path.write_bytes(RECORD.pack(1, 7) + RECORD.pack(1, 3)[:5])
+        assert StockLog.replay(str(path)) == {1: 7}
+
+    def test_group_commit_shares_fsync(self, tmp_path):
+        log = StockLog(str(tmp_path / "stock.log"), commit_window=0.02)
+        barrier = threading.Barrier(8)
+
+        def writer(pid):
+            barrier.wait()
+            for stock in range(5):
+                log.record(pid, stock)
+
+        threads = [threading.Thread(target=writer, args=(pid,)) for pid in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        log.close()
+        assert log.records == 40
+        assert log.commits < 40
+        assert StockLog.replay(log.path) == {pid: 4 for pid in range(8)}
+
+    def test_failed_write_is_never_reported_durable(self, tmp_path):
+        log = StockLog(str(tmp_path / "stock.log"), commit_window=0)
+        first = log.append(1, 9)
+        log.wait(first)
+        real_file = log._file
+
+        class FailingFile:
+            def write(self, data):
+                raise OSError(errno.EIO, "I/O error")
+
+        log._file = FailingFile()
+        a = log.append(1, 5)
+        with pytest.raises(OSError):
+            log.wait(a)
+        b = log.append(2, 3)
+        with pytest.raises(OSError, match="failed"):
+            log.wait(b)
+        with pytest.raises(OSError, match="failed"):
+            log.wait(a)
+        log.wait(first)  # committed before the failure
+        assert bytes(log._pending) == RECORD.pack(1, 5) + RECORD.pack(2, 3)
+        real_file.close()
+        assert StockLog.replay(log.path) == {1: 9}
+
+    def test_compaction_folds_log_into_snapshot(self, tmp_path):
+        log_path = str(tmp_path / "stock.log")
+        snapshot = str(tmp_path / "catalog.snap")
+        service = make_catalog()
+        service.open_stock_log(log_path, snapshot_path=snapshot, compact_after=3)
+        service.reserve_stock(1, 1)
+        service.reserve_stock(1, 1)
+        assert os.path.getsize(log_path) == 2 * RECORD.size
+        service.reserve_stock(2, 1)  # third record triggers compaction
+        assert os.path.getsize(log_path) == 0
+        service.restock(3, 50)
+
+        recovered = InventoryService.load_snapshot(snapshot)
+        recovered.open_stock_log(log_path)
+        assert [recovered.get_product(pid).stock for pid in range(1, 5)] == [98, 99, 150, 100]
+
+    def test_compaction_requires_snapshot_path(self, tmp_path):
+        service = make_catalog()
+        service.open_stock_log(str(tmp_path / "stock.log"))
+        with pytest.raises(ValueError, match="snapshot path"):
+            service.compact_stock_log()
@@ -4,8 +4,15 @@ from src.utils.validators import (
     validate_password,
     validate_shipping_address,
     sanitize_input,
+    validate_emails,
+    validate_passwords,
+    validate_shipping_addresses,
 )
 
+EMAILS = ["user@example.com", "", "not-an-email", "a.b+c@d-e.org", "x@y.c", "u@ex.com\n"]
+PASSWORDS = ["MyPass123", "short", "alllowercase1", "ALLUPPER1", "NoDigitsHere", "Ok1" * 3]
+ADDRESSES = ["", "tiny", "123 Main Street, Springfield", "x" * 501]
+
 
 class TestValidateEmail:
     def test_valid_email(self):
@@ -71,3 +78,25 @@ class TestSanitizeInput:
 
     def test_escapes_html(self):
         assert sanitize_input("<script>alert('xss')</script>") == "&lt;script&gt;alert('xss')&lt;/script&gt;"
+
+
+class TestBatchValidators:
+    @pytest.mark.parametrize("batch, single, values", [
+        (validate_emails, validate_email, EMAILS),
+        (validate_passwords, validate_password, PASSWORDS),
+        (validate_shipping_addresses, validate_shipping_address, ADDRESSES),
+    ])
+    def test_matches_single_value(self, batch, single, values):
+        assert list(batch(values)) == [single(v) for v in values]
+
+    def test_streams_lazily(self):
+        def values():
+            yield "user@example.com"
+            raise AssertionError("consumed past the first result")
+
+        assert next(validate_emails(values())) == (True, "")
+
+    def test_process_pool_keeps_order(self):
+        values = EMAILS * 50
+        pooled = list(validate_emails(values, workers=2, chunk_size=7))
+        assert pooled == [validate_email(v) for v in values]